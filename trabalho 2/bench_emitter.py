@@ -0,0 +1,38 @@
+"""Measure time and memory of the pseudo-code generator."""
+
+import os
+import sys
+import time
+import tracemalloc
+
+from logo_gen import generate_nested, generate_program
+from logo_lexer import lexer
+from logo_parser import compile_program, parser
+
+
+def measure(source, the_parser):
+    """Compile source to /dev/null, returning time and peak memory."""
+    with open(os.devnull, "w") as output:
+        start = time.perf_counter()
+        compile_program(source, the_parser, lexer(), output)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        compile_program(source, the_parser, lexer(), output)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    the_parser = parser()
+    for title, generate in (
+        ("nesting depth", generate_nested),
+        ("statements", generate_program),
+    ):
+        for size in (scale, 2 * scale, 4 * scale, 8 * scale):
+            elapsed, peak = measure(generate(size), the_parser)
+            print(
+                f"{title} {size:>7}: {elapsed * 1000:9.1f} ms, "
+                f"peak {peak / 1e6:8.2f} MB"
+            )
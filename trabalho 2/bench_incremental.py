@@ -0,0 +1,56 @@
+"""Benchmark single character edits in a large Logo program."""
+
+import random
+import sys
+import time
+
+from logo_gen import generate_program
+from logo_incremental import Document
+from logo_lexer import lexer
+from logo_tree import parser
+
+
+def edits(text, count, seed=0):
+    """Yield random edits replacing a digit with another digit."""
+    rand = random.Random(seed)
+    digits = [index for index, char in enumerate(text) if char in "123456789"]
+    for _ in range(count):
+        index = rand.choice(digits)
+        yield index, index + 1, str(rand.randint(1, 9))
+
+
+if __name__ == "__main__":
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    text = generate_program(lines)
+
+    start = time.perf_counter()
+    full = parser().parse(text, lexer=lexer())
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    document = Document(text)
+    initial_time = time.perf_counter() - start
+    assert document.program == full
+
+    changes = list(edits(text, count))
+    start = time.perf_counter()
+    for edit in changes[:count // 2]:
+        document.edit(*edit)
+    edit_time = (time.perf_counter() - start) / (count // 2)
+    start = time.perf_counter()
+    for edit in changes[count // 2:]:
+        document.edit(*edit)
+        document.program
+    tree_time = (time.perf_counter() - start) / (count - count // 2)
+
+    expected = parser().parse(document.text, lexer=lexer())
+    assert document.program == expected
+
+    print(f"lines:            {lines}")
+    print(f"full parse:       {full_time * 1000:10.2f} ms")
+    print(f"initial document: {initial_time * 1000:10.2f} ms")
+    print(f"per edit:         {edit_time * 1000:10.2f} ms")
+    print(f"per edit + tree:  {tree_time * 1000:10.2f} ms")
+    print(f"regions reparsed: {document.reparsed - len(document.regions)}")
+    print(f"speedup:          {full_time / tree_time:10.0f}x")
@@ -0,0 +1,84 @@
+"""Measure spatial index queries against scans of every segment."""
+
+import sys
+import time
+
+import numpy as np
+
+from logo_index import SegmentIndex
+from logo_lexer import lexer
+from logo_render import draw
+from logo_tree import parser
+from bench_simplify import generate_runs
+
+
+def random_walk(count, seed=0):
+    """Return the segments of a random walk, one row per segment."""
+    rng = np.random.default_rng(seed)
+    points = np.cumsum(rng.normal(scale=5.0, size=(count + 1, 2)), axis=0)
+    return np.hstack((points[:-1], points[1:]))
+
+
+def executed(statements):
+    """Return the segments drawn by a generated program."""
+    program = parser().parse(generate_runs(statements), lexer=lexer())
+    segments, _ = draw(program, max_segments=None)
+    return segments
+
+
+def __timed(function, arguments):
+    """Return the mean time of calls to function, in microseconds."""
+    start = time.perf_counter()
+    for argument in arguments:
+        function(*argument)
+    return (time.perf_counter() - start) / len(arguments) * 1e6
+
+
+def measure(title, segments, queries=200, seed=1):
+    """Print build and query times of an index and of a full scan."""
+    start = time.perf_counter()
+    index = SegmentIndex(segments)
+    built = time.perf_counter() - start
+    coords = index.segments
+    low = coords[:, 0::2].min(), coords[:, 1::2].min()
+    high = coords[:, 0::2].max(), coords[:, 1::2].max()
+    # A scan is an index with a single cell.
+    extent = max(high[0] - low[0], high[1] - low[1])
+    scan = SegmentIndex(coords, cell_size=2 * extent or 1.0)
+    rng = np.random.default_rng(seed)
+    width = (high[0] - low[0]) / 100
+    points = rng.uniform(low, high, size=(queries, 2))
+    rectangles = [(x, y, x + width, y + width) for x, y in points]
+    # Hit tests only look for segments near the point.
+    hits = [(x, y, width) for x, y in points]
+    for rectangle in rectangles[:10]:
+        assert np.array_equal(index.query(*rectangle), scan.query(*rectangle))
+    print(
+        f"{title}: {len(index):,} segments, {index.columns}x{index.rows} "
+        f"cells, built in {built * 1000:.1f} ms"
+    )
+    # Scans are slow, so they are timed on fewer queries.
+    for name, tree, count in (
+        ("grid", index, queries),
+        ("scan", scan, max(1, queries // 20)),
+    ):
+        rectangles = rectangles[:count]
+        points = points[:count]
+        hits = hits[:count]
+        print(
+            f"  {name}  query {__timed(tree.query, rectangles):9.1f} us"
+            f"  viewport {__timed(tree.viewport, rectangles):9.1f} us"
+            f"  nearest {__timed(tree.nearest, points):9.1f} us"
+            f"  hit {__timed(tree.nearest, hits):9.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [
+        10_000,
+        100_000,
+        1_000_000,
+    ]
+    for size in sizes:
+        measure("random walk", random_walk(size))
+    measure("executed", executed(sizes[0]))
@@ -0,0 +1,20 @@
+"""Measure call sites removed by inlining on generated programs."""
+
+import sys
+import time
+
+from logo_gen import generate_procedures
+from logo_inline import inline
+from logo_lexer import lexer
+from logo_tree import parser
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    for budget in (0, 10, 20, 40):
+        program = parser().parse(generate_procedures(count), lexer=lexer())
+        start = time.perf_counter()
+        _, report = inline(program, budget=budget, max_specializations=1000)
+        elapsed = time.perf_counter() - start
+        print(f"budget {budget} ({elapsed * 1000:.0f} ms):")
+        print(report)
+        print()
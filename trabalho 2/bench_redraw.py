@@ -0,0 +1,46 @@
+"""Benchmark rendering a large Logo program again after small edits."""
+
+import sys
+import time
+
+from bench_incremental import edits
+from logo_gen import generate_program
+from logo_incremental import Document
+from logo_redraw import Drawing
+from logo_render import draw, to_png
+
+if __name__ == "__main__":
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    document = Document(generate_program(lines))
+    changes = list(edits(document.text, count))
+
+    start = time.perf_counter()
+    drawing = Drawing(max_segments=None)
+    drawing.update(document.program)
+    initial_time = time.perf_counter() - start
+
+    full_time = update_time = 0.0
+    executed = reused = tiles = 0
+    for edit in changes:
+        document.edit(*edit)
+        program = document.program
+        start = time.perf_counter()
+        segments, _ = draw(program, max_segments=None, tolerance=None)
+        image = to_png(segments, view=drawing.view)
+        full_time += time.perf_counter() - start
+        start = time.perf_counter()
+        tiles += len(drawing.update(program))
+        update_time += time.perf_counter() - start
+        executed += drawing.executed
+        reused += drawing.reused
+        assert drawing.to_png() == image
+
+    print(f"lines:              {lines}")
+    print(f"initial drawing:    {initial_time * 1000:10.2f} ms")
+    print(f"full render:        {full_time / count * 1000:10.2f} ms")
+    print(f"incremental render: {update_time / count * 1000:10.2f} ms")
+    print(f"statements run:     {executed / count:10.1f} per edit")
+    print(f"statements reused:  {reused / count:10.1f} per edit")
+    print(f"tiles redrawn:      {tiles / count:10.1f} per edit")
+    print(f"speedup:            {full_time / update_time:10.1f}x")
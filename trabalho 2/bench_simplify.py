@@ -0,0 +1,57 @@
+"""Measure the effect of simplifying executed segments before rendering."""
+
+import random
+import sys
+import time
+
+from logo_exec import Segment, execute
+from logo_gen import generate_program
+from logo_lexer import lexer
+from logo_render import drawing, to_png, to_svg
+from logo_simplify import simplify
+from logo_tree import parser
+
+
+def generate_runs(statements, seed=0):
+    """Create a program drawing runs of short steps, with pen-up jumps."""
+    rand = random.Random(seed)
+    lines = []
+    while len(lines) < statements:
+        lines.extend(["FORWARD 5"] * rand.randint(1, 20))
+        lines.append(rand.choice(["RIGHT 90", "LEFT 90", "RIGHT 45"]))
+        if rand.random() < 0.2:
+            lines.append("PENUP")
+            lines.extend(["FORWARD 10", "BK 0"] * rand.randint(1, 5))
+            lines.append("PENDOWN")
+    return "\n".join(lines[:statements]) + "\n"
+
+
+def measure(title, source, tolerance):
+    """Print the size and rendering time of a drawing, with and without."""
+    program = parser().parse(source, lexer=lexer())
+    events = list(execute(program))
+    start = time.perf_counter()
+    simplified = list(simplify(events, tolerance))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{title}: {len(events):,} events -> {len(simplified):,} "
+        f"in {elapsed * 1000:.1f} ms"
+    )
+    for name, stream in (("original", events), ("simplified", simplified)):
+        segments, _ = drawing(stream)
+        start = time.perf_counter()
+        svg = to_svg(segments)
+        png = to_png(segments)
+        elapsed = time.perf_counter() - start
+        count = sum(1 for event in stream if type(event) is Segment)
+        print(
+            f"  {name:<10} {count:>9,} segments, svg {len(svg):>11,} bytes, "
+            f"png {len(png):>9,} bytes, render {elapsed * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    tolerance = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    measure("random", generate_program(size), tolerance)
+    measure("runs", generate_runs(size), tolerance)
@@ -0,0 +1,368 @@
+"""Benchmark the Logo lexer, parsers, tree builder and serializers.
+
+Usage: python bench_suite.py [--sizes N,...] [--save FILE] [--compare FILE]
+
+Each workload is a seeded generated program, so runs are comparable:
+
+    long        random statements, one after the other
+    procedures  calls to small procedures, some of them in loops
+    nested      IF statements nested as deep as the size
+
+Phases are timed separately, on the best of --repeat runs:
+
+    lex         tokenize the source
+    parse       LALR parse of the tokens, with actions building no nodes
+    tree        build the compact tree, replaying the nodes of a parse
+    pseudo      logo_parser, generating the pseudo-code, without procedures
+    tree_io     binary serialization of the tree
+    yaml        dict tree and YAML serialization, statement by statement
+
+The YAML emitter is recursive, so it runs in a thread with a deep stack.
+Its output is indented by depth, and its time grows with the square of
+the depth of the program, so it is skipped for programs nested deeper
+than YAML_MAX_DEPTH.
+
+Peak memory of each phase is measured with tracemalloc, in another run,
+since tracing slows down allocations. With --compare, phases slower or
+larger than the baseline by more than --threshold are reported, and the
+exit status is 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from functools import partial
+
+import yaml
+
+import tree_io
+
+from logo_gen import generate_nested, generate_procedures, generate_program
+from logo_lexer import lexer, reset
+from logo_parser import compile_program
+from logo_parser import parser as pseudo_parser
+from logo_tree import parser
+from tree import Node, to_dict
+
+WORKLOADS = {
+    "long": lambda size: generate_program(size, seed=1),
+    "procedures": lambda size: generate_procedures(
+        size, procedures=max(20, size // 100), seed=2
+    ),
+    "nested": lambda size: generate_nested(size, seed=3),
+}
+
+# The pseudo-code grammar of logo_parser has no procedure calls.
+UNSUPPORTED = {("procedures", "pseudo")}
+
+# Stack of the YAML thread, in bytes, its recursion limit, and the depth
+# of the deepest program serialized.
+YAML_STACK_SIZE = 512 << 20
+YAML_RECURSION_LIMIT = 50000
+YAML_MAX_DEPTH = 256
+
+# The node returned by the parser when only parsing is measured. Its value
+# can be extended like the value of a parameter list.
+NULL = Node("null", value=())
+
+
+def null_node(kind, children=(), value=None, lineno=None):
+    """Return NULL, instead of building a node."""
+    return NULL
+
+
+class Recorder:
+    """Node factory recording the nodes built by a parse, to replay them."""
+
+    def __init__(self):
+        """Initialize an empty record."""
+        self.nodes = []
+        self.index = {}
+        # (kind, indexes of the children, value, lineno)
+        self.actions = []
+
+    def __call__(self, kind, children=(), value=None, lineno=None):
+        """Build and record a node."""
+        node = Node(kind, children, value, lineno)
+        self.index[id(node)] = len(self.nodes)
+        self.nodes.append(node)
+        self.actions.append(
+            (
+                kind,
+                tuple(self.index[id(child)] for child in children),
+                value,
+                lineno,
+            )
+        )
+        return node
+
+
+def depth(root):
+    """Return the number of levels of a tree."""
+    result = 0
+    stack = [(root, 1)]
+    while stack:
+        node, level = stack.pop()
+        result = max(result, level)
+        stack.extend((child, level + 1) for child in node.children)
+    return result
+
+
+def tokenize(source, the_lexer):
+    """Return the list of tokens of a source."""
+    reset(the_lexer)
+    the_lexer.input(source)
+    return list(the_lexer)
+
+
+def parse_tokens(the_parser, tokens):
+    """Parse a list of tokens."""
+    return the_parser.parse(tokenfunc=partial(next, iter(tokens), None))
+
+
+class Context:
+    """Everything built once and shared by the phases."""
+
+    def __init__(self):
+        """Build the lexer and the parsers."""
+        self.lexer = lexer()
+        self.tree_parser = parser()
+        self.null_parser = parser()
+        self.null_parser.new_node = null_node
+        self.pseudo_parser = pseudo_parser()
+        self.source = None
+        self.tokens = None
+        self.program = None
+        self.depth = None
+        self.actions = None
+
+    def prepare(self, source):
+        """Set the source of the next phases."""
+        self.source = source
+        self.tokens = tokenize(source, self.lexer)
+        recorder = self.tree_parser.new_node = Recorder()
+        self.program = parse_tokens(self.tree_parser, self.tokens)
+        self.depth = depth(self.program)
+        self.actions = recorder.actions
+
+
+def phase_lex(context):
+    """Tokenize the source."""
+    tokenize(context.source, context.lexer)
+
+
+def phase_parse(context):
+    """Parse the tokens without building nodes."""
+    parse_tokens(context.null_parser, context.tokens)
+
+
+def phase_tree(context):
+    """Build the compact tree, as the parser actions of a parse did."""
+    nodes = []
+    for kind, children, value, lineno in context.actions:
+        nodes.append(
+            Node(kind, tuple([nodes[i] for i in children]), value, lineno)
+        )
+
+
+def phase_pseudo(context):
+    """Generate the pseudo-code."""
+    with open(os.devnull, "w") as output:
+        compile_program(
+            context.source, context.pseudo_parser, context.lexer, output
+        )
+
+
+def phase_tree_io(context):
+    """Serialize the tree with tree_io."""
+    tree_io.dumps(context.program)
+
+
+def deep(function):
+    """Call function in a thread with a deep stack, raising its errors."""
+    errors = []
+
+    def target():
+        try:
+            function()
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append(error)
+
+    limit = sys.getrecursionlimit()
+    stack_size = threading.stack_size(YAML_STACK_SIZE)
+    try:
+        sys.setrecursionlimit(YAML_RECURSION_LIMIT)
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+    finally:
+        threading.stack_size(stack_size)
+        sys.setrecursionlimit(limit)
+    if errors:
+        raise errors[0]
+
+
+def phase_yaml(context):
+    """Serialize the dict tree as YAML, one statement per document.
+
+    Dumped whole, the dict tree of a program is a chain as long as the
+    program, and its YAML output grows with the square of its length.
+    """
+    if context.depth > YAML_MAX_DEPTH:
+        raise RecursionError(f"{context.depth} levels")
+    with open(os.devnull, "w") as output:
+        deep(
+            partial(
+                yaml.dump_all,
+                (to_dict(node) for node in context.program.children),
+                output,
+                indent=2,
+                sort_keys=False,
+            )
+        )
+
+
+PHASES = {
+    "lex": phase_lex,
+    "parse": phase_parse,
+    "tree": phase_tree,
+    "pseudo": phase_pseudo,
+    "tree_io": phase_tree_io,
+    "yaml": phase_yaml,
+}
+
+
+def timed(function, context, repeat):
+    """Return the best time of repeat calls."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(context)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def traced(function, context):
+    """Return the peak memory allocated by a call."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        function(context)
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes, repeat=3, memory=True, workloads=WORKLOADS):
+    """Run all benchmarks, returning {"workload/size/phase": result}.
+
+    Each result is a dict with the time in seconds and the peak memory
+    in bytes, which is None without memory measurements.
+    """
+    context = Context()
+    results = {}
+    for name, generate in workloads.items():
+        for size in sizes:
+            context.prepare(generate(size))
+            measured = {}
+            for phase, function in PHASES.items():
+                if (name, phase) in UNSUPPORTED:
+                    continue
+                try:
+                    measured[phase] = {
+                        "time": timed(function, context, repeat),
+                        "peak": traced(function, context) if memory else None,
+                    }
+                except RecursionError:
+                    print(f"{name}/{size}/{phase}: too deep, skipped")
+            for phase, result in measured.items():
+                results[f"{name}/{size}/{phase}"] = result
+                print(format_result(f"{name}/{size}/{phase}", result))
+    return results
+
+
+def format_result(key, result):
+    """Format one result as a line."""
+    line = f"{key:<28} {result['time'] * 1000:10.2f} ms"
+    if result["peak"] is not None:
+        line += f" {result['peak'] / 1e6:10.2f} MB"
+    return line
+
+
+def compare(results, baseline, threshold):
+    """Print the changes from a baseline, returning the regressions."""
+    regressions = []
+    for key, result in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        changes = []
+        for metric in ("time", "peak"):
+            if result[metric] is None or not old[metric]:
+                continue
+            ratio = result[metric] / old[metric]
+            changes.append(f"{metric} x{ratio:.2f}")
+            if ratio > 1 + threshold:
+                regressions.append((key, metric, ratio))
+        print(f"{key:<28} {', '.join(changes)}")
+    return regressions
+
+
+def main(argv=None):
+    """Run the benchmark suite."""
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument(
+        "--sizes",
+        default="1000,10000,100000",
+        help="comma-separated statement counts, up to 1000000",
+    )
+    args.add_argument("--workloads", default=",".join(WORKLOADS))
+    args.add_argument("--repeat", type=int, default=3)
+    args.add_argument("--no-memory", action="store_true")
+    args.add_argument("--save", help="write the results to a JSON file")
+    args.add_argument("--compare", help="baseline JSON file")
+    args.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative change reported as a regression",
+    )
+    options = args.parse_args(argv)
+
+    sizes = [int(size) for size in options.sizes.split(",")]
+    workloads = {
+        name: WORKLOADS[name] for name in options.workloads.split(",")
+    }
+    results = run(sizes, options.repeat, not options.no_memory, workloads)
+    if options.save:
+        with open(options.save, "w", encoding="utf-8") as output:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                output,
+                indent=1,
+                sort_keys=True,
+            )
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as source:
+            baseline = json.load(source)["results"]
+        print()
+        regressions = compare(results, baseline, options.threshold)
+        for key, metric, ratio in regressions:
+            print(f"regression: {key} {metric} x{ratio:.2f}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
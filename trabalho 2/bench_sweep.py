@@ -0,0 +1,95 @@
+"""Compare a parameter sweep with running each argument vector alone."""
+
+import sys
+import time
+
+import numpy as np
+
+from logo_exec import BudgetExceeded, Clear, Execution, Periodic, Segment
+from logo_lexer import lexer
+from logo_sweep import sweep
+from logo_tree import parser
+from tree import Node
+
+SOURCE = """
+TO ABC :SIZE :ANGLE
+    IF :ANGLE > 120 THEN RAY :SIZE :ANGLE ELSE TURN :SIZE :ANGLE END
+END
+TO RAY :S :A
+    IF :S > 50 THEN FORWARD :S ELSE STEPS :S :A END
+END
+TO STEPS :S :A
+    WHILE :A > 0 THEN FORWARD :S END
+END
+TO TURN :S :A
+    IF :A > 60 AND :S < 80 THEN WHILE 1 < 2 THEN RIGHT :A END
+    ELSE SETXY :S :A END
+END
+"""
+
+
+def arguments(lanes, seed=0):
+    """Return random argument vectors for ABC."""
+    rng = np.random.default_rng(seed)
+    return np.column_stack(
+        (
+            rng.integers(1, 100, lanes),
+            rng.integers(0, 360, lanes),
+        )
+    )
+
+
+def separate(program, name, row, max_segments):
+    """Run a call alone, returning its segments and how it stopped."""
+    call = Node(
+        "call", tuple(Node("value_expr", value=value) for value in row), name
+    )
+    execution = Execution(
+        Node("program", program.children + (call,)), max_steps=1_000_000
+    )
+    segments = []
+    count = 0
+    try:
+        for event in execution.events():
+            if type(event) is Segment:
+                if count == max_segments:
+                    return segments, True, False
+                count += 1
+                segments.append(event)
+            elif type(event) is Clear:
+                segments.clear()
+            elif type(event) is Periodic and not (event.dx or event.dy):
+                # As logo_render.drawing, which the sweep follows.
+                break
+    except BudgetExceeded:
+        return segments, False, True
+    return segments, False, False
+
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [100, 1000, 10000]
+    max_segments = 200
+    program = parser().parse(SOURCE, lexer=lexer())
+    for lanes in sizes:
+        rows = arguments(lanes).tolist()
+        start = time.perf_counter()
+        result = sweep(program, "ABC", rows, max_segments=max_segments)
+        batch_time = time.perf_counter() - start
+        start = time.perf_counter()
+        expected = [
+            separate(program, "ABC", row, max_segments) for row in rows
+        ]
+        alone_time = time.perf_counter() - start
+        for lane, (segments, truncated, exceeded) in enumerate(expected):
+            assert result.truncated[lane] == truncated, lane
+            assert result.exceeded[lane] == exceeded, lane
+            drawn = np.reshape(result.lane(lane), (-1, 4))
+            assert drawn.shape == (len(segments), 4), lane
+            assert np.allclose(drawn, np.reshape(segments, (-1, 4))), lane
+        print(
+            f"{lanes:>7,} lanes: sweep {batch_time * 1000:9.1f} ms "
+            f"({lanes / batch_time:10,.0f} lanes/s), "
+            f"separate {alone_time * 1000:9.1f} ms "
+            f"({lanes / alone_time:10,.0f} lanes/s), "
+            f"speedup {alone_time / batch_time:6.1f}x"
+        )
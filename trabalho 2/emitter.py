@@ -0,0 +1,54 @@
+"""Collect generated code as a rope, and write it in chunks.
+
+A rope is a string, a number, or a tuple or list of ropes. Building a
+rope from its parts never copies them, so nested constructs are built in
+linear time, and the code is only joined, one chunk at a time, when it
+is written.
+"""
+
+import io
+
+CHUNK_SIZE = 64 * 1024
+
+
+def emit(rope, output, chunk_size=CHUNK_SIZE):
+    """Write a rope to a text stream, in chunks of about chunk_size.
+
+    To write to a socket, use socket.makefile("w").
+    """
+    buffer = []
+    size = 0
+    stack = [rope]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (tuple, list)):
+            stack.extend(reversed(item))
+            continue
+        if not isinstance(item, str):
+            item = str(item)
+        buffer.append(item)
+        size += len(item)
+        if size >= chunk_size:
+            output.write("".join(buffer))
+            buffer.clear()
+            size = 0
+    if buffer:
+        output.write("".join(buffer))
+
+
+def to_string(rope):
+    """Join a rope in a single string."""
+    output = io.StringIO()
+    emit(rope, output)
+    return output.getvalue()
+
+
+def join(separator, ropes):
+    """Create a rope with separator between each rope."""
+    result = []
+    for rope in ropes:
+        result.append(rope)
+        result.append(separator)
+    if result:
+        result.pop()
+    return result
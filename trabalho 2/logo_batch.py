@@ -0,0 +1,174 @@
+"""Compile many Logo source files in parallel.
+
+Usage: python logo_batch.py [-j JOBS] [-o OUTPUT] [-f FORMAT] PATH...
+
+Each PATH is a file, a directory (searched for *.logo files) or a glob.
+For every input, OUTPUT receives the tree (as .tree or .yaml) or the
+error message (as .err), at the same path relative to the inputs. The
+files written, and the report, do not depend on the number of jobs.
+
+The yaml format uses the nested dict tree, and only works for small
+programs.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+
+import tree_io
+
+from logo_lexer import lexer, reset
+from logo_tree import parser
+from tree import to_dict
+
+__worker = {}
+
+FORMATS = {"tree": ".tree", "yaml": ".yaml"}
+
+
+def find_sources(paths):
+    """Return the sorted list of source files for the given paths."""
+    sources = set()
+    for path in paths:
+        if os.path.isdir(path):
+            pattern = os.path.join(path, "**", "*.logo")
+            sources.update(glob.glob(pattern, recursive=True))
+        elif os.path.isfile(path):
+            sources.add(path)
+        else:
+            sources.update(
+                match
+                for match in glob.glob(path, recursive=True)
+                if os.path.isfile(match)
+            )
+    return sorted(os.path.abspath(source) for source in sources)
+
+
+def init_worker(output, output_format, root):
+    """Build the lexer and parser tables once per worker process."""
+    __worker["lexer"] = lexer()
+    __worker["parser"] = parser()
+    __worker["output"] = output
+    __worker["format"] = output_format
+    __worker["root"] = root
+
+
+def __write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as output:
+        output.write(data)
+
+
+def __remove_outputs(target):
+    # Outputs of an earlier run must not survive a change of result.
+    for suffix in (".err", *FORMATS.values()):
+        try:
+            os.remove(target + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def compile_file(path):
+    """Compile one file, returning (path, error, statements, size).
+
+    The error, if any, has one line per problem found: lexical errors
+    first, in source order, then the syntax error.
+    """
+    target = os.path.join(
+        __worker["output"], os.path.relpath(path, __worker["root"])
+    )
+    target = os.path.splitext(target)[0]
+    __remove_outputs(target)
+    size = 0
+    errors = []
+
+    def report(kind, token, message):
+        errors.append(f"{token.lineno}: {kind} error: {message}")
+
+    the_lexer = __worker["lexer"]
+    try:
+        with open(path, encoding="utf-8") as source:
+            data = source.read()
+        size = len(data)
+        reset(the_lexer)
+        the_lexer.report = report
+        program = __worker["parser"].parse(data, lexer=the_lexer)
+        if not errors:
+            if __worker["format"] == "yaml":
+                output = yaml.dump(
+                    to_dict(program), indent=2, sort_keys=False
+                )
+                output = output.encode("utf-8")
+            else:
+                output = tree_io.dumps(program)
+    except Exception as error:  # pylint: disable=broad-except
+        errors.append(str(error))
+    finally:
+        the_lexer.report = None
+    if errors:
+        text = "".join(f"{path}: {error}\n" for error in errors)
+        __write(target + ".err", text.encode("utf-8"))
+        return path, "\n".join(errors), 0, size
+    __write(target + FORMATS[__worker["format"]], output)
+    return path, None, len(program.children), size
+
+
+def compile_all(sources, output, output_format="tree", jobs=None):
+    """Compile all sources, yielding the results in input order."""
+    if not sources:
+        return
+    root = os.path.commonpath([os.path.dirname(path) for path in sources])
+    settings = (output, output_format, root)
+    if jobs == 1:
+        init_worker(*settings)
+        yield from map(compile_file, sources)
+        return
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=settings
+    ) as pool:
+        chunksize = max(1, len(sources) // (4 * (jobs or os.cpu_count())))
+        yield from pool.map(compile_file, sources, chunksize=chunksize)
+
+
+def main(argv=None):
+    """Run the batch compiler."""
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument("paths", nargs="+", help="files, directories or globs")
+    args.add_argument("-o", "--output", default="build", help="output dir")
+    args.add_argument("-j", "--jobs", type=int, help="number of processes")
+    args.add_argument(
+        "-f", "--format", choices=sorted(FORMATS), default="tree"
+    )
+    options = args.parse_args(argv)
+
+    sources = find_sources(options.paths)
+    start = time.perf_counter()
+    errors = statements = size = 0
+    for path, error, count, length in compile_all(
+        sources, options.output, options.format, options.jobs
+    ):
+        size += length
+        statements += count
+        if error:
+            errors += 1
+            for line in error.splitlines():
+                print(f"{path}: {line}", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    print(f"files:      {len(sources)} ({errors} with errors)")
+    print(f"statements: {statements}")
+    print(f"source:     {size:,} bytes")
+    if elapsed:
+        print(f"time:       {elapsed:.2f} s")
+        print(f"throughput: {len(sources) / elapsed:.1f} files/s, ", end="")
+        print(f"{size / elapsed / 1e6:.2f} MB/s")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Cache parsed Logo programs on disk.
+
+Trees are stored with tree_io, in files named after the SHA-256 of the
+program source. Each file is tagged with a digest of the grammar
+signature, so entries written by another grammar are discarded. When
+the cache grows over its size limit, the least recently used entries
+are removed.
+"""
+
+import hashlib
+import os
+import tempfile
+
+import tree_io
+
+from logo_lexer import lexer
+from logo_tree import parser, signature
+
+SUFFIX = ".tree"
+
+
+class TreeCache:
+    """A directory of parsed programs, keyed by source content."""
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        """Initialize the cache, creating the directory if needed."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.tag = hashlib.sha256(signature().encode()).digest()[:16]
+        self.hits = 0
+        self.misses = 0
+        self.__parser = None
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, source):
+        """Return the path of the cache entry for a source."""
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, source):
+        """Return the cached tree for a source, or None."""
+        path = self.path(source)
+        try:
+            if tree_io.read_tag(path) != self.tag.rstrip(b"\0"):
+                os.remove(path)
+                return None
+            program = tree_io.load(path)
+        except OSError:
+            return None
+        except tree_io.FormatError:
+            # A truncated or corrupt entry: drop it so it is written again.
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        os.utime(path)
+        return program
+
+    def put(self, source, program):
+        """Store the tree for a source, evicting old entries if needed.
+
+        Raise tree_io.FormatError if the tree cannot be encoded.
+        """
+        data = tree_io.dumps(program, self.tag)
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as output:
+                output.write(data)
+            os.replace(temporary, self.path(source))
+        except BaseException:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            raise
+        self.evict()
+
+    def parse(self, source):
+        """Return the tree of a source, parsing it only on cache misses."""
+        program = self.get(source)
+        if program is not None:
+            self.hits += 1
+            return program
+        self.misses += 1
+        if self.__parser is None:
+            self.__parser = parser()
+        program = self.__parser.parse(source, lexer=lexer())
+        if program is not None:
+            try:
+                self.put(source, program)
+            except tree_io.FormatError:
+                # E.g. a number too large for the file format.
+                pass
+        return program
+
+    def parse_file(self, path):
+        """Return the tree of a source file."""
+        with open(path, encoding="utf-8") as source:
+            return self.parse(source.read())
+
+    def evict(self):
+        """Remove least recently used entries until under the size limit."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(SUFFIX):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """Remove every entry."""
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(SUFFIX):
+                    os.remove(entry.path)
@@ -0,0 +1,172 @@
+"""Check Logo programs, reporting all their errors in a single pass.
+
+Usage: python logo_check.py PATH...
+
+The parser of logo_tree stops at the first syntax error, and its lexer
+prints illegal characters and skips them. The checking parser adds error
+rules to the grammar, and uses the error recovery of PLY instead:
+
+- an error in an IF, WHILE or TO header skips to the END of the block;
+- an error in a statement skips to the next token that can start a
+  statement, or to the END or ELSE of the block holding it.
+
+The statement is replaced by an error node, and parsing goes on. A
+token that still does not fit after that, such as a stray END, is
+skipped. Lexical and syntax errors are collected, in order, with their
+line and column. When the input ends inside a statement, PLY cannot
+recover, so there is no program tree, but the errors found are still
+reported.
+"""
+
+import argparse
+import sys
+from collections import namedtuple
+from types import SimpleNamespace
+
+from ply import lex, yacc
+
+import logo_tree
+
+from logo_batch import find_sources
+from logo_lexer import lexer, reset
+from tree import Node
+
+# Tables are built in memory, as parsetab.py holds the logo_tree ones.
+TABMODULE = "parsetab_check"
+
+Diagnostic = namedtuple("Diagnostic", "kind lineno column message")
+
+Result = namedtuple("Result", "program errors")
+
+
+def p_statement_error(prod):
+    """expression : error"""
+    # Report the next error, even if it comes right after this one.
+    prod.parser.errok()
+    prod[0] = logo_tree.new_node(prod, "error", lineno=prod.lineno(1))
+
+
+def p_block_error(prod):
+    """assign_expr : TO error END
+    if_stmt : IF error END
+    loop_stmt : WHILE error END
+    """
+    prod.parser.errok()
+    prod[0] = logo_tree.new_node(prod, "error", lineno=prod.lineno(1))
+
+
+def parser():
+    """Create a parser calling its report attribute for each error."""
+
+    def p_error(token):
+        if token is None:
+            the_parser.report("syntax", None, "Unexpected end of input")
+            return None
+        if token is the_parser.unexpected:
+            # The error rules matched without consuming this token, and
+            # it still does not fit: skip it, and do not report it again.
+            the_parser.errok()
+            the_parser.unexpected = the_parser.token()
+            return the_parser.unexpected
+        the_parser.unexpected = token
+        the_parser.report(
+            "syntax", token, f"Unexpected token: {token.type}:'{token.value}'"
+        )
+        if len(the_parser.statestack) <= 1:
+            # PLY drops a bad first token without recovering, which leaves
+            # a program made only of it without a tree: turn the token
+            # into an error symbol instead, as the error rules would.
+            symbol = lex.LexToken()
+            symbol.type = "error"
+            symbol.value = token
+            symbol.lineno = token.lineno
+            symbol.lexpos = token.lexpos
+            the_parser.errok()
+            return symbol
+        return None
+
+    rules = {
+        name: value
+        for name, value in vars(logo_tree).items()
+        if name.startswith("p_") and name != "p_error"
+    }
+    rules.update(
+        p_statement_error=p_statement_error,
+        p_block_error=p_block_error,
+        p_error=p_error,
+        tokens=logo_tree.tokens,
+        __file__=__file__,
+    )
+    the_parser = yacc.yacc(
+        module=SimpleNamespace(**rules),
+        start="program",
+        tabmodule=TABMODULE,
+        write_tables=False,
+        debug=False,
+    )
+    the_parser.new_node = Node
+    the_parser.report = None
+    # The last token reported, or skipped after it.
+    the_parser.unexpected = None
+    return the_parser
+
+
+def check(source, the_parser=None, the_lexer=None):
+    """Parse a source, returning its program tree and all its errors.
+
+    Statements with syntax errors are error nodes in the program tree.
+    """
+    if the_parser is None:
+        the_parser = parser()
+    if the_lexer is None:
+        the_lexer = lexer()
+    errors = []
+
+    def report(kind, token, message):
+        if token is None:
+            errors.append(Diagnostic(kind, the_lexer.lineno, None, message))
+            return
+        column = token.lexpos - source.rfind("\n", 0, token.lexpos)
+        errors.append(Diagnostic(kind, token.lineno, column, message))
+
+    reset(the_lexer)
+    the_lexer.report = the_parser.report = report
+    try:
+        program = the_parser.parse(source, lexer=the_lexer)
+    finally:
+        the_lexer.report = the_parser.report = None
+        the_parser.unexpected = None
+    return Result(program, errors)
+
+
+def check_file(path, the_parser=None, the_lexer=None):
+    """Check a source file."""
+    with open(path, encoding="utf-8") as source:
+        return check(source.read(), the_parser, the_lexer)
+
+
+def main(argv=None):
+    """Check the given files, printing their errors."""
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument("paths", nargs="+", help="files, directories or globs")
+    options = args.parse_args(argv)
+    the_parser = parser()
+    the_lexer = lexer()
+    failed = 0
+    sources = find_sources(options.paths)
+    for path in sources:
+        errors = check_file(path, the_parser, the_lexer).errors
+        if errors:
+            failed += 1
+        for error in errors:
+            column = "" if error.column is None else f"{error.column}:"
+            print(
+                f"{path}:{error.lineno}:{column} {error.kind} error: "
+                f"{error.message}"
+            )
+    print(f"{len(sources)} files checked, {failed} with errors")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
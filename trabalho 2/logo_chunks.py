@@ -0,0 +1,120 @@
+"""Lex large Logo source files in chunks, from a memory map.
+
+Usage: python logo_chunks.py FILE [CHUNK_SIZE]
+
+PLY lexers need their whole input as one string. Here the file is mapped
+in memory and decoded one chunk at a time, each chunk ending after a
+whitespace character. No Logo token contains whitespace, so no token is
+split between chunks. The lexer keeps counting lines from one chunk to
+the next, and the lexpos of the tokens is made relative to the start of
+the file, in characters.
+
+Pages already lexed are released, so the memory used depends on the
+chunk size, not on the file size.
+"""
+
+import mmap
+import re
+import sys
+from functools import partial
+
+from logo_lexer import lexer, reset
+from logo_tree import parser
+
+CHUNK_SIZE = 1024 * 1024
+
+WHITESPACE = (b"\n", b" ", b"\t", b"\r")
+
+SEPARATOR = re.compile(rb"[\n \t\r]")
+
+
+def __cut(data, start, end):
+    """Return where to end the chunk starting at start, near end."""
+    if end >= len(data):
+        return len(data)
+    # Prefer ending on a line, then on any whitespace, and only extend the
+    # chunk when a single token is longer than the chunk size.
+    for separator in WHITESPACE:
+        position = data.rfind(separator, start, end)
+        if position >= 0:
+            return position + 1
+    match = SEPARATOR.search(data, end)
+    return match.end() if match else len(data)
+
+
+def chunks(data, chunk_size=CHUNK_SIZE):
+    """Yield (byte offset, text) chunks of a UTF-8 bytes-like object."""
+    start = 0
+    while start < len(data):
+        end = __cut(data, start, start + chunk_size)
+        yield start, str(data[start:end], "utf-8")
+        start = end
+
+
+def __release(data, start, end):
+    """Release the memory mapped pages between start and end."""
+    start -= start % mmap.PAGESIZE
+    end -= end % mmap.PAGESIZE
+    if end > start:
+        data.madvise(mmap.MADV_DONTNEED, start, end - start)
+    return end
+
+
+def tokens(data, the_lexer=None, chunk_size=CHUNK_SIZE):
+    """Yield the tokens of a UTF-8 bytes-like object, lexing by chunks."""
+    if the_lexer is None:
+        the_lexer = lexer()
+        reset(the_lexer)
+    release = isinstance(data, mmap.mmap) and hasattr(data, "madvise")
+    released = 0
+    offset = 0
+    for start, text in chunks(data, chunk_size):
+        if release:
+            released = __release(data, released, start)
+        the_lexer.input(text)
+        for token in the_lexer:
+            token.lexpos += offset
+            yield token
+        offset += len(text)
+
+
+def lex_file(path, the_lexer=None, chunk_size=CHUNK_SIZE):
+    """Yield the tokens of a source file, lexing by chunks."""
+    with open(path, "rb") as source:
+        if not source.seek(0, 2):
+            return
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if hasattr(data, "madvise"):
+                data.madvise(mmap.MADV_SEQUENTIAL)
+            yield from tokens(data, the_lexer, chunk_size)
+
+
+def parse_file(path, the_parser=None, the_lexer=None, chunk_size=CHUNK_SIZE):
+    """Parse a source file, lexing it by chunks."""
+    if the_parser is None:
+        the_parser = parser()
+    if the_lexer is None:
+        the_lexer = lexer()
+        reset(the_lexer)
+    stream = lex_file(path, the_lexer, chunk_size)
+    # PLY still needs a lexer when tokens come from tokenfunc.
+    return the_parser.parse(
+        lexer=the_lexer, tokenfunc=partial(next, stream, None)
+    )
+
+
+if __name__ == "__main__":
+    # Unix only, and only needed to report the peak memory.
+    import resource
+
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else CHUNK_SIZE
+    count = 0
+    last = None
+    for last in lex_file(sys.argv[1], chunk_size=size):
+        count += 1
+    print(f"tokens:   {count:,}")
+    if last is not None:
+        print(f"lines:    {last.lineno:,}")
+    # ru_maxrss is in kilobytes on Linux.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"peak RSS: {peak / 1024:.1f} MB")
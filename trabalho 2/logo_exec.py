@@ -0,0 +1,396 @@
+"""Execute Logo programs lazily, yielding drawing events.
+
+The turtle starts at (0, 0), heading north (0 degrees), with the pen
+down, and RIGHT turns clockwise. Events are produced only when the
+consumer asks for them, so programs that never end can be executed one
+prefix at a time.
+
+Conditions in Logo only depend on numbers and procedure parameters, so
+a WHILE loop that runs once never ends. When the turtle state at the
+start of an iteration repeats, possibly translated if the loop does not
+depend on absolute positions, the loop is periodic. A Periodic event is
+yielded, and the rest of the output is produced by replaying the events
+of one period, without running the loop again.
+"""
+
+import math
+import operator
+from collections import namedtuple
+from itertools import islice
+
+from logo_lexer import lexer
+from logo_tree import parser
+from tree import walk
+
+Segment = namedtuple("Segment", "x0 y0 x1 y1")
+
+Move = namedtuple("Move", "x0 y0 x1 y1")
+
+Clear = namedtuple("Clear", "")
+
+Print = namedtuple("Print", "value")
+
+Periodic = namedtuple("Periodic", "lineno events dx dy")
+
+COMPARE = {
+    "==": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+ABSOLUTE = {"HOME", "SETXY", "CLEARSCREEN", "CS"}
+
+PRECISION = 6
+
+# Marks the end of a statement on the execution stack, when profiling.
+_EXIT = object()
+
+
+class ExecutionError(Exception):
+    """Error raised when a program cannot be executed."""
+
+
+class BudgetExceeded(ExecutionError):
+    """Error raised when a program exceeds its step or segment budget."""
+
+
+class _Loop:
+    """Cycle detection state of a running WHILE loop."""
+
+    __slots__ = ("node", "states", "events", "iteration")
+
+    def __init__(self, node):
+        self.node = node
+        self.states = {}
+        self.events = []
+        self.iteration = 0
+
+
+class Execution:
+    """The state of the turtle while a program runs."""
+
+    def __init__(
+        self,
+        program,
+        max_steps=None,
+        max_segments=None,
+        detect_cycles=True,
+        cycle_window=4096,
+        profiler=None,
+        start=None,
+        procedures=None,
+    ):
+        """Initialize the turtle for a program.
+
+        The budgets limit the number of statements executed and of
+        segments drawn; None means no limit. Cycle detection gives up on
+        a loop after cycle_window iterations or events. A profiler, such
+        as logo_profile.Profiler, is told when each statement starts and
+        ends. The turtle starts in the start state, as returned by state,
+        with the procedures already defined, if they are given.
+        """
+        self.program = program
+        self.max_steps = max_steps
+        self.max_segments = max_segments
+        self.detect_cycles = detect_cycles
+        self.cycle_window = cycle_window
+        self.profiler = profiler
+        self.x, self.y, self.heading, self.pen = start or (0.0, 0.0, 0.0, True)
+        self.procedures = dict(procedures or {})
+        self.generation = 0
+        self.steps = 0
+        self.segments = 0
+        self.periodic = None
+
+    def state(self):
+        """Return the turtle state as (x, y, heading, pen)."""
+        return self.x, self.y, self.heading, self.pen
+
+    def lookup(self, name, env):
+        """Return the value of a parameter in the current call chain."""
+        while env is not None:
+            bindings, env = env
+            if name in bindings:
+                return bindings[name]
+        raise ExecutionError(f"Undefined parameter: {name}")
+
+    def value(self, node, env):
+        """Evaluate a value expression."""
+        if node.kind == "param":
+            return self.lookup(node.value, env)
+        return node.value
+
+    def condition(self, node, env):
+        """Evaluate a condition."""
+        left, right = node.children
+        if node.value == "AND":
+            return self.condition(left, env) and self.condition(right, env)
+        if node.value == "OR":
+            return self.condition(left, env) or self.condition(right, env)
+        return COMPARE[node.value](
+            self.value(left, env), self.value(right, env)
+        )
+
+    def move_to(self, x, y):
+        """Move the turtle, returning the Segment or Move event."""
+        event = (Segment if self.pen else Move)(self.x, self.y, x, y)
+        self.x = x
+        self.y = y
+        return event
+
+    def forward(self, distance):
+        """Move along the heading, returning the event."""
+        angle = math.radians(self.heading)
+        return self.move_to(
+            round(self.x + distance * math.sin(angle), 9),
+            round(self.y + distance * math.cos(angle), 9),
+        )
+
+    def command(self, node, env):
+        """Run a turtle command, returning its event or None."""
+        name = node.value
+        args = [self.value(arg, env) for arg in node.children]
+        if name in ("FORWARD", "FO"):
+            return self.forward(args[0])
+        if name in ("BACKWARD", "BK"):
+            return self.forward(-args[0])
+        if name in ("RIGHT", "RT"):
+            self.heading = (self.heading + args[0]) % 360
+        elif name in ("LEFT", "LT"):
+            self.heading = (self.heading - args[0]) % 360
+        elif name in ("PENUP", "PU"):
+            self.pen = False
+        elif name in ("PENDOWN", "PD"):
+            self.pen = True
+        elif name == "HOME":
+            self.heading = 0.0
+            return self.move_to(0.0, 0.0)
+        elif name == "SETXY":
+            return self.move_to(float(args[0]), float(args[1]))
+        elif name in ("CLEARSCREEN", "CS"):
+            self.x = self.y = self.heading = 0.0
+            return Clear()
+        elif name in ("WIPECLEAN", "WC"):
+            return Clear()
+        elif name == "PRINT":
+            return Print(args[0])
+        return None
+
+    def translation_invariant(self, node):
+        """Check if running node never depends on the turtle position."""
+        seen = set()
+        stack = [node]
+        while stack:
+            for child in walk(stack.pop()):
+                if child.kind == "logo_function" and child.value in ABSOLUTE:
+                    return False
+                if child.kind == "call" and child.value not in seen:
+                    seen.add(child.value)
+                    procedure = self.procedures.get(child.value)
+                    if procedure is not None:
+                        stack.append(procedure.children[1])
+        return True
+
+    def __check_cycle(self, loop):
+        """Return the period of a loop if its state repeats, or None.
+
+        The period is (events, dx, dy, steps): the events of one period,
+        the translation between periods and the statements executed.
+        """
+        loop.iteration += 1
+        if loop.iteration > self.cycle_window:
+            return None
+        key = (round(self.heading, PRECISION), self.pen, self.generation)
+        position = (self.x, self.y, len(loop.events), self.steps)
+        previous = loop.states.get(key)
+        if previous is None:
+            loop.states[key] = position
+            return None
+        x, y, start, steps = previous
+        dx = self.x - x
+        dy = self.y - y
+        moved = round(dx, PRECISION) or round(dy, PRECISION)
+        if moved and not self.translation_invariant(loop.node):
+            loop.states[key] = position
+            return None
+        if not moved:
+            dx = dy = 0.0
+        return loop.events[start:], dx, dy, self.steps - steps
+
+    def events(self):
+        """Return a generator running the program and yielding its events."""
+        if self.profiler is None:
+            return self.__run()
+        return self.__profile()
+
+    def __profile(self):
+        """Run the program, closing the profiler frames when it stops."""
+        try:
+            yield from self.__run()
+        finally:
+            self.profiler.finish()
+
+    def __run(self):
+        """Run the program, yielding its events."""
+        profiler = self.profiler
+        stack = [
+            (statement, None) for statement in reversed(self.program.children)
+        ]
+        loops = []
+        while stack:
+            node, env = stack.pop()
+            if env is _EXIT:
+                profiler.exit()
+                continue
+            if isinstance(node, _Loop):
+                loop = node
+                if not self.condition(loop.node.children[0], env):
+                    if self.detect_cycles:
+                        loops.remove(loop)
+                    continue
+                if self.detect_cycles:
+                    period = self.__check_cycle(loop)
+                    if period is not None:
+                        yield from self.__replay(loop.node, *period)
+                        return
+                stack.append((loop, env))
+                stack.append((loop.node.children[1], env))
+                continue
+
+            self.steps += 1
+            if self.max_steps is not None and self.steps > self.max_steps:
+                raise BudgetExceeded(f"Step budget exceeded: {self.max_steps}")
+            if profiler is not None:
+                profiler.enter(node)
+                stack.append((node, _EXIT))
+            kind = node.kind
+            if kind == "logo_function":
+                event = self.command(node, env)
+                if event is None:
+                    continue
+                if type(event) is Segment:
+                    self.segments += 1
+                    if (
+                        self.max_segments is not None
+                        and self.segments > self.max_segments
+                    ):
+                        raise BudgetExceeded(
+                            f"Segment budget exceeded: {self.max_segments}"
+                        )
+                for loop in loops:
+                    if len(loop.events) < self.cycle_window:
+                        loop.events.append(event)
+                    else:
+                        loop.iteration = self.cycle_window
+                if profiler is None:
+                    yield event
+                    continue
+                if type(event) is Segment:
+                    profiler.segment()
+                profiler.pause()
+                yield event
+                profiler.resume()
+            elif kind == "if_stmt":
+                if self.condition(node.children[0], env):
+                    stack.append((node.children[1], env))
+                elif len(node.children) > 2:
+                    stack.append((node.children[2], env))
+            elif kind == "loop_stmt":
+                loop = _Loop(node)
+                if self.detect_cycles:
+                    loops.append(loop)
+                stack.append((loop, env))
+            elif kind == "call":
+                procedure = self.procedures.get(node.value)
+                if procedure is None:
+                    raise ExecutionError(f"Undefined procedure: {node.value}")
+                params, body = procedure.children
+                if len(params.value) != len(node.children):
+                    raise ExecutionError(
+                        f"Wrong number of arguments for {node.value}:"
+                        f"{node.lineno}"
+                    )
+                args = [self.value(arg, env) for arg in node.children]
+                stack.append((body, (dict(zip(params.value, args)), env)))
+            elif kind == "assign_expr":
+                if self.procedures.get(node.value) is not node:
+                    self.procedures[node.value] = node
+                    self.generation += 1
+            elif kind == "program":
+                stack.extend(
+                    (statement, env) for statement in reversed(node.children)
+                )
+
+    def __replay(self, node, period, dx, dy, steps):
+        """Yield the events of a periodic loop forever."""
+        self.periodic = Periodic(node.lineno, len(period), dx, dy)
+        yield self.periodic
+        if not period:
+            return
+        offset = 0
+        while True:
+            offset += 1
+            self.steps += steps
+            if self.max_steps is not None and self.steps > self.max_steps:
+                raise BudgetExceeded(f"Step budget exceeded: {self.max_steps}")
+            for event in period:
+                kind = type(event)
+                if kind is Segment or kind is Move:
+                    event = kind(
+                        event.x0 + dx * offset,
+                        event.y0 + dy * offset,
+                        event.x1 + dx * offset,
+                        event.y1 + dy * offset,
+                    )
+                    self.x, self.y = event.x1, event.y1
+                if kind is Segment:
+                    self.segments += 1
+                    if (
+                        self.max_segments is not None
+                        and self.segments > self.max_segments
+                    ):
+                        raise BudgetExceeded(
+                            f"Segment budget exceeded: {self.max_segments}"
+                        )
+                if self.profiler is None:
+                    yield event
+                    continue
+                if kind is Segment:
+                    self.profiler.segment()
+                self.profiler.pause()
+                yield event
+                self.profiler.resume()
+
+
+def execute(program, **options):
+    """Run a program, returning a generator of its events."""
+    return Execution(program, **options).events()
+
+
+def take(program, count, **options):
+    """Return the first count segments drawn by a program."""
+    segments = (
+        event
+        for event in execute(program, **options)
+        if type(event) is Segment
+    )
+    return list(islice(segments, count))
+
+
+if __name__ == "__main__":
+    SOURCE = '''
+        TO ABC :TESTE
+            FORWARD :TESTE
+        END
+        ABC 10
+        RIGHT 90
+        PENUP
+        SETXY 10 20
+        PENDOWN
+        WHILE 2 > 1 THEN ABC 5 END
+    '''
+    program = parser().parse(SOURCE, lexer=lexer())
+    for event in islice(execute(program, max_segments=1000), 8):
+        print(event)
@@ -0,0 +1,86 @@
+"""Generate random Logo programs for measurements."""
+
+import random
+
+COMMANDS = ["FORWARD", "BK", "RIGHT", "LEFT"]
+
+SIMPLE = ["PENUP", "PENDOWN", "HOME"]
+
+
+def statement(rand):
+    """Create the source of a random statement."""
+    choice = rand.random()
+    if choice < 0.6:
+        return f"{rand.choice(COMMANDS)} {rand.randint(1, 360)}"
+    if choice < 0.7:
+        return rand.choice(SIMPLE)
+    if choice < 0.8:
+        return f"SETXY {rand.randint(0, 500)} {rand.randint(0, 500)}"
+    cond = f"{rand.randint(0, 99)} > {rand.randint(0, 99)}"
+    body = f"{rand.choice(COMMANDS)} {rand.randint(1, 360)}"
+    if choice < 0.9:
+        return f"IF {cond} THEN {body} END"
+    return f"IF {cond} THEN {body} ELSE {body} END"
+
+
+def generate_program(statements, seed=0):
+    """Create the source of a program with the given number of statements."""
+    rand = random.Random(seed)
+    return "\n".join(statement(rand) for _ in range(statements)) + "\n"
+
+
+def generate_repetitive(statements, seed=0, distinct=20):
+    """Create the source of a program repeating a few distinct statements."""
+    rand = random.Random(seed)
+    pool = [statement(rand) for _ in range(distinct)]
+    return "\n".join(rand.choice(pool) for _ in range(statements)) + "\n"
+
+
+def name(index):
+    """Create a procedure name, as identifiers only have letters."""
+    letters = ""
+    index += 1
+    while index:
+        index, letter = divmod(index - 1, 26)
+        letters = chr(ord("A") + letter) + letters
+    return "PROC" + letters
+
+
+def procedure(rand, index):
+    """Create the source of a small procedure with two parameters."""
+    command = rand.choice(COMMANDS)
+    other = rand.choice(COMMANDS)
+    if index % 5 == 4:
+        # A recursive procedure, which can only be specialized.
+        return (
+            f"TO {name(index)} :S :T IF :S > :T THEN {name(index)} :T :S "
+            f"ELSE {command} :S END END"
+        )
+    return (
+        f"TO {name(index)} :S :T IF :S > {rand.randint(1, 99)} "
+        f"THEN {command} :S ELSE {other} :T END END"
+    )
+
+
+def generate_procedures(statements, procedures=20, seed=0):
+    """Create the source of a program calling small procedures in loops."""
+    rand = random.Random(seed)
+    lines = [procedure(rand, index) for index in range(procedures)]
+    for _ in range(statements):
+        call = (
+            f"{name(rand.randrange(procedures))} "
+            f"{rand.randint(1, 99)} {rand.randint(1, 99)}"
+        )
+        cond = f"{rand.randint(0, 99)} > {rand.randint(0, 99)}"
+        lines.append(rand.choice([call, f"WHILE {cond} THEN {call} END"]))
+    return "\n".join(lines) + "\n"
+
+
+def generate_nested(depth, seed=0):
+    """Create the source of a program with depth nested IF statements."""
+    rand = random.Random(seed)
+    head = "".join(
+        f"IF {rand.randint(50, 99)} > {rand.randint(0, 49)} THEN\n"
+        for _ in range(depth)
+    )
+    return head + "FORWARD 10\n" + "END\n" * depth
@@ -0,0 +1,172 @@
+"""Reparse Logo programs incrementally, after text edits.
+
+A document is split in regions, each starting at a top-level statement
+keyword. Statements inside IF, WHILE and TO blocks never start a region,
+so each region parses on its own. After an edit, only the regions around
+it are lexed and parsed again, and all other statements are reused.
+Each region holds several statements, to amortize the cost of each
+parser run.
+
+Line numbers of reused statements are the ones from the parse that
+created them.
+"""
+
+from bisect import bisect_right
+from itertools import chain
+
+from logo_lexer import lexer, reserved
+from logo_tree import parser
+from tree import Node
+
+OPEN = {"IF", "WHILE", "TO"}
+
+HEADS = (set(reserved) - {"THEN", "ELSE", "END", "AND", "OR"}) | {"IDENTIFIER"}
+
+
+def region_starts(text, lex, lineno=1, size=1):
+    """Return the offsets and lines where regions start in text.
+
+    Each region holds up to size top-level statements.
+    """
+    lex.input(text)
+    lex.lineno = lineno
+    starts = []
+    heads = 0
+    depth = 0
+    for token in lex:
+        kind = token.type
+        if depth == 0 and kind in HEADS:
+            if heads % size == 0:
+                starts.append((token.lexpos, token.lineno))
+            heads += 1
+        if kind in OPEN:
+            depth += 1
+        elif kind == "END":
+            depth -= 1
+            if depth < 0:
+                return None
+    if depth:
+        return None
+    # A text without statement keywords, such as "10 20", is one region.
+    if not starts:
+        return [(0, lineno)]
+    starts[0] = (0, lineno)
+    return starts
+
+
+class Document:
+    """A Logo program that can be edited and reparsed incrementally."""
+
+    def __init__(self, text, region_size=16):
+        """Parse the whole text."""
+        self.region_size = region_size
+        self.lexer = lexer()
+        self.parser = parser()
+        self.text = text
+        self.starts = []
+        self.regions = []
+        self.reparsed = 0
+        self.__program = None
+        self.__parse_all()
+
+    @property
+    def program(self):
+        """Return the program tree."""
+        if not self.regions:
+            raise SyntaxError("The last edit left the program invalid.")
+        if self.__program is None:
+            statements = tuple(chain.from_iterable(self.regions))
+            self.__program = Node(
+                "program", statements, lineno=statements[0].lineno
+            )
+        return self.__program
+
+    def edit(self, start, end, text):
+        """Replace text[start:end], reparsing only the damaged regions.
+
+        The new tree is built on the next access to the program property.
+        If the new text does not parse, the error is raised, the text is
+        still changed, and the next edit parses the whole text again.
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(f"Invalid edit range: {start}:{end}")
+        new_text = self.text[:start] + text + self.text[end:]
+        if not self.regions:
+            self.text = new_text
+            self.__parse_all()
+            return
+        try:
+            self.__reparse(new_text, start, end)
+        except Exception:
+            self.text = new_text
+            self.starts = []
+            self.regions = []
+            raise
+
+    def __parse_all(self):
+        """Parse the whole text."""
+        self.starts = []
+        self.regions = []
+        if not self.__replace(self.text, 0, 0, 0, len(self.text), 0):
+            raise SyntaxError("Unbalanced block in program.")
+
+    def __reparse(self, text, start, end):
+        """Reparse the regions damaged by an edit."""
+        delta = len(text) - len(self.text)
+        # The regions touching the edit, and one more on each side, since
+        # an edit can join a region with its neighbours.
+        first = max(0, bisect_right(self.starts, start) - 2)
+        last = min(len(self.starts), bisect_right(self.starts, end) + 1)
+        while True:
+            window_start = self.starts[first] if first else 0
+            if last < len(self.starts):
+                window_end = self.starts[last] + delta
+            else:
+                window_end = len(text)
+            if self.__replace(
+                text, first, last, window_start, window_end, delta
+            ):
+                return
+            if first == 0 and last == len(self.starts):
+                raise SyntaxError("Unbalanced block in program.")
+            first = max(0, first - (last - first))
+            last = min(len(self.starts), last + (last - first))
+
+    def __replace(self, text, first, last, window_start, window_end, delta):
+        """Reparse a window of text, replacing regions first to last."""
+        lineno = text.count("\n", 0, window_start) + 1
+        window = text[window_start:window_end]
+        starts = region_starts(window, self.lexer, lineno, self.region_size)
+        if starts is None:
+            return False
+        old = {}
+        for index in range(first, last):
+            region_end = (
+                self.starts[index + 1]
+                if index + 1 < len(self.starts)
+                else len(self.text)
+            )
+            old[self.text[self.starts[index]:region_end]] = self.regions[index]
+        regions = []
+        offsets = [start for start, _ in starts] + [len(window)]
+        for index, (start, region_line) in enumerate(starts):
+            source = window[start:offsets[index + 1]]
+            statements = old.get(source)
+            if statements is None:
+                self.lexer.lineno = region_line
+                program = self.parser.parse(source, lexer=self.lexer)
+                statements = program.children
+                self.reparsed += 1
+            regions.append(statements)
+        self.regions[first:last] = regions
+        self.starts[first:last] = [
+            window_start + start for start in offsets[:-1]
+        ]
+        if delta:
+            tail = first + len(starts)
+            self.starts[tail:] = [
+                start + delta for start in self.starts[tail:]
+            ]
+        self.text = text
+        self.__program = None
+        return True
@@ -0,0 +1,222 @@
+"""Index the segments of a Logo drawing, for viewport queries.
+
+The drawing is covered by a uniform grid, and each segment is listed in
+every cell its bounding box touches. Segments whose bounding box covers
+too many cells are kept apart, and checked by every query. The grid is
+built with NumPy, without a Python loop over the segments.
+
+Queries return indexes in the array of segments, which has one row of
+x0, y0, x1, y1 per segment.
+"""
+
+import numpy as np
+
+from logo_render import to_png, to_svg
+
+# Segments covering more cells than this are not stored in the grid.
+MAX_CELLS = 64
+
+
+class SegmentIndex:
+    """A uniform grid over the segments of a drawing."""
+
+    def __init__(self, segments, cell_size=None):
+        """Build the grid.
+
+        Segments are a sequence of Segment events, or an array with one
+        row per segment. By default, the cells are about as large as the
+        mean segment length, with a few segments per cell on average.
+        """
+        self.segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+        coords = self.segments
+        xs = coords[:, 0::2]
+        ys = coords[:, 1::2]
+        self.low = np.minimum(xs[:, 0], xs[:, 1]), np.minimum(
+            ys[:, 0], ys[:, 1]
+        )
+        self.high = np.maximum(xs[:, 0], xs[:, 1]), np.maximum(
+            ys[:, 0], ys[:, 1]
+        )
+        if len(coords):
+            self.origin = (self.low[0].min(), self.low[1].min())
+            extent = max(
+                self.high[0].max() - self.origin[0],
+                self.high[1].max() - self.origin[1],
+            )
+        else:
+            self.origin = (0.0, 0.0)
+            extent = 0.0
+        if cell_size is None:
+            lengths = np.hypot(xs[:, 1] - xs[:, 0], ys[:, 1] - ys[:, 0])
+            cell_size = float(lengths.mean()) if len(coords) else 1.0
+            # Keep the grid within about four cells per segment.
+            cell_size = max(cell_size, extent / max(1, 2 * len(coords)) ** 0.5)
+        self.cell_size = cell_size or 1.0
+        self.columns = int(extent // self.cell_size) + 1
+        self.rows = self.columns
+        self.__build()
+
+    def __cells(self, x, y):
+        """Return the cell column and row of coordinates, clipped."""
+        column = np.floor((x - self.origin[0]) / self.cell_size)
+        row = np.floor((y - self.origin[1]) / self.cell_size)
+        return (
+            np.clip(column, 0, self.columns - 1).astype(np.int64),
+            np.clip(row, 0, self.rows - 1).astype(np.int64),
+        )
+
+    def __build(self):
+        """Fill the grid, as sorted segment lists with cell offsets."""
+        column0, row0 = self.__cells(*self.low)
+        column1, row1 = self.__cells(*self.high)
+        widths = column1 - column0 + 1
+        counts = widths * (row1 - row0 + 1)
+        large = counts > MAX_CELLS
+        self.large = np.flatnonzero(large)
+        counts[large] = 0
+        ids = np.repeat(np.arange(len(counts)), counts)
+        # Position of each entry within the cells of its segment.
+        starts = np.cumsum(counts) - counts
+        offsets = np.arange(len(ids)) - np.repeat(starts, counts)
+        columns = column0[ids] + offsets % widths[ids]
+        rows = row0[ids] + offsets // widths[ids]
+        cells = rows * self.columns + columns
+        order = np.argsort(cells, kind="stable")
+        self.entries = ids[order]
+        self.offsets = np.zeros(self.rows * self.columns + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(cells, minlength=self.rows * self.columns),
+            out=self.offsets[1:],
+        )
+
+    def __len__(self):
+        """Return the number of segments."""
+        return len(self.segments)
+
+    def candidates(self, xmin, ymin, xmax, ymax):
+        """Return the segments listed in the cells touching a rectangle."""
+        if not len(self.segments):
+            return self.large
+        (column0, column1), (row0, row1) = self.__cells(
+            np.array([xmin, xmax]), np.array([ymin, ymax])
+        )
+        parts = [self.large]
+        for row in range(row0, row1 + 1):
+            first = row * self.columns
+            parts.append(
+                self.entries[
+                    self.offsets[first + column0] : self.offsets[
+                        first + column1 + 1
+                    ]
+                ]
+            )
+        return np.unique(np.concatenate(parts))
+
+    def __clip(self, xmin, ymin, xmax, ymax):
+        """Return the segments crossing a rectangle, and where they do.
+
+        Segment i crosses it from fraction start[i] to fraction end[i] of
+        its length, with Liang-Barsky clipping of all the candidates.
+        """
+        ids = self.candidates(xmin, ymin, xmax, ymax)
+        x0, y0, x1, y1 = self.segments[ids].T
+        dx = x1 - x0
+        dy = y1 - y0
+        start = np.zeros(len(ids))
+        end = np.ones(len(ids))
+        inside = np.ones(len(ids), dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for p, q in (
+                (-dx, x0 - xmin),
+                (dx, xmax - x0),
+                (-dy, y0 - ymin),
+                (dy, ymax - y0),
+            ):
+                parallel = p == 0
+                inside &= ~parallel | (q >= 0)
+                ratio = q / p
+                start = np.where(p < 0, np.maximum(start, ratio), start)
+                end = np.where(p > 0, np.minimum(end, ratio), end)
+        inside &= start <= end
+        return ids[inside], start[inside], end[inside]
+
+    def query(self, xmin, ymin, xmax, ymax):
+        """Return the sorted indexes of the segments crossing a rectangle."""
+        return self.__clip(xmin, ymin, xmax, ymax)[0]
+
+    def distances(self, ids, x, y):
+        """Return the distances from a point to some segments."""
+        x0, y0, x1, y1 = self.segments[ids].T
+        dx = x1 - x0
+        dy = y1 - y0
+        squared = dx * dx + dy * dy
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = ((x - x0) * dx + (y - y0) * dy) / squared
+        t = np.clip(np.nan_to_num(t), 0.0, 1.0)
+        return np.hypot(x0 + t * dx - x, y0 + t * dy - y)
+
+    def nearest(self, x, y, radius=None):
+        """Return (index, distance) of the segment nearest to a point.
+
+        Only segments within radius are considered, if it is given.
+        Return None when there is no such segment.
+        """
+        if not len(self.segments):
+            return None
+        search = self.cell_size
+        limit = radius
+        if limit is None:
+            limit = self.cell_size * max(self.rows, self.columns) * 2
+            limit += abs(x - self.origin[0]) + abs(y - self.origin[1])
+        while True:
+            search = min(search, limit)
+            ids = self.candidates(
+                x - search, y - search, x + search, y + search
+            )
+            if len(ids):
+                distances = self.distances(ids, x, y)
+                best = int(np.argmin(distances))
+                distance = float(distances[best])
+                # Any segment nearer than the best one crosses the square of
+                # that size, so searching that square finds the nearest.
+                if distance <= search:
+                    return int(ids[best]), distance
+                # A segment within limit may still be outside the square.
+                if search >= limit:
+                    return None
+                search = distance
+                continue
+            if search >= limit:
+                return None
+            search *= 2
+
+    def viewport(self, xmin, ymin, xmax, ymax):
+        """Return the segments crossing a rectangle, clipped to it.
+
+        Clipping keeps the PNG export from walking along the pixels of
+        long segments far outside the image.
+        """
+        ids, start, end = self.__clip(xmin, ymin, xmax, ymax)
+        x0, y0, x1, y1 = self.segments[ids].T
+        dx = x1 - x0
+        dy = y1 - y0
+        clipped = np.column_stack(
+            (x0 + start * dx, y0 + start * dy, x0 + end * dx, y0 + end * dy)
+        )
+        return [tuple(row) for row in clipped.tolist()]
+
+    def to_svg(self, xmin, ymin, xmax, ymax, **options):
+        """Return an SVG image of a rectangle of the drawing."""
+        return to_svg(
+            self.viewport(xmin, ymin, xmax, ymax),
+            view=(xmin, ymin, xmax, ymax),
+            **options,
+        )
+
+    def to_png(self, xmin, ymin, xmax, ymax, **options):
+        """Return a PNG image of a rectangle of the drawing."""
+        return to_png(
+            self.viewport(xmin, ymin, xmax, ymax),
+            view=(xmin, ymin, xmax, ymax),
+            **options,
+        )
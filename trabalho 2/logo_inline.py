@@ -0,0 +1,344 @@
+"""Inline and specialize Logo procedures.
+
+Calls to small, non-recursive procedures are replaced by the procedure
+body, with the arguments substituted for the parameters. Calls to other
+procedures with only constant arguments are redirected to a copy of the
+procedure specialized for those arguments. Conditions that become
+constant are folded, and procedures left without callers are removed.
+
+Only procedures defined once, at top level, and nowhere else are
+considered, and only calls made after the definition are rewritten.
+Bodies that define procedures themselves are never copied.
+
+Parameters are looked up through the call chain, so a procedure may read
+the parameters of its callers. A procedure whose callees read its own
+parameters needs its frame, and is neither inlined nor specialized.
+"""
+
+import operator
+
+from tree import Node, transform, walk
+
+COMPARE = {
+    "==": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+
+class InlineReport:
+    """Counters collected by the inlining pass."""
+
+    def __init__(self):
+        """Initialize counters."""
+        self.inlined = 0
+        self.specialized = 0
+        self.specializations = 0
+        self.removed = 0
+        self.calls_before = 0
+        self.calls_after = 0
+        self.loop_calls_before = 0
+        self.loop_calls_after = 0
+        self.size_before = 0
+        self.size_after = 0
+
+    def __str__(self):
+        """Format the report."""
+        return "\n".join(
+            [
+                f"call sites:          {self.calls_before} -> "
+                f"{self.calls_after}",
+                f"call sites in loops: {self.loop_calls_before} -> "
+                f"{self.loop_calls_after}",
+                f"calls inlined:       {self.inlined}",
+                f"calls specialized:   {self.specialized} "
+                f"({self.specializations} new procedures)",
+                f"procedures removed:  {self.removed}",
+                f"tree nodes:          {self.size_before} -> "
+                f"{self.size_after}",
+            ]
+        )
+
+
+def procedures(program):
+    """Return the procedures defined only once, at top level, by name.
+
+    A procedure also defined in a block or in another procedure body is
+    redefined at run time, so it is left out.
+    """
+    found = {}
+    for statement in program.children:
+        if statement.kind == "assign_expr":
+            found[statement.value] = statement
+    definitions = {}
+    for node in walk(program):
+        if node.kind == "assign_expr":
+            definitions[node.value] = definitions.get(node.value, 0) + 1
+    return {
+        name: statement
+        for name, statement in found.items()
+        if definitions[name] == 1
+    }
+
+
+def called(node):
+    """Return the names of the procedures called in a subtree."""
+    return {child.value for child in walk(node) if child.kind == "call"}
+
+
+def call_graph(program):
+    """Return, for each procedure, the procedures it calls."""
+    return {
+        name: called(procedure.children[1])
+        for name, procedure in procedures(program).items()
+    }
+
+
+def free_parameters(program):
+    """Return, for each procedure name, the parameters it reads from callers.
+
+    Parameters read by the procedures it calls, directly or not, count.
+    All the definitions of a name are merged.
+    """
+    bodies = {}
+    for node in walk(program):
+        if node.kind == "assign_expr":
+            bodies.setdefault(node.value, []).append(node)
+    reads = {}
+    callees = {}
+    for name, definitions in bodies.items():
+        reads[name] = set()
+        callees[name] = set()
+        for definition in definitions:
+            params, body = definition.children
+            for node in walk(body):
+                if node.kind == "param" and node.value not in params.value:
+                    reads[name].add(node.value)
+                elif node.kind == "call" and node.value in bodies:
+                    callees[name].add((node.value, params.value))
+    changed = True
+    while changed:
+        changed = False
+        for name, calls in callees.items():
+            for callee, params in calls:
+                new = reads[callee] - set(params) - reads[name]
+                if new:
+                    reads[name] |= new
+                    changed = True
+    return reads
+
+
+def recursive(graph):
+    """Return the procedures that can call themselves."""
+    result = set()
+    for name, callees in graph.items():
+        seen = set()
+        stack = list(callees)
+        while stack:
+            callee = stack.pop()
+            if callee == name:
+                result.add(name)
+                break
+            if callee not in seen and callee in graph:
+                seen.add(callee)
+                stack.extend(graph[callee])
+    return result
+
+
+def size(node):
+    """Return the number of nodes in a subtree."""
+    return sum(1 for _ in walk(node))
+
+
+def evaluate(condition):
+    """Return the value of a constant condition, or None."""
+    left, right = condition.children
+    if condition.value in ("AND", "OR"):
+        first, second = evaluate(left), evaluate(right)
+        if condition.value == "AND":
+            if first is False or second is False:
+                return False
+            return True if first and second else None
+        if first or second:
+            return True
+        return False if first is False and second is False else None
+    if left.kind != "value_expr" or right.kind != "value_expr":
+        return None
+    return COMPARE[condition.value](left.value, right.value)
+
+
+def fold(node, children):
+    """Replace an IF statement with a constant condition by its branch."""
+    if node.kind == "if_stmt":
+        value = evaluate(children[0])
+        if value is True:
+            return children[1]
+        if value is False and len(children) == 3:
+            return children[2]
+    return None
+
+
+def substitute(body, bindings):
+    """Replace parameter references in body by their bound values."""
+    return transform(
+        body,
+        lambda node, _: bindings.get(node.value)
+        if node.kind == "param"
+        else None,
+    )
+
+
+def __loop_calls(program):
+    return sum(
+        len([child for child in walk(node) if child.kind == "call"])
+        for node in walk(program)
+        if node.kind == "loop_stmt"
+    )
+
+
+def inline(program, budget=20, max_specializations=100, remove_unused=True):
+    """Inline and specialize procedure calls in a program.
+
+    Procedures with bodies up to budget nodes are inlined. Return the new
+    program and an InlineReport.
+    """
+    report = InlineReport()
+    report.calls_before = len(
+        [node for node in walk(program) if node.kind == "call"]
+    )
+    report.loop_calls_before = __loop_calls(program)
+    report.size_before = size(program)
+
+    defined = procedures(program)
+    graph = call_graph(program)
+    recursive_names = recursive(graph)
+    free = free_parameters(program)
+    # Procedures whose callees read their parameters keep their frame.
+    defined = {
+        name: procedure
+        for name, procedure in defined.items()
+        if not any(
+            set(procedure.children[0].value) & free[callee]
+            for callee in graph[name]
+            if callee in free
+        )
+    }
+    inlinable = {
+        name
+        for name, procedure in defined.items()
+        if name not in recursive_names
+        and size(procedure.children[1]) <= budget
+        and not any(
+            node.kind == "assign_expr"
+            for node in walk(procedure.children[1])
+        )
+    }
+    # A call can only be rewritten if it runs after the definition: it
+    # must be in a later top-level statement than the procedure.
+    defined_at = {
+        statement.value: index
+        for index, statement in enumerate(program.children)
+        if statement.kind == "assign_expr" and statement.value in defined
+    }
+    position = 0
+    specialized = {}
+    new_procedures = {}
+
+    def rewrite_call(node, children):
+        nonlocal position
+        if node.kind != "call":
+            return fold(node, children)
+        procedure = defined.get(node.value)
+        if procedure is None or defined_at[node.value] >= position:
+            return None
+        params, body = procedure.children
+        if len(params.value) != len(children):
+            return None
+        bindings = dict(zip(params.value, children))
+        if node.value in inlinable:
+            report.inlined += 1
+            return rewrite(substitute(body, bindings))
+        if not children:
+            return None
+        if any(arg.kind != "value_expr" for arg in children):
+            return None
+        key = (node.value, tuple(arg.value for arg in children))
+        name = specialized.get(key)
+        if name is None:
+            if len(specialized) >= max_specializations:
+                return None
+            name = "_".join(map(str, key[0:1] + key[1]))
+            specialized[key] = name
+            # The copy is defined next to the procedure, and may be
+            # called from there on.
+            caller, position = position, defined_at[node.value]
+            new_body = rewrite(substitute(body, bindings))
+            position = caller
+            new_procedures.setdefault(node.value, []).append(
+                Node(
+                    "assign_expr",
+                    (Node("arguments", value=()), new_body),
+                    value=name,
+                    lineno=procedure.lineno,
+                )
+            )
+        report.specialized += 1
+        return Node("call", value=name, lineno=node.lineno)
+
+    def rewrite(node):
+        return transform(node, rewrite_call)
+
+    statements = []
+    for position, statement in enumerate(program.children):
+        statement = rewrite(statement)
+        if statement.kind in ("if_stmt", "loop_stmt"):
+            if evaluate(statement.children[0]) is False:
+                if len(statement.children) < 3:
+                    continue
+        statements.append(statement)
+    report.specializations = len(specialized)
+
+    result = []
+    for statement in statements:
+        result.append(statement)
+        if statement.kind == "assign_expr":
+            result.extend(new_procedures.get(statement.value, ()))
+
+    if remove_unused:
+        result = __remove_unused(result, report)
+
+    program = Node("program", tuple(result), lineno=program.lineno)
+    report.calls_after = len(
+        [node for node in walk(program) if node.kind == "call"]
+    )
+    report.loop_calls_after = __loop_calls(program)
+    report.size_after = size(program)
+    return program, report
+
+
+def __remove_unused(statements, report):
+    bodies = {
+        statement.value: statement.children[1]
+        for statement in statements
+        if statement.kind == "assign_expr"
+    }
+    used = set()
+    pending = set()
+    for statement in statements:
+        if statement.kind != "assign_expr":
+            pending |= called(statement)
+    while pending:
+        name = pending.pop()
+        if name not in used:
+            used.add(name)
+            if name in bodies:
+                pending |= called(bodies[name])
+    kept = [
+        statement
+        for statement in statements
+        if statement.kind != "assign_expr" or statement.value in used
+    ]
+    report.removed = len(statements) - len(kept)
+    return kept
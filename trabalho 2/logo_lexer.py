@@ -1,7 +1,5 @@
 from ply import lex
 
-symtable = {}
-
 symtable_types = {'FUNC': 1, 'PARAM': 2}
 
 logical = [
@@ -44,14 +42,14 @@ def t_IDENTIFIER(t):
 
     if t.type == 'IDENTIFIER':
         try:
-            symtable[t.value]
+            t.lexer.symtable[t.value]
         except:
-            symtable[t.value] = { symtable_types['FUNC'], None}
+            t.lexer.symtable[t.value] = { symtable_types['FUNC'], None}
     return t
 
 def t_ARGUMENT(t):
     r':[A-Z][A-Z]*'
-    symtable[t.value] = { symtable_types['PARAM'], None }
+    t.lexer.symtable[t.value] = { symtable_types['PARAM'], None }
     return t
 
 def t_newline(t):
@@ -59,38 +57,52 @@ def t_newline(t):
     t.lexer.lineno += len(t.value)
 
 def t_error(t):
-    print("Illegal character '%s'" % t.value[0])
+    message = "Illegal character '%s'" % t.value[0]
+    # Lexers with a report callback collect errors instead of printing them.
+    report = getattr(t.lexer, 'report', None)
+    if report is None:
+        print(message)
+    else:
+        report('lexical', t, message)
     t.lexer.skip(1)
 
 def lexer():
-    """Create a new lexer object."""
-    return lex.lex()
-
-# Test it out
-data = '''
-    TO ABC :PARAM FORWARD 10 END
-    WHILE 2 > 1 THEN FORWARD 10 END
-    IF 10 > 5 AND 15 > 10 THEN 
-        FORWARD 10
-    END
-    IF 10 > 5 AND 15 > 10 THEN 
+    """Create a new lexer object, with its own table of names."""
+    the_lexer = lex.lex()
+    the_lexer.symtable = {}
+    return the_lexer
+
+def reset(the_lexer):
+    """Prepare a lexer for a new program."""
+    the_lexer.lineno = 1
+    the_lexer.symtable.clear()
+
+if __name__ == "__main__":
+    # Test it out
+    data = '''
+        TO ABC :PARAM FORWARD 10 END
+        WHILE 2 > 1 THEN FORWARD 10 END
+        IF 10 > 5 AND 15 > 10 THEN 
+            FORWARD 10
+        END
+        IF 10 > 5 AND 15 > 10 THEN 
+            FORWARD 10
+        ELSE
+            FORWARD 20
+        END
+        CLEARSCREEN
         FORWARD 10
-    ELSE
-        FORWARD 20
-    END
-    CLEARSCREEN
-    FORWARD 10
-    BK 25
-    RIGHT 30
-    LEFT 20
-    PENUP
-    RANDOM
-    SETXY 10 20
-'''
-
-# Give the lexer some input
-the_lexer = lexer()
-the_lexer.input(data)
-
-for token in the_lexer:
-    print(token)
\ No newline at end of file
+        BK 25
+        RIGHT 30
+        LEFT 20
+        PENUP
+        RANDOM
+        SETXY 10 20
+    '''
+
+    # Give the lexer some input
+    the_lexer = lexer()
+    the_lexer.input(data)
+
+    for token in the_lexer:
+        print(token)
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""Load test for logo_service.
+
+Usage: python logo_loadtest.py [-c CLIENTS] [-n REQUESTS] [--distinct N]
+
+Each client opens one connection and sends its requests one after the
+other. Sources are generated programs, repeated so that some requests
+hit the cache. Without --port or --unix, a service is started in this
+process on a free port.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from functools import partial
+
+from logo_gen import generate_program
+from logo_service import FORMATS, RenderService, request
+
+
+async def client(connect, sources, requests, seed, latencies, errors):
+    """Send requests on one connection, recording their latencies."""
+    rand = random.Random(seed)
+    reader, writer = await connect()
+    try:
+        for _ in range(requests):
+            source = rand.choice(sources)
+            output_format = rand.choice(FORMATS)
+            start = time.perf_counter()
+            header, _ = await request(reader, writer, output_format, source)
+            latencies.append(time.perf_counter() - start)
+            if header["status"] != "ok":
+                errors.append(header.get("message"))
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run(options):
+    """Run the clients, and print the latencies and throughput."""
+    sources = [
+        generate_program(options.statements, seed)
+        for seed in range(options.distinct)
+    ]
+    service = server = None
+    if options.unix:
+        connect = partial(asyncio.open_unix_connection, options.unix)
+    else:
+        port = options.port
+        if port is None:
+            service = RenderService(jobs=options.jobs)
+            server = await service.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+        connect = partial(asyncio.open_connection, options.host, port)
+
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *(
+                client(
+                    connect, sources, options.requests, seed, latencies, errors
+                )
+                for seed in range(options.clients)
+            )
+        )
+    finally:
+        if server is not None:
+            server.close()
+            await service.wait_closed()
+            service.close()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"requests:   {len(latencies)} ({len(errors)} errors)")
+    print(f"throughput: {len(latencies) / elapsed:.1f} requests/s")
+    print(
+        f"latency:    median {statistics.median(latencies) * 1000:.2f} ms,"
+        f" p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms,"
+        f" max {latencies[-1] * 1000:.2f} ms"
+    )
+    if service is not None:
+        cache = service.cache
+        print(
+            f"cache:      {cache.hits} hits, {cache.misses} misses, "
+            f"{len(cache)} entries, {cache.size:,} bytes"
+        )
+    for error in sorted(set(errors))[:10]:
+        print(f"error:      {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    """Run the load test."""
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument("-c", "--clients", type=int, default=16)
+    args.add_argument(
+        "-n", "--requests", type=int, default=50, help="requests per client"
+    )
+    args.add_argument(
+        "--distinct", type=int, default=40, help="number of distinct programs"
+    )
+    args.add_argument(
+        "--statements", type=int, default=200, help="statements per program"
+    )
+    args.add_argument("--host", default="127.0.0.1")
+    args.add_argument("--port", type=int)
+    args.add_argument("--unix", help="Unix socket path")
+    args.add_argument(
+        "-j", "--jobs", type=int, help="processes of the local service"
+    )
+    options = args.parse_args(argv)
+    return asyncio.run(run(options))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
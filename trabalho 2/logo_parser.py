@@ -1,18 +1,24 @@
-from symtable import add_symbol, get_symbol
+import sys
+
+from symtable import SymbolTable
 
 from ply import yacc
 
-from logo_lexer import lexer, tokens
+from emitter import emit, join
+
+from logo_lexer import lexer, reset, tokens
+
+# Tables are built in memory, as parsetab.py holds the logo_tree ones.
+TABMODULE = "parsetab_pseudo"
 
 
 def p_program(prod):
     """program : expression other_expression"""
-    add_symbol('angle', 'CONST', None, value=0)
-    statements = [prod[1]]
-    if prod[2]:
-        statements.extend(prod[2])
-    prod[0] = statements
-    print("\n".join(str(s) for s in statements))
+    prod.parser.symtable.add_symbol('angle', 'CONST', None, value=0)
+    statements = prod[2] or []
+    statements.append(prod[1])
+    statements.reverse()
+    prod[0] = join("\n", statements)
 
 
 def p_another_statement(prod):
@@ -20,10 +26,10 @@ def p_another_statement(prod):
     other_expression : expression other_expression
         | empty
     """
-    if prod[1]:
-        statements = [prod[1]]
-        if prod[2]:
-            statements.extend(prod[2])
+    if prod[1] is not None:
+        # Statements are collected in reverse order, p_program fixes it.
+        statements = prod[2] or []
+        statements.append(prod[1])
         prod[0] = statements
 
 
@@ -51,11 +57,13 @@ def p_draw_segment(prod):
         | BACKWARD value_expr 
     """
     if prod[1] == 'FORWARD' or prod[1] == 'FO':
-        prod[0] = f'Turtle.draw_segment(angle, {prod[2]})'
+        prod[0] = ('Turtle.draw_segment(angle, ', prod[2], ')')
     elif prod[1] == 'BACKWARD' or prod[1] == 'BK':
-        prod[0] = f'angle = angle + 180 | '
-        prod[0] += f'if angle > 360 then angle = angle - 360 | '
-        prod[0] += f'Turtle.draw_segment(angle, {prod[2]})'
+        prod[0] = (
+            'angle = angle + 180 | ',
+            'if angle > 360 then angle = angle - 360 | ',
+            'Turtle.draw_segment(angle, ', prod[2], ')',
+        )
     
 
 def p_set_position(prod):
@@ -66,13 +74,17 @@ def p_set_position(prod):
         | HOME
     """
     if prod[1] == 'RIGHT' or prod[1] == 'RT':
-        prod[0] = f'angle = angle + {prod[2]} | '
-        prod[0] += f'if angle > 360 then angle = angle - 360 | '
-        prod[0] += f'Turtle.set_position(angle, 0)'
+        prod[0] = (
+            'angle = angle + ', prod[2], ' | ',
+            'if angle > 360 then angle = angle - 360 | ',
+            'Turtle.set_position(angle, 0)',
+        )
     elif prod[1] == 'LEFT' or prod[1] == 'LT':
-        prod[0] = f'angle = angle + {prod[2]} | '
-        prod[0] += f'if angle < 0 then angle = angle + 360 | '
-        prod[0] += f'Turtle.set_position(angle, {prod[2]})'
+        prod[0] = (
+            'angle = angle + ', prod[2], ' | ',
+            'if angle < 0 then angle = angle + 360 | ',
+            'Turtle.set_position(angle, ', prod[2], ')',
+        )
     else:
         prod[0] = 'Turtle.set_position(angle, 0)'
 
@@ -101,7 +113,7 @@ def p_screen(prod):
 
 def p_set_x_y(prod):
     """logo_expr : SETXY value_expr value_expr"""
-    prod[0] = f'Turtle.set_position({prod[2]}, {prod[3]})'
+    prod[0] = ('Turtle.set_position(', prod[2], ', ', prod[3], ')')
 
 
 def p_get_position(prod):
@@ -112,9 +124,9 @@ def p_get_position(prod):
     if prod[1] == 'HEADING':
         prod[0] = 'Turtle.get_position()'
     elif prod[1] == 'XCOR':
-        prod[0] = f'Turtle.get_x_position({prod[2]})'
+        prod[0] = ('Turtle.get_x_position(', prod[2], ')')
     elif prod[1] == 'YCOR':
-        prod[0] = f'Turtle.get_y_position({prod[2]})'
+        prod[0] = ('Turtle.get_y_position(', prod[2], ')')
 
 
 def p_random(prod):
@@ -138,21 +150,23 @@ def p_if(prod):
     '''
         if_stmt : IF bool_expr THEN expression END
     '''
-    prod[0] = f'IF {prod[2]} THEN {prod[4]} END'
+    prod[0] = ('IF ', prod[2], ' THEN ', prod[4], ' END')
 
 
 def p_if_else(prod):
     '''
         if_stmt : IF bool_expr THEN expression ELSE expression END
     '''
-    prod[0] = f'IF {prod[2]} THEN {prod[4]} ELSE {prod[6]} END'
+    prod[0] = (
+        'IF ', prod[2], ' THEN ', prod[4], ' ELSE ', prod[6], ' END'
+    )
 
 
 def p_loop(prod):
     '''
         loop_stmt : WHILE bool_expr THEN expression END
     '''
-    prod[0] = f'WHILE {prod[2]} THEN {prod[4]} END'
+    prod[0] = ('WHILE ', prod[2], ' THEN ', prod[4], ' END')
 
 
 def p_bool_expr(prod):
@@ -163,20 +177,32 @@ def p_bool_expr(prod):
         | value_expr GREATEQ value_expr
         | value_expr LOWEQ value_expr
     '''
-    prod[0] = f'{prod[1]} {prod[2]} {prod[3]}'
+    prod[0] = (prod[1], ' ', prod[2], ' ', prod[3])
 
 
 def p_one_more_bool_expr(prod):
     '''
         bool_expr : bool_expr bool_expr_operator bool_expr
     '''
-    prod[0] = f'{prod[1]} {prod[2]} {prod[3]}'
+    prod[0] = (prod[1], ' ', prod[2], ' ', prod[3])
 
 
 def p_assign(prod):
-    '''assign_expr : TO IDENTIFIER params expression END'''
-    add_symbol(prod[2], 'FUNC', prod.lineno(2), value=prod[4])
-    prod[0] = f'{prod[1]} {prod[2]} {prod[3]} {prod[4]} {prod[5]}'
+    '''assign_expr : TO IDENTIFIER procedure_scope params expression END'''
+    symtable = prod.parser.symtable
+    for param in prod[4].split():
+        symtable.add_symbol(param, 'PARAM', prod.lineno(2))
+    symtable.pop_scope()
+    symtable.set_symbol(prod[2], value=prod[5])
+    prod[0] = join(' ', prod[1:3] + prod[4:7])
+
+
+def p_procedure_scope(prod):
+    '''procedure_scope :'''
+    name = prod.stack[-1]
+    symtable = prod.parser.symtable
+    symtable.add_symbol(name.value, 'FUNC', name.lineno, value=None)
+    symtable.push_scope()
 
 
 def p_param(prod):
@@ -198,6 +224,31 @@ def p_error(token):
     raise Exception("Syntax error at EOF.")
 
 
+def parser():
+    """Create a new parser object."""
+    the_parser = yacc.yacc(
+        start="program", tabmodule=TABMODULE, write_tables=False, debug=False
+    )
+    the_parser.symtable = SymbolTable()
+    return the_parser
+
+
+def compile_program(source, the_parser, the_lexer, output=None):
+    """Compile a program, with fresh symbol tables.
+
+    The generated code is streamed to output, sys.stdout by default, and
+    the rope holding it is returned.
+    """
+    if output is None:
+        output = sys.stdout
+    the_parser.symtable.reset()
+    reset(the_lexer)
+    program = the_parser.parse(source, lexer=the_lexer, tracking=False)
+    emit(program, output)
+    output.write("\n")
+    return program
+
+
 if __name__ == "__main__":
     SOURCE = '''
         TO ABC :TESTE :OUTROPARAM 
@@ -221,7 +272,5 @@ if __name__ == "__main__":
         RANDOM
         SETXY 10 20
     '''
-    mylex = lexer()
-    parser = yacc.yacc(start="program")
-    program = parser.parse(SOURCE, lexer=mylex, tracking=False)
+    program = compile_program(SOURCE, parser(), lexer())
 
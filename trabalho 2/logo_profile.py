@@ -0,0 +1,239 @@
+"""Profile the execution of Logo programs, statement by statement.
+
+Usage: python logo_profile.py [-n LIMIT] [--max-steps STEPS] [-o FOLDED] FILE
+
+A Profiler passed to logo_exec.Execution records, for each statement and
+for each procedure, the number of times it ran, the time spent in it and
+in the statements it ran, and the segments it drew. Time spent by the
+consumer of the events is not counted. Procedures are reported at the
+line of their TO definition.
+
+The folded-stack output has one line per call stack, with the frames
+separated by semicolons and the time spent in the last frame, in
+microseconds, as expected by flamegraph.pl and speedscope.
+"""
+
+import argparse
+import sys
+import time
+
+from logo_exec import BudgetExceeded, Execution
+from logo_lexer import lexer
+from logo_tree import parser
+
+
+class Stats:
+    """Counters recorded for a statement or a procedure."""
+
+    __slots__ = ("label", "lineno", "hits", "time", "self_time", "segments")
+
+    def __init__(self, label, lineno):
+        """Initialize counters."""
+        self.label = label
+        self.lineno = lineno
+        self.hits = 0
+        self.time = 0.0
+        self.self_time = 0.0
+        self.segments = 0
+
+
+def label(node):
+    """Return the name of a statement in reports and stacks."""
+    if node.kind in ("logo_function", "call"):
+        return node.value
+    if node.kind == "assign_expr":
+        return f"TO {node.value}"
+    if node.kind == "loop_stmt":
+        return "WHILE"
+    if node.kind == "if_stmt":
+        return "IF"
+    return node.kind
+
+
+class Profiler:
+    """Statement-level profiler for logo_exec."""
+
+    def __init__(self, clock=time.perf_counter, max_depth=256):
+        """Initialize an empty profile.
+
+        Frames deeper than max_depth are merged with their parent in the
+        folded stacks, to bound their size under deep recursion.
+        """
+        self.clock = clock
+        self.max_depth = max_depth
+        self.statements = {}
+        self.procedures = {}
+        # Line of the definition of each procedure, when it last ran.
+        self.definitions = {}
+        self.paths = {}
+        self.folded = []
+        self.stack = []
+        self.active = {}
+        self.suspended = 0.0
+        self.paused_at = None
+
+    def now(self):
+        """Return the clock, without the time the execution was paused."""
+        return self.clock() - self.suspended
+
+    def pause(self):
+        """Stop counting time, while the consumer handles an event."""
+        self.paused_at = self.clock()
+
+    def resume(self):
+        """Start counting time again."""
+        self.suspended += self.clock() - self.paused_at
+        self.paused_at = None
+
+    def enter(self, node):
+        """Start running a statement."""
+        stats = self.statements.get(id(node))
+        if stats is None:
+            stats = self.statements[id(node)] = Stats(label(node), node.lineno)
+        stats.hits += 1
+        self.active[id(node)] = self.active.get(id(node), 0) + 1
+        if node.kind == "assign_expr":
+            self.definitions[node.value] = node.lineno
+        elif node.kind == "call":
+            procedure = self.procedures.get(node.value)
+            if procedure is None:
+                procedure = self.procedures[node.value] = Stats(
+                    node.value, self.definitions.get(node.value)
+                )
+            procedure.hits += 1
+            key = ("call", node.value)
+            self.active[key] = self.active.get(key, 0) + 1
+        parent = self.stack[-1][4] if self.stack else -1
+        if len(self.stack) < self.max_depth:
+            frame = (parent, f"{stats.label}:{stats.lineno}")
+            path = self.paths.get(frame)
+            if path is None:
+                path = self.paths[frame] = len(self.folded)
+                self.folded.append([frame, 0.0])
+        else:
+            path = parent
+        # node, stats, start, time in children, stack path, segments
+        self.stack.append([node, stats, self.now(), 0.0, path, 0])
+
+    def exit(self):
+        """Finish running the innermost statement."""
+        node, stats, start, children, path, segments = self.stack.pop()
+        elapsed = self.now() - start
+        self_time = elapsed - children
+        key = id(node)
+        self.active[key] -= 1
+        # Time in recursive calls is only counted by the outermost one.
+        outermost = not self.active[key]
+        if outermost:
+            stats.time += elapsed
+        stats.self_time += self_time
+        stats.segments += segments
+        if node.kind == "call":
+            procedure = self.procedures[node.value]
+            procedure.segments += segments
+            procedure.self_time += self_time
+            key = ("call", node.value)
+            self.active[key] -= 1
+            if not self.active[key]:
+                procedure.time += elapsed
+        self.folded[path][1] += self_time
+        if self.stack:
+            self.stack[-1][3] += elapsed
+            self.stack[-1][5] += segments
+
+    def segment(self):
+        """Count a segment drawn by the innermost statement."""
+        if self.stack:
+            self.stack[-1][5] += 1
+
+    def finish(self):
+        """Finish all running statements, e.g. when execution stops."""
+        if self.paused_at is not None:
+            self.resume()
+        while self.stack:
+            self.exit()
+
+    def hotspots(self, limit=None):
+        """Return the statement stats, by decreasing time."""
+        stats = sorted(
+            self.statements.values(),
+            key=lambda item: (-item.time, -item.self_time),
+        )
+        return stats[:limit]
+
+    def report(self, limit=20):
+        """Format the hotspots and the procedures as a table."""
+        lines = [
+            f"{'statement':<24} {'line':>6} {'hits':>10} {'time ms':>10} "
+            f"{'self ms':>10} {'segments':>10}"
+        ]
+        for stats in self.hotspots(limit):
+            lines.append(self.__row(stats))
+        if self.procedures:
+            lines.append("")
+            lines.append(f"{'procedure':<24}")
+            procedures = sorted(
+                self.procedures.values(), key=lambda item: -item.time
+            )
+            for stats in procedures[:limit]:
+                lines.append(self.__row(stats))
+        return "\n".join(lines)
+
+    @staticmethod
+    def __row(stats):
+        lineno = "" if stats.lineno is None else stats.lineno
+        return (
+            f"{stats.label[:24]:<24} {lineno:>6} {stats.hits:>10} "
+            f"{stats.time * 1000:>10.3f} {stats.self_time * 1000:>10.3f} "
+            f"{stats.segments:>10}"
+        )
+
+    def write_folded(self, output):
+        """Write the folded stacks to a file object."""
+        names = []
+        for (parent, frame), _ in self.folded:
+            frame = frame.replace(" ", "_")
+            names.append(f"{names[parent]};{frame}" if parent >= 0 else frame)
+        for name, (_, elapsed) in sorted(zip(names, self.folded)):
+            microseconds = round(elapsed * 1e6)
+            if microseconds:
+                output.write(f"{name} {microseconds}\n")
+
+
+def main(argv=None):
+    """Profile a Logo program."""
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument("path", help="Logo source file")
+    args.add_argument("-n", "--limit", type=int, default=20)
+    args.add_argument("-o", "--folded", help="folded-stack output file")
+    args.add_argument(
+        "--max-steps",
+        type=int,
+        default=1_000_000,
+        help="stop after this many statements",
+    )
+    options = args.parse_args(argv)
+
+    with open(options.path, encoding="utf-8") as source:
+        program = parser().parse(source.read(), lexer=lexer())
+    profiler = Profiler()
+    execution = Execution(
+        program,
+        max_steps=options.max_steps,
+        detect_cycles=False,
+        profiler=profiler,
+    )
+    try:
+        for _ in execution.events():
+            pass
+    except BudgetExceeded as error:
+        print(error, file=sys.stderr)
+    print(profiler.report(options.limit))
+    if options.folded:
+        with open(options.folded, "w", encoding="utf-8") as output:
+            profiler.write_folded(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
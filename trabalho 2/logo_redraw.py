@@ -0,0 +1,372 @@
+"""Render Logo drawings again, incrementally, after program edits.
+
+Each top-level statement is executed on its own, from the turtle state
+left by the previous one, and its result is cached by the statement, the
+turtle state at its entry (x, y, heading, pen) and the procedures it can
+call. After an edit, the statements before the first changed one keep
+their results, and execution resumes from there. A later statement that
+starts from the same state as before reuses its cached segments, and once
+the state is the same as before the edit, all remaining statements are
+reused without looking them up.
+
+The image is a square PNG of a fixed view, divided in tiles. Only the
+tiles touched by the segments that were removed or added are redrawn,
+unless the edit adds or removes the last CLEARSCREEN, which redraws the
+whole image.
+
+The segment budget counts the visible segments, as logo_render.drawing
+does, so erasing the screen makes the whole budget available again. A
+statement cut by the budget ends the drawing, as does a loop that
+repeats the same segments forever.
+"""
+
+from collections import Counter, OrderedDict, defaultdict
+
+from logo_exec import Clear, Execution, Periodic, Segment
+from logo_render import bounds, encode_png, line, to_svg
+from tree import Node
+
+TILE_SIZE = 64
+
+INITIAL = (0.0, 0.0, 0.0, True)
+
+
+class _Result:
+    """The cached execution of a statement from an entry state."""
+
+    __slots__ = (
+        "key",
+        "segments",
+        "count",
+        "exit",
+        "procedures",
+        "finished",
+        "limit",
+        "clears",
+        "tiles",
+    )
+
+    def __init__(self, key, segments, count, exit_state, procedures):
+        self.key = key
+        self.segments = segments
+        # Segments drawn before the first erase, which use the budget left
+        # at the entry.
+        self.count = count
+        self.exit = exit_state
+        self.procedures = procedures
+        self.finished = True
+        self.limit = None
+        self.clears = False
+        self.tiles = None
+
+
+class Drawing:
+    """The image of a program, rendered again as the program changes."""
+
+    def __init__(
+        self,
+        view=None,
+        size=512,
+        margin=8,
+        tile_size=TILE_SIZE,
+        max_segments=100_000,
+        max_steps=2_000_000,
+        cache_size=65536,
+    ):
+        """Create an empty drawing.
+
+        The view is the rectangle (min x, min y, max x, max y) shown in
+        the image. By default, it is the bounds of the first drawing, and
+        it is kept for the following ones.
+        """
+        self.view = view
+        self.size = size
+        self.margin = margin
+        self.tile_size = tile_size
+        self.max_segments = max_segments
+        self.max_steps = max_steps
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.statements = ()
+        self.results = []
+        # Index of the last result erasing the screen.
+        self.clear = -1
+        # Visible segments before each result.
+        self.counts = []
+        self.pixels = bytearray(b"\xff" * (size * size))
+        self.coverage = defaultdict(Counter)
+        self.dirty = set()
+        self.executed = 0
+        self.reused = 0
+
+    def update(self, program):
+        """Render a new version of the program.
+
+        Return the tiles redrawn, as (column, row) pairs. If the program
+        raises an ExecutionError, the drawing is left unchanged.
+        """
+        statements = program.children
+        old = self.results
+        old_statements = self.statements
+        first = 0
+        common = min(len(old), len(statements))
+        while first < common and statements[first] == old_statements[first]:
+            first += 1
+        suffix = 0
+        while suffix < common - first and (
+            statements[-1 - suffix] == old_statements[-1 - suffix]
+        ):
+            suffix += 1
+        shift = len(statements) - len(old_statements)
+        results = old[:first]
+        counts = self.counts[:first]
+        if results:
+            last = results[-1]
+            state, procedures = last.exit, last.procedures
+            count = self.__visible(counts[-1], last)
+        else:
+            state, procedures, count = INITIAL, frozenset(), 0
+        self.executed = self.reused = 0
+        end = len(statements)
+        old_end = len(old)
+        index = first
+        while index < len(statements) and (
+            not results or results[-1].finished
+        ):
+            key = (statements[index], state, procedures)
+            previous = index - shift
+            if (
+                index >= len(statements) - suffix
+                and previous < len(old)
+                and old[previous].key == key
+                and self.counts[previous] == count
+            ):
+                # Same statements from the same state: the rest is the same.
+                end, old_end = index, previous
+                self.reused += len(old) - previous
+                results.extend(old[previous:])
+                counts.extend(self.counts[previous:])
+                break
+            if self.max_segments is None:
+                result = self.__result(key, None)
+            else:
+                result = self.__result(key, self.max_segments - count)
+            results.append(result)
+            counts.append(count)
+            state, procedures = result.exit, result.procedures
+            count = self.__visible(count, result)
+            index += 1
+        else:
+            end = len(results)
+        self.__render(results, first, old_end, end)
+        self.statements = statements
+        self.results = results
+        self.counts = counts
+        return self.dirty
+
+    @staticmethod
+    def __visible(count, result):
+        """Return the visible segments after a result, from count before."""
+        if result.clears:
+            return len(result.segments)
+        return count + len(result.segments)
+
+    def __result(self, key, remaining):
+        """Return the result of a statement, from the cache if possible.
+
+        Remaining is the number of segments left in the budget, or None.
+        """
+        result = self.cache.get(key)
+        # Results cut by the budget are only valid for the same budget.
+        if result is not None and (
+            result.limit == remaining
+            if result.limit is not None
+            else remaining is None or result.count <= remaining
+        ):
+            self.cache.move_to_end(key)
+            self.reused += 1
+            return result
+        result = self.__execute(key, remaining)
+        self.executed += 1
+        self.cache[key] = result
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return result
+
+    def __execute(self, key, remaining):
+        """Run a statement from an entry state."""
+        statement, state, procedures = key
+        execution = Execution(
+            Node("program", (statement,), lineno=statement.lineno),
+            max_steps=self.max_steps,
+            start=state,
+            procedures=procedures,
+        )
+        events = execution.events()
+        segments = []
+        count = 0
+        finished = True
+        clears = False
+        limit = None
+        budget = remaining
+        for event in events:
+            kind = type(event)
+            if kind is Segment:
+                if len(segments) == budget:
+                    finished = False
+                    if not clears:
+                        limit = remaining
+                    break
+                if not clears:
+                    count += 1
+                segments.append(event)
+            elif kind is Clear:
+                segments.clear()
+                clears = True
+                budget = self.max_segments
+            elif kind is Periodic and not (event.dx or event.dy):
+                finished = False
+                break
+        events.close()
+        if execution.generation:
+            procedures = frozenset(execution.procedures.items())
+        result = _Result(key, segments, count, execution.state(), procedures)
+        result.finished = finished
+        result.limit = limit
+        result.clears = clears
+        return result
+
+    def __render(self, results, first, old_end, end):
+        """Redraw the tiles changed by replacing results first to old_end.
+
+        The new results from first to end replace them.
+        """
+        old_clear = self.clear
+        if old_clear >= old_end:
+            new_clear = old_clear - old_end + end
+        else:
+            new_clear = self.__last_clear(results, first, end)
+            if new_clear < 0:
+                new_clear = self.__last_clear(results, 0, first)
+        self.clear = new_clear
+        self.dirty = set()
+        if self.view is None:
+            self.view = bounds(self.segments(results))
+            self.__redraw_all(results)
+        elif old_clear < first and new_clear < first:
+            changes = Counter(results[first:end])
+            changes.subtract(self.results[first:old_end])
+            for result, change in changes.items():
+                if change:
+                    self.__cover(result, change)
+            for tile in self.dirty:
+                self.__redraw(tile)
+        elif old_clear < old_end or new_clear < end:
+            # The last CLEARSCREEN changed, and so did the visible results.
+            self.__redraw_all(results)
+
+    @staticmethod
+    def __last_clear(results, start, stop):
+        """Return the index of the last result erasing the screen, or -1.
+
+        Only the results from start to stop are searched.
+        """
+        for index in range(stop - 1, start - 1, -1):
+            if results[index].clears:
+                return index
+        return -1
+
+    def __cover(self, result, change):
+        """Count a visible result in or out of the tiles it touches."""
+        for tile in self.__tiles(result):
+            coverage = self.coverage[tile]
+            coverage[result] += change
+            if not coverage[result]:
+                del coverage[result]
+            self.dirty.add(tile)
+
+    def __tiles(self, result):
+        """Return the pixel segments of a result, by tile."""
+        if result.tiles is not None:
+            return result.tiles
+        left, bottom, right, top = self.view
+        extent = max(right - left, top - bottom) or 1.0
+        # The same transformation as logo_render.to_png.
+        scale = (self.size - 1 - 2 * self.margin) / extent
+        base = self.size - 1 - self.margin
+        tiles = defaultdict(list)
+        last = self.size - 1
+        for x0, y0, x1, y1 in result.segments:
+            pixel = (
+                round(self.margin + (x0 - left) * scale),
+                round(base - (y0 - bottom) * scale),
+                round(self.margin + (x1 - left) * scale),
+                round(base - (y1 - bottom) * scale),
+            )
+            low_x = max(0, min(pixel[0], pixel[2]))
+            high_x = min(last, max(pixel[0], pixel[2]))
+            low_y = max(0, min(pixel[1], pixel[3]))
+            high_y = min(last, max(pixel[1], pixel[3]))
+            for row in range(
+                low_y // self.tile_size, high_y // self.tile_size + 1
+            ):
+                for column in range(
+                    low_x // self.tile_size, high_x // self.tile_size + 1
+                ):
+                    tiles[column, row].append(pixel)
+        result.tiles = dict(tiles)
+        return result.tiles
+
+    def box(self, tile):
+        """Return the pixels of a tile, as (left, top, right, bottom)."""
+        column, row = tile
+        left = column * self.tile_size
+        top = row * self.tile_size
+        return (
+            left,
+            top,
+            min(self.size, left + self.tile_size),
+            min(self.size, top + self.tile_size),
+        )
+
+    def __redraw(self, tile):
+        """Draw a tile again, from the results touching it."""
+        clip = left, top, right, bottom = self.box(tile)
+        blank = b"\xff" * (right - left)
+        for row in range(top * self.size, bottom * self.size, self.size):
+            self.pixels[row + left : row + right] = blank
+        for result in self.coverage[tile]:
+            for pixel in result.tiles[tile]:
+                line(self.pixels, self.size, *pixel, clip=clip)
+
+    def __redraw_all(self, results):
+        """Draw the whole image again."""
+        self.coverage.clear()
+        self.pixels[:] = b"\xff" * (self.size * self.size)
+        for result in results[max(self.clear, 0) :]:
+            self.__cover(result, 1)
+            for tile, pixels in self.__tiles(result).items():
+                clip = self.box(tile)
+                for pixel in pixels:
+                    line(self.pixels, self.size, *pixel, clip=clip)
+        count = -(-self.size // self.tile_size)
+        self.dirty = {
+            (column, row) for row in range(count) for column in range(count)
+        }
+
+    def segments(self, results=None):
+        """Return the visible segments."""
+        if results is None:
+            results = self.results
+        visible = []
+        for result in results[max(self.clear, 0) :]:
+            visible.extend(result.segments)
+        return visible
+
+    def to_png(self):
+        """Return the image, as a PNG file."""
+        return encode_png(self.pixels, self.size, self.size)
+
+    def to_svg(self, **options):
+        """Return the visible segments, as an SVG document."""
+        return to_svg(self.segments(), **options)
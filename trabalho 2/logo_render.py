@@ -0,0 +1,163 @@
+"""Render the drawings of Logo programs as SVG or PNG images.
+
+The drawing is made of the segments left on the screen when the program
+stops: CLEARSCREEN and WIPECLEAN erase the segments drawn before them.
+Programs that never end are cut at a segment budget, except when they
+repeat the same segments forever, which are drawn once.
+
+PNG images are written with zlib only, in 8-bit grayscale.
+"""
+
+import struct
+import zlib
+
+from logo_exec import Clear, Periodic, Segment, execute
+from logo_simplify import simplify
+
+# Width, height, bit depth, color type (grayscale), compression, filter
+# and interlace methods.
+HEADER = struct.Struct(">IIBBBBB")
+
+
+def drawing(events, max_segments=None):
+    """Return the visible segments, and if the events were cut short."""
+    segments = []
+    for event in events:
+        kind = type(event)
+        if kind is Segment:
+            if max_segments is not None and len(segments) >= max_segments:
+                return segments, True
+            segments.append(event)
+        elif kind is Clear:
+            segments.clear()
+        elif kind is Periodic and not (event.dx or event.dy):
+            break
+    return segments, False
+
+
+def draw(program, max_segments=100_000, tolerance=0.0, **options):
+    """Run a program, returning its visible segments and if it was cut.
+
+    The segments are simplified with the given tolerance, unless it is
+    None. The budget counts the segments drawn before simplification, so
+    runs that merge into one segment still end.
+    """
+    segments, truncated = drawing(execute(program, **options), max_segments)
+    if tolerance is not None:
+        segments = list(simplify(segments, tolerance, max_run=None))
+    return segments, truncated
+
+
+def bounds(segments):
+    """Return (min x, min y, max x, max y) of the segments."""
+    if not segments:
+        return 0.0, 0.0, 0.0, 0.0
+    xs = [x for segment in segments for x in (segment.x0, segment.x1)]
+    ys = [y for segment in segments for y in (segment.y0, segment.y1)]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def __number(value):
+    # Adding 0.0 turns -0.0 into 0.0.
+    return f"{value + 0.0:.6g}"
+
+
+def paths(segments):
+    """Return the SVG path data, joining consecutive connected segments."""
+    data = []
+    last = None
+    for x0, y0, x1, y1 in segments:
+        if (x0, y0) != last:
+            data.append(f"M{__number(x0)} {__number(-y0)}")
+        data.append(f"L{__number(x1)} {__number(-y1)}")
+        last = (x1, y1)
+    return "".join(data)
+
+
+def to_svg(segments, margin=10, stroke_width=1, view=None):
+    """Return an SVG document showing the segments, or the view rectangle."""
+    left, bottom, right, top = bounds(segments) if view is None else view
+    width = right - left + 2 * margin
+    height = top - bottom + 2 * margin
+    # SVG coordinates grow downwards, so y is negated.
+    box = (
+        f"{__number(left - margin)} {__number(-top - margin)} "
+        f"{__number(width)} {__number(height)}"
+    )
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{__number(width)}" height="{__number(height)}" '
+        f'viewBox="{box}">\n'
+        f'<path d="{paths(segments)}" fill="none" stroke="black" '
+        f'stroke-width="{stroke_width}" stroke-linecap="round"/>\n'
+        "</svg>\n"
+    )
+
+
+def line(pixels, size, x0, y0, x1, y1, clip=None):
+    """Draw a line on a square grayscale canvas, with Bresenham.
+
+    Only the pixels inside clip, (left, top, right, bottom) with right
+    and bottom excluded, are drawn; by default, the whole canvas.
+    """
+    left, top, right, bottom = clip or (0, 0, size, size)
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    step_x = 1 if x0 < x1 else -1
+    step_y = 1 if y0 < y1 else -1
+    error = dx + dy
+    while True:
+        if left <= x0 < right and top <= y0 < bottom:
+            pixels[y0 * size + x0] = 0
+        if x0 == x1 and y0 == y1:
+            return
+        double = 2 * error
+        if double >= dy:
+            error += dy
+            x0 += step_x
+        if double <= dx:
+            error += dx
+            y0 += step_y
+
+
+def __chunk(kind, data):
+    body = kind + data
+    return (
+        struct.pack(">I", len(data))
+        + body
+        + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+    )
+
+
+def encode_png(pixels, width, height):
+    """Encode 8-bit grayscale pixels, row by row, as a PNG file."""
+    rows = b"".join(
+        b"\0" + bytes(pixels[row * width : (row + 1) * width])
+        for row in range(height)
+    )
+    return b"".join(
+        [
+            b"\x89PNG\r\n\x1a\n",
+            __chunk(b"IHDR", HEADER.pack(width, height, 8, 0, 0, 0, 0)),
+            __chunk(b"IDAT", zlib.compress(rows, 6)),
+            __chunk(b"IEND", b""),
+        ]
+    )
+
+
+def to_png(segments, size=512, margin=8, view=None):
+    """Return a square PNG image showing the segments, or the view."""
+    left, bottom, right, top = bounds(segments) if view is None else view
+    extent = max(right - left, top - bottom) or 1.0
+    scale = (size - 1 - 2 * margin) / extent
+    pixels = bytearray(b"\xff" * (size * size))
+    for x0, y0, x1, y1 in segments:
+        line(
+            pixels,
+            size,
+            round(margin + (x0 - left) * scale),
+            round(size - 1 - margin - (y0 - bottom) * scale),
+            round(margin + (x1 - left) * scale),
+            round(size - 1 - margin - (y1 - bottom) * scale),
+        )
+    return encode_png(pixels, size, size)
@@ -0,0 +1,317 @@
+"""Serve Logo parsing and rendering over a local socket.
+
+Usage: python logo_service.py [--port PORT | --unix PATH] [-j JOBS] ...
+
+Each request is one line of JSON, {"format": FORMAT, "source": SOURCE},
+where FORMAT is "tree" (the tree_io encoding of the program), "svg" or
+"png". Each response is one line of JSON, with "status" ("ok" or
+"error"), "size" and "message" or "truncated", followed by size bytes
+of content. A connection can send any number of requests.
+
+Parsing and rendering run on a pool of processes, which build the lexer
+and the parser tables once. Successful results are cached by a hash of
+the request, in memory, and the least recently used ones are evicted
+when the cache is full. Errors, which include time limits that depend on
+the load, are not cached. Identical requests running at the same time
+share their work.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import signal
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import tree_io
+
+from logo_exec import ExecutionError
+from logo_lexer import lexer, reset
+from logo_render import draw, to_png, to_svg
+from logo_tree import parser
+
+__worker = {}
+
+FORMATS = ("tree", "svg", "png")
+
+
+class RequestError(Exception):
+    """Error raised when a request is invalid or cannot be served."""
+
+
+class LRUCache:
+    """A dict of bytes, limited in number of entries and in bytes."""
+
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024):
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Return the number of entries."""
+        return len(self.entries)
+
+    def get(self, key):
+        """Return the entry for key, or None."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        """Store an entry, a (header, content) pair."""
+        size = len(entry[1])
+        if size > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.size -= len(old[1])
+        self.entries[key] = entry
+        self.size += size
+        while (
+            len(self.entries) > self.max_entries or self.size > self.max_bytes
+        ):
+            _, (_, content) = self.entries.popitem(last=False)
+            self.size -= len(content)
+
+
+def __time_limit(signum, frame):
+    raise ExecutionError("Time limit exceeded.")
+
+
+def init_worker():
+    """Build the lexer and parser tables once per worker process."""
+    __worker["lexer"] = lexer()
+    __worker["parser"] = parser()
+    if hasattr(signal, "setitimer"):
+        signal.signal(signal.SIGALRM, __time_limit)
+
+
+def render(output_format, source, limits):
+    """Parse and render a source, returning (header, content).
+
+    The limits are the maximum number of segments drawn, of statements
+    executed and of seconds spent, which is only enforced on systems
+    with signal.setitimer.
+    """
+    max_segments, max_steps, max_seconds = limits
+    timer = hasattr(signal, "setitimer")
+    if timer:
+        signal.setitimer(signal.ITIMER_REAL, max_seconds)
+    try:
+        return __render(output_format, source, max_segments, max_steps)
+    except Exception as error:  # pylint: disable=broad-except
+        return {"status": "error", "message": str(error)}, b""
+    finally:
+        if timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def __render(output_format, source, max_segments, max_steps):
+    the_lexer = __worker["lexer"]
+    reset(the_lexer)
+    program = __worker["parser"].parse(source, lexer=the_lexer)
+    if output_format == "tree":
+        return {"status": "ok"}, tree_io.dumps(program)
+    segments, truncated = draw(program, max_segments, max_steps=max_steps)
+    if output_format == "svg":
+        content = to_svg(segments).encode("utf-8")
+    else:
+        content = to_png(segments)
+    return {"status": "ok", "truncated": truncated}, content
+
+
+class RenderService:
+    """An asyncio server for Logo requests."""
+
+    def __init__(
+        self,
+        jobs=None,
+        max_source=1024 * 1024,
+        timeout=10.0,
+        max_segments=1_000_000,
+        max_steps=2_000_000,
+        cache=None,
+    ):
+        """Initialize the service, starting its worker processes."""
+        self.max_source = max_source
+        self.timeout = timeout
+        self.max_segments = max_segments
+        self.max_steps = max_steps
+        self.cache = LRUCache() if cache is None else cache
+        # Forked workers would inherit the sockets open at the time, and
+        # keep connections open after their clients close them.
+        self.pool = ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+        )
+        self.running = {}
+        self.connections = set()
+        self.requests = 0
+        self.errors = 0
+
+    def close(self):
+        """Stop the worker processes."""
+        self.pool.shutdown(cancel_futures=True)
+
+    async def wait_closed(self):
+        """Wait until all connections are closed by their clients."""
+        await asyncio.gather(*self.connections)
+
+    async def render(self, output_format, source):
+        """Return (header, content) for a request, using the cache."""
+        if output_format not in FORMATS:
+            raise RequestError(f"Unknown format: {output_format}")
+        if len(source) > self.max_source:
+            raise RequestError(f"Source over {self.max_source} characters.")
+        key = hashlib.sha256(
+            f"{output_format}\0{source}".encode("utf-8")
+        ).digest()
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+        task = self.running.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.__run(key, output_format, source)
+            )
+            self.running[key] = task
+        return await asyncio.shield(task)
+
+    async def __run(self, key, output_format, source):
+        loop = asyncio.get_running_loop()
+        try:
+            entry = await asyncio.wait_for(
+                loop.run_in_executor(
+                    self.pool,
+                    render,
+                    output_format,
+                    source,
+                    (self.max_segments, self.max_steps, self.timeout),
+                ),
+                # Let the worker report its own time limit first.
+                self.timeout + 1.0,
+            )
+        except asyncio.TimeoutError as error:
+            raise RequestError("Time limit exceeded.") from error
+        finally:
+            del self.running[key]
+        if entry[0]["status"] == "ok":
+            self.cache.put(key, entry)
+        return entry
+
+    async def handle(self, reader, writer):
+        """Serve the requests of one connection."""
+        task = asyncio.current_task()
+        self.connections.add(task)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await self.__reply(
+                        writer, {"status": "error", "message": "Too large."}
+                    )
+                    break
+                if not line:
+                    break
+                self.requests += 1
+                try:
+                    request = json.loads(line)
+                    header, content = await self.render(
+                        request.get("format", "svg"), request["source"]
+                    )
+                except Exception as error:  # pylint: disable=broad-except
+                    header = {"status": "error", "message": str(error)}
+                    content = b""
+                if header["status"] != "ok":
+                    self.errors += 1
+                await self.__reply(writer, header, content)
+        except ConnectionError:
+            pass
+        finally:
+            self.connections.discard(task)
+            writer.close()
+            await writer.wait_closed()
+
+    @staticmethod
+    async def __reply(writer, header, content=b""):
+        header = dict(header, size=len(content))
+        writer.write(json.dumps(header).encode("utf-8") + b"\n" + content)
+        await writer.drain()
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        """Start listening on a Unix socket, or on a TCP port."""
+        # A JSON line can escape each byte of the source in 6 bytes.
+        limit = 6 * self.max_source + 1024
+        if path is not None:
+            return await asyncio.start_unix_server(
+                self.handle, path, limit=limit
+            )
+        return await asyncio.start_server(self.handle, host, port, limit=limit)
+
+
+async def request(reader, writer, output_format, source):
+    """Send one request on a connection, returning (header, content)."""
+    message = {"format": output_format, "source": source}
+    writer.write(json.dumps(message).encode("utf-8") + b"\n")
+    await writer.drain()
+    header = json.loads(await reader.readline())
+    content = await reader.readexactly(header["size"])
+    return header, content
+
+
+async def serve(options):
+    """Run the service until interrupted."""
+    service = RenderService(
+        jobs=options.jobs,
+        max_source=options.max_source,
+        timeout=options.timeout,
+        max_segments=options.max_segments,
+        max_steps=options.max_steps,
+        cache=LRUCache(options.cache_entries, options.cache_bytes),
+    )
+    try:
+        server = await service.start(options.host, options.port, options.unix)
+        where = options.unix or f"{options.host}:{options.port}"
+        print(f"Serving on {where}", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    """Run the render service."""
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument("--host", default="127.0.0.1")
+    args.add_argument("--port", type=int, default=8765)
+    args.add_argument("--unix", help="Unix socket path, instead of TCP")
+    args.add_argument("-j", "--jobs", type=int, help="number of processes")
+    args.add_argument("--timeout", type=float, default=10.0, help="seconds")
+    args.add_argument("--max-source", type=int, default=1024 * 1024)
+    args.add_argument("--max-segments", type=int, default=1_000_000)
+    args.add_argument("--max-steps", type=int, default=2_000_000)
+    args.add_argument("--cache-entries", type=int, default=1024)
+    args.add_argument("--cache-bytes", type=int, default=64 * 1024 * 1024)
+    options = args.parse_args(argv)
+    try:
+        asyncio.run(serve(options))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""Simplify the events of a Logo execution before rendering.
+
+Consecutive segments on the same line, in the same direction, become one
+segment, consecutive pen-up moves become one move, and runs of segments
+or moves of length zero are dropped. Other events are kept, in order,
+and end any run of merged segments or moves.
+
+With a tolerance, a run of segments becomes one segment as long as every
+point it drops is within that distance of the segment, as with the
+Douglas-Peucker algorithm, and a run that stays within that distance of
+its start is dropped. Without one, only rounding errors are ignored.
+
+Runs are cut after max_run events, unless it is None, so that the output
+of a program that never ends is still a stream.
+"""
+
+import math
+
+from logo_exec import Move, Segment
+
+# Coordinates are rounded to 9 decimals by logo_exec.
+EPSILON = 1e-9
+
+
+class _Run:
+    """Consecutive segments or moves, merged from their start point."""
+
+    __slots__ = (
+        "kind", "x0", "y0", "x1", "y1", "count", "reach", "far", "cone"
+    )
+
+    def __init__(self, event):
+        self.kind = type(event)
+        self.x0, self.y0, self.x1, self.y1 = event
+        self.count = 1
+        # Largest distance from the start of the points in the run (of the
+        # end, for moves), and of the dropped points further than the
+        # tolerance.
+        self.reach = math.hypot(self.x1 - self.x0, self.y1 - self.y0)
+        self.far = 0.0
+        # Directions from the start keeping those points within the
+        # tolerance, as (base, low, high) with low and high relative to
+        # base, or None when there is no such point yet.
+        self.cone = None
+
+    def extend(self, event, limit):
+        """Add event to the run if it stays within limit, returning if so."""
+        x, y = event.x1, event.y1
+        distance = math.hypot(x - self.x0, y - self.y0)
+        if self.kind is Segment:
+            # The current end becomes a dropped point.
+            far = self.far
+            cone = self.cone
+            end = math.hypot(self.x1 - self.x0, self.y1 - self.y0)
+            if end > limit:
+                far = max(far, end)
+                cone = _narrow(
+                    cone,
+                    math.atan2(self.y1 - self.y0, self.x1 - self.x0),
+                    math.asin(limit / end),
+                )
+                if cone is None:
+                    return False
+            if distance < far:
+                return False
+            if cone is not None:
+                base, low, high = cone
+                angle = _relative(math.atan2(y - self.y0, x - self.x0), base)
+                if not low <= angle <= high:
+                    return False
+            self.far = far
+            self.cone = cone
+            self.reach = max(self.reach, distance)
+        else:
+            # Only the end of a move matters.
+            self.reach = distance
+        self.x1 = x
+        self.y1 = y
+        self.count += 1
+        return True
+
+    def event(self):
+        """Return the merged event."""
+        return self.kind(self.x0, self.y0, self.x1, self.y1)
+
+
+def _relative(angle, base):
+    """Return angle - base, in [-pi, pi)."""
+    return (angle - base + math.pi) % (2 * math.pi) - math.pi
+
+
+def _narrow(cone, angle, width):
+    """Intersect a cone with the directions within width of angle.
+
+    Return None if the intersection is empty.
+    """
+    if cone is None:
+        return angle, -width, width
+    base, low, high = cone
+    angle = _relative(angle, base)
+    low = max(low, angle - width)
+    high = min(high, angle + width)
+    if low > high:
+        return None
+    return base, low, high
+
+
+def simplify(events, tolerance=0.0, max_run=1024):
+    """Yield the simplified events."""
+    limit = tolerance + EPSILON
+    run = None
+    for event in events:
+        kind = type(event)
+        if kind is not Segment and kind is not Move:
+            if run is not None:
+                if run.reach > limit:
+                    yield run.event()
+                run = None
+            yield event
+            continue
+        if run is not None:
+            if (
+                run.kind is kind
+                and (max_run is None or run.count < max_run)
+                and abs(event.x0 - run.x1) <= limit
+                and abs(event.y0 - run.y1) <= limit
+                and run.extend(event, limit)
+            ):
+                continue
+            if run.reach > limit:
+                yield run.event()
+        run = _Run(event)
+    if run is not None and run.reach > limit:
+        yield run.event()
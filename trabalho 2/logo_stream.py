@@ -0,0 +1,171 @@
+"""Parse Logo programs one top-level statement at a time.
+
+Usage: python logo_stream.py FILE
+
+The grammar of logo_tree collects the statements of a program with a
+right-recursive rule, so the parser stack holds every statement until
+the end of the input. The streaming grammar replaces it with a
+left-recursive rule, which reduces each top-level statement as soon as
+the token after it is read, and hands it to a callback instead of
+keeping it. Memory and parser stack depth stay bounded by the largest
+statement, and the statements can be compiled or executed while the
+rest of the program is parsed.
+
+All other rules are the ones of logo_tree, so the statements are the
+same as in the program tree.
+"""
+
+import queue
+import sys
+import threading
+from functools import partial
+from types import SimpleNamespace
+
+from ply import yacc
+
+import logo_tree
+
+from logo_chunks import lex_file
+from logo_lexer import lexer, reset
+from tree import Node
+
+# Tables are built in memory, as parsetab.py holds the logo_tree ones.
+TABMODULE = "parsetab_stream"
+
+
+class _Stop(Exception):
+    """Raised by the callback to stop a parse early."""
+
+
+def p_program_first(prod):
+    """program : expression"""
+    prod.parser.statement(prod[1])
+    prod[0] = 1
+
+
+def p_program_next(prod):
+    """program : program expression"""
+    prod.parser.statement(prod[2])
+    prod[0] = prod[1] + 1
+
+
+def parser():
+    """Create a parser calling its statement attribute for each statement.
+
+    The parse returns the number of statements.
+    """
+    rules = {
+        name: value
+        for name, value in vars(logo_tree).items()
+        if name.startswith("p_")
+        and name not in ("p_program", "p_another_statement", "p_empty")
+    }
+    rules.update(
+        p_program_first=p_program_first,
+        p_program_next=p_program_next,
+        tokens=logo_tree.tokens,
+        __file__=__file__,
+    )
+    the_parser = yacc.yacc(
+        module=SimpleNamespace(**rules),
+        start="program",
+        tabmodule=TABMODULE,
+        write_tables=False,
+        debug=False,
+    )
+    the_parser.new_node = Node
+    the_parser.statement = None
+    return the_parser
+
+
+def parse(source, callback, the_parser=None, the_lexer=None):
+    """Parse a source, calling callback with each top-level statement.
+
+    The source is a string, or an iterable of tokens such as the ones of
+    logo_chunks.lex_file. Return the number of statements.
+    """
+    if the_parser is None:
+        the_parser = parser()
+    the_parser.statement = callback
+    if the_lexer is None:
+        the_lexer = lexer()
+    if isinstance(source, str):
+        reset(the_lexer)
+        return the_parser.parse(source, lexer=the_lexer)
+    # PLY still needs a lexer when tokens come from tokenfunc.
+    return the_parser.parse(
+        lexer=the_lexer, tokenfunc=partial(next, iter(source), None)
+    )
+
+
+def statements(source, the_parser=None, the_lexer=None, buffer=64):
+    """Yield the top-level statements of a source while it is parsed.
+
+    The parse runs in another thread, and waits while buffer statements
+    are not consumed yet. Closing the generator stops the parse.
+    """
+    items = queue.Queue(buffer)
+    stop = threading.Event()
+    done = object()
+
+    def callback(statement):
+        if stop.is_set():
+            raise _Stop()
+        items.put((statement, None))
+
+    def run():
+        try:
+            parse(source, callback, the_parser, the_lexer)
+            items.put((done, None))
+        except _Stop:
+            pass
+        except Exception as error:  # pylint: disable=broad-except
+            items.put((done, error))
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    try:
+        while True:
+            statement, error = items.get()
+            if statement is done:
+                if error is not None:
+                    raise error
+                return
+            yield statement
+    finally:
+        stop.set()
+        # Unblock the parser if it waits for room in the queue.
+        while thread.is_alive():
+            try:
+                items.get(timeout=0.01)
+            except queue.Empty:
+                pass
+        thread.join()
+
+
+def parse_file(path, callback, the_parser=None, chunk_size=None):
+    """Parse a file, lexed by chunks, calling callback for each statement."""
+    the_lexer = lexer()
+    reset(the_lexer)
+    options = {} if chunk_size is None else {"chunk_size": chunk_size}
+    tokens = lex_file(path, the_lexer, **options)
+    return parse(tokens, callback, the_parser, the_lexer)
+
+
+if __name__ == "__main__":
+    # Unix only, and only needed to report the peak memory.
+    import resource
+
+    kinds = {}
+
+    def count(statement):
+        """Count the statements of each kind."""
+        kinds[statement.kind] = kinds.get(statement.kind, 0) + 1
+
+    total = parse_file(sys.argv[1], count)
+    print(f"statements: {total:,}")
+    for kind, number in sorted(kinds.items()):
+        print(f"  {kind:<16} {number:,}")
+    # ru_maxrss is in kilobytes on Linux.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"peak RSS: {peak / 1024:.1f} MB")
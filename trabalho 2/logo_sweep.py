@@ -0,0 +1,300 @@
+"""Run one Logo procedure for many argument vectors at once.
+
+Each argument vector is a lane, and the turtle state of all lanes is
+kept in NumPy arrays. Statements run once for all the lanes they apply
+to, as a mask: IF runs its branches with the lanes where the condition
+holds or not, and WHILE runs its body with the lanes that entered it.
+Conditions only depend on numbers and parameters, so a lane that enters
+a loop never leaves it, and lanes in a loop run until their segment
+budget is used, or until their state repeats.
+
+A lane draws the segments drawing would keep from running the program
+with only the call, except that the budget counts erased segments too,
+and that a loop that repeats a state may draw one more period before it
+is stopped.
+"""
+
+import numpy as np
+
+from logo_exec import COMPARE, ExecutionError, Segment
+
+
+class Sweep:
+    """The segments drawn by each lane of a sweep."""
+
+    def __init__(self, segments, offsets, truncated, exceeded):
+        """Store segments, one row each, with the offsets of each lane.
+
+        Truncated lanes used their segment budget, and exceeded lanes
+        their step budget or the call depth.
+        """
+        self.segments = segments
+        self.offsets = offsets
+        self.truncated = truncated
+        self.exceeded = exceeded
+
+    def __len__(self):
+        """Return the number of lanes."""
+        return len(self.offsets) - 1
+
+    def lane(self, index):
+        """Return the segments drawn by a lane, as Segment events."""
+        rows = self.segments[self.offsets[index] : self.offsets[index + 1]]
+        return [Segment(*row) for row in rows.tolist()]
+
+
+class BatchExecution:
+    """The state of the turtles of all lanes while a procedure runs."""
+
+    def __init__(
+        self,
+        program,
+        lanes,
+        max_segments=10_000,
+        max_steps=1_000_000,
+        max_depth=256,
+    ):
+        """Initialize the turtles, with the procedures of a program.
+
+        Only procedures defined at the top level of the program can be
+        called. The budgets apply to each lane.
+        """
+        self.procedures = {
+            statement.value: statement
+            for statement in program.children
+            if statement.kind == "assign_expr"
+        }
+        self.max_segments = max_segments
+        self.max_steps = max_steps
+        self.max_depth = max_depth
+        self.x = np.zeros(lanes)
+        self.y = np.zeros(lanes)
+        self.heading = np.zeros(lanes)
+        self.pen = np.ones(lanes, dtype=bool)
+        self.alive = np.ones(lanes, dtype=bool)
+        self.steps = np.zeros(lanes, dtype=np.int64)
+        self.counts = np.zeros(lanes, dtype=np.int64)
+        # Segments drawn by each lane before its last CLEARSCREEN.
+        self.erased = np.zeros(lanes, dtype=np.int64)
+        self.truncated = np.zeros(lanes, dtype=bool)
+        self.exceeded = np.zeros(lanes, dtype=bool)
+        self.drawn_lanes = []
+        self.drawn = []
+
+    def lookup(self, name, env):
+        """Return the values of a parameter in the current call chain."""
+        while env is not None:
+            bindings, env = env
+            if name in bindings:
+                return bindings[name]
+        raise ExecutionError(f"Undefined parameter: {name}")
+
+    def value(self, node, env):
+        """Evaluate a value expression, as a number or one per lane."""
+        if node.kind == "param":
+            return self.lookup(node.value, env)
+        return node.value
+
+    def condition(self, node, env):
+        """Evaluate a condition, for all lanes."""
+        left, right = node.children
+        if node.value == "AND":
+            return self.condition(left, env) & self.condition(right, env)
+        if node.value == "OR":
+            return self.condition(left, env) | self.condition(right, env)
+        # Comparing two numbers gives a bool, which ~ would not negate.
+        return np.asarray(
+            COMPARE[node.value](self.value(left, env), self.value(right, env))
+        )
+
+    def __stop(self, lanes, status):
+        """Stop some lanes for good, recording why in status."""
+        status |= lanes
+        self.alive &= ~lanes
+
+    def move_to(self, mask, x, y):
+        """Move the turtles of the masked lanes, drawing if the pen is down."""
+        x = np.broadcast_to(x, self.x.shape)
+        y = np.broadcast_to(y, self.y.shape)
+        draw = mask & self.pen
+        full = draw & (self.counts >= self.max_segments)
+        if full.any():
+            self.__stop(full, self.truncated)
+            draw &= ~full
+            mask = mask & ~full
+        if draw.any():
+            lanes = np.flatnonzero(draw)
+            self.drawn_lanes.append(lanes)
+            self.drawn.append(
+                np.column_stack(
+                    (self.x[lanes], self.y[lanes], x[lanes], y[lanes])
+                )
+            )
+            self.counts[lanes] += 1
+        self.x = np.where(mask, x, self.x)
+        self.y = np.where(mask, y, self.y)
+
+    def forward(self, mask, distance):
+        """Move the masked lanes along their heading."""
+        angle = np.radians(self.heading)
+        self.move_to(
+            mask,
+            np.round(self.x + distance * np.sin(angle), 9),
+            np.round(self.y + distance * np.cos(angle), 9),
+        )
+
+    def command(self, node, mask, env):
+        """Run a turtle command in the masked lanes."""
+        name = node.value
+        args = [self.value(arg, env) for arg in node.children]
+        if name in ("FORWARD", "FO"):
+            self.forward(mask, args[0])
+        elif name in ("BACKWARD", "BK"):
+            self.forward(mask, -np.asarray(args[0]))
+        elif name in ("RIGHT", "RT"):
+            self.heading = np.where(
+                mask, (self.heading + args[0]) % 360, self.heading
+            )
+        elif name in ("LEFT", "LT"):
+            self.heading = np.where(
+                mask, (self.heading - args[0]) % 360, self.heading
+            )
+        elif name in ("PENUP", "PU"):
+            self.pen &= ~mask
+        elif name in ("PENDOWN", "PD"):
+            self.pen |= mask
+        elif name == "HOME":
+            self.heading = np.where(mask, 0.0, self.heading)
+            self.move_to(mask, 0.0, 0.0)
+        elif name == "SETXY":
+            self.move_to(mask, np.float64(args[0]), np.float64(args[1]))
+        elif name in ("CLEARSCREEN", "CS", "WIPECLEAN", "WC"):
+            if name in ("CLEARSCREEN", "CS"):
+                self.x = np.where(mask, 0.0, self.x)
+                self.y = np.where(mask, 0.0, self.y)
+                self.heading = np.where(mask, 0.0, self.heading)
+            self.erased = np.where(mask, self.counts, self.erased)
+
+    def run(self, node, mask, env=None, depth=0):
+        """Run a statement in the masked lanes that are still running."""
+        mask = mask & self.alive
+        if not mask.any():
+            return
+        self.steps[mask] += 1
+        over = mask & (self.steps > self.max_steps)
+        if over.any():
+            self.__stop(over, self.exceeded)
+            mask &= ~over
+        kind = node.kind
+        if kind == "logo_function":
+            self.command(node, mask, env)
+        elif kind == "if_stmt":
+            holds = self.condition(node.children[0], env)
+            self.run(node.children[1], mask & holds, env, depth)
+            if len(node.children) > 2:
+                self.run(node.children[2], mask & ~holds, env, depth)
+        elif kind == "loop_stmt":
+            holds = self.condition(node.children[0], env)
+            self.loop(node, mask & holds, env, depth)
+        elif kind == "call":
+            procedure = self.procedures.get(node.value)
+            if procedure is None:
+                raise ExecutionError(f"Undefined procedure: {node.value}")
+            params, body = procedure.children
+            if len(params.value) != len(node.children):
+                raise ExecutionError(
+                    f"Wrong number of arguments for {node.value}:"
+                    f"{node.lineno}"
+                )
+            if depth >= self.max_depth:
+                self.__stop(mask, self.exceeded)
+                return
+            args = [self.value(arg, env) for arg in node.children]
+            bindings = dict(zip(params.value, args))
+            self.run(body, mask, (bindings, env), depth + 1)
+        elif kind == "assign_expr":
+            raise ExecutionError(
+                f"Procedures cannot be defined in a sweep: {node.value}"
+            )
+        elif kind == "program":
+            for statement in node.children:
+                self.run(statement, mask, env, depth)
+
+    def loop(self, node, mask, env, depth):
+        """Run a loop in the masked lanes, until they stop."""
+        if not mask.any():
+            return
+        body = node.children[1]
+        active = mask.copy()
+        # The state at iteration 2**k, as in Brent's cycle detection.
+        saved = (self.x, self.y, self.heading, self.pen.copy())
+        iteration = 0
+        power = 1
+        while active.any():
+            self.run(body, active, env, depth)
+            active &= self.alive
+            iteration += 1
+            x, y, heading, pen = saved
+            still = (
+                active
+                & (x == self.x)
+                & (y == self.y)
+                & (heading == self.heading)
+                & (pen == self.pen)
+            )
+            # The lane repeats the same segments forever.
+            self.alive &= ~still
+            active &= ~still
+            if iteration == power:
+                saved = (self.x, self.y, self.heading, self.pen.copy())
+                power *= 2
+        self.alive &= ~mask
+
+    def call(self, name, arguments):
+        """Call a procedure with a row of arguments for each lane."""
+        procedure = self.procedures.get(name)
+        if procedure is None:
+            raise ExecutionError(f"Undefined procedure: {name}")
+        params = procedure.children[0].value
+        if not len(self.x):
+            return self.result()
+        arguments = np.asarray(arguments, dtype=np.float64)
+        arguments = arguments.reshape(len(self.x), -1)
+        if arguments.shape[1] != len(params):
+            raise ExecutionError(f"Wrong number of arguments for {name}")
+        bindings = dict(zip(params, arguments.T))
+        self.run(procedure.children[1], self.alive.copy(), (bindings, None))
+        return self.result()
+
+    def result(self):
+        """Return the segments drawn so far by each lane."""
+        lanes = len(self.x)
+        if self.drawn:
+            owners = np.concatenate(self.drawn_lanes)
+            segments = np.concatenate(self.drawn)
+        else:
+            owners = np.zeros(0, dtype=np.int64)
+            segments = np.zeros((0, 4))
+        order = np.argsort(owners, kind="stable")
+        owners = owners[order]
+        segments = segments[order]
+        counts = np.bincount(owners, minlength=lanes)
+        starts = np.cumsum(counts) - counts
+        # Drop the segments erased by CLEARSCREEN or WIPECLEAN.
+        keep = np.arange(len(owners)) - starts[owners] >= self.erased[owners]
+        owners = owners[keep]
+        offsets = np.zeros(lanes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(owners, minlength=lanes), out=offsets[1:])
+        return Sweep(
+            segments[keep],
+            offsets,
+            self.truncated.copy(),
+            self.exceeded.copy(),
+        )
+
+
+def sweep(program, name, arguments, **options):
+    """Run a procedure of a program for each row of arguments."""
+    arguments = np.asarray(arguments, dtype=np.float64)
+    lanes = len(arguments)
+    return BatchExecution(program, lanes, **options).call(name, arguments)
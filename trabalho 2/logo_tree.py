@@ -6,16 +6,22 @@ from ply import yacc
 
 from logo_lexer import lexer, tokens
 
-from tree import new_leaf, new_node, append_node
+from tree import Interner, Node, to_dict
+
+
+def new_node(prod, kind, children=(), value=None, lineno=None):
+    """Create a node with the node factory of the running parser."""
+    return prod.parser.new_node(kind, children, value, lineno)
 
 
 def p_program(prod):
     """program : expression other_expression"""
-    node = new_node("program")
-    append_node(node, prod[1])
-    if prod[2]:
-        append_node(node, prod[2])
-    prod[0] = node
+    statements = prod[2] or []
+    statements.append(prod[1])
+    statements.reverse()
+    prod[0] = new_node(
+        prod, "program", tuple(statements), lineno=prod[1].lineno
+    )
 
 
 def p_another_statement(prod):
@@ -24,11 +30,10 @@ def p_another_statement(prod):
         | empty
     """
     if prod[1]:
-        node = new_node("other_expression")
-        append_node(node, prod[1])
-        if prod[2]:
-            append_node(node, prod[2])
-        prod[0] = node
+        # Statements are collected in reverse order, p_program fixes it.
+        statements = prod[2] or []
+        statements.append(prod[1])
+        prod[0] = statements
 
 
 def p_expr(prod):
@@ -40,9 +45,7 @@ def p_expr(prod):
         | assign_expr
         | params
     """
-    node = new_node("expression")
-    append_node(node, prod[1])
-    prod[0] = node
+    prod[0] = prod[1]
 
 
 def p_empty(prod):
@@ -66,8 +69,9 @@ def p_func(prod):
         | RANDOM
         | TYPEIN
     """
-    node = new_node("logo_function")
-    append_node(node, new_leaf(prod.slice[1].type, value=prod[1]))
+    prod[0] = new_node(
+        prod, "logo_function", value=prod[1], lineno=prod.lineno(1)
+    )
 
 
 def p_only_param_func(prod):
@@ -81,42 +85,62 @@ def p_only_param_func(prod):
         | LT value_expr
         | PRINT value_expr
     """
-    node = new_node("logo_function")
-    append_node(node, new_leaf(prod.slice[1].type, value=prod[1]))
-    append_node(node, prod[2])
-
-    prod[0] = node
+    prod[0] = new_node(
+        prod,
+        "logo_function",
+        (prod[2],),
+        value=prod[1],
+        lineno=prod.lineno(1),
+    )
 
 
 def p_two_params_func(prod):
     """logo_expr : SETXY value_expr value_expr"""
-    node = new_node("logo_function")
-    append_node(node, new_leaf(prod.slice[1].type, value=prod[1]))
-    append_node(node, prod[2])
-    append_node(node, prod[3])
+    prod[0] = new_node(
+        prod,
+        "logo_function",
+        (prod[2], prod[3]),
+        value=prod[1],
+        lineno=prod.lineno(1),
+    )
+
+
+def p_call(prod):
+    """logo_expr : IDENTIFIER
+        | IDENTIFIER call_args
+    """
+    # Arguments are greedy: every value following a call is an argument.
+    args = tuple(prod[2]) if len(prod) > 2 else ()
+    prod[0] = new_node(
+        prod, "call", args, value=prod[1], lineno=prod.lineno(1)
+    )
 
-    prod[0] = node
+
+def p_call_args(prod):
+    """call_args : value_expr
+        | call_args value_expr
+    """
+    if len(prod) == 2:
+        prod[0] = [prod[1]]
+    else:
+        prod[1].append(prod[2])
+        prod[0] = prod[1]
 
 
 def p_value_expr_num(prod):  # noqa: D205, D400, D403, D415
     """value_expr : NUMBER"""
-    node = new_node("value_expr")
-    leaf = new_leaf("NUM", value=prod[1])
-    append_node(node, leaf)
-    prod[0] = node
+    prod[0] = new_node(
+        prod, "value_expr", value=prod[1], lineno=prod.lineno(1)
+    )
 
 
 def p_loop(prod):
     '''
         loop_stmt : WHILE bool_expr THEN expression END
     '''
-    node = new_node('loop_stmt')
-    append_node(node, 'WHILE')
-    append_node(node, new_leaf('bool_expr', value=prod[2]))
-    append_node(node, 'THEN')
-    append_node(node, prod[4])
-    append_node(node, 'END')
-    prod[0] = node
+    prod[0] = new_node(
+        prod, 'loop_stmt', (prod[2], prod[4]), lineno=prod.lineno(1)
+    )
 
 
 def p_and_or(prod):
@@ -130,28 +154,18 @@ def p_if(prod):
     '''
         if_stmt : IF bool_expr THEN expression END
     '''
-    node = new_node('if_stmt')
-    append_node(node, 'IF')
-    append_node(node, new_leaf('bool_expr', value=prod[2]))
-    append_node(node, 'THEN')
-    append_node(node, prod[4])
-    append_node(node, 'END')
-    prod[0] = node
+    prod[0] = new_node(
+        prod, 'if_stmt', (prod[2], prod[4]), lineno=prod.lineno(1)
+    )
 
 
 def p_if_else(prod):
     '''
         if_stmt : IF bool_expr THEN expression ELSE expression END
     '''
-    node = new_node('if_stmt')
-    append_node(node, 'IF')
-    append_node(node, new_leaf('bool_expr', value=prod[2]))
-    append_node(node, 'THEN')
-    append_node(node, prod[4])
-    append_node(node, 'ELSE')
-    append_node(node, prod[6])
-    append_node(node, 'END')
-    prod[0] = node
+    prod[0] = new_node(
+        prod, 'if_stmt', (prod[2], prod[4], prod[6]), lineno=prod.lineno(1)
+    )
 
 
 def p_boolean_expr(prod):
@@ -162,45 +176,60 @@ def p_boolean_expr(prod):
         | value_expr GREATEQ value_expr
         | value_expr LOWEQ value_expr
     '''
-    node = new_node('bool_expr')
-    append_node(node, new_leaf(prod.slice[1].type, value=prod[1]))
-    append_node(node, new_leaf(prod.slice[2].type, value=prod[2]))
-    append_node(node, new_leaf(prod.slice[3].type, value=prod[3]))
-    prod[0] = node
+    prod[0] = new_node(
+        prod,
+        'bool_expr',
+        (prod[1], prod[3]),
+        value=prod[2],
+        lineno=prod[1].lineno,
+    )
 
 
 def p_one_more_bool_expr(prod):
     '''
         bool_expr : bool_expr bool_expr_operator bool_expr
     '''
-    node = new_node('bool_expr')
-    append_node(node, new_leaf(prod.slice[1].type, value=prod[1]))
-    append_node(node, new_leaf(prod.slice[2].type, value=prod[2]))
-    append_node(node, new_leaf(prod.slice[3].type, value=prod[3]))
-    prod[0] = node
+    prod[0] = new_node(
+        prod,
+        'bool_expr',
+        (prod[1], prod[3]),
+        value=prod[2],
+        lineno=prod[1].lineno,
+    )
 
 
 def p_assign(prod):
     '''assign_expr : TO IDENTIFIER params expression END'''
-    node = new_node('assign_expr')
-    append_node(node, new_leaf(prod.slice[1].type, value=prod[1]))
-    append_node(node, new_leaf(prod.slice[2].type, value=prod[2]))
-    append_node(node, new_leaf(prod.slice[3].type, value=prod[3]))
-    append_node(node, new_leaf(prod.slice[4].type, value=prod[4]))
-    append_node(node, new_leaf(prod.slice[5].type, value=prod[5]))
-    prod[0] = node
+    prod[0] = new_node(
+        prod,
+        'assign_expr',
+        (prod[3], prod[4]),
+        value=prod[2],
+        lineno=prod.lineno(1),
+    )
 
 
 def p_param(prod):
     '''params : ARGUMENT
         | params ARGUMENT'''
-    node = new_node('arguments')
-    try:
-        append_node(node, prod[1])
-        append_node(node, prod[2])
-    except:
-        pass
-    prod[0] = node
+    if len(prod) == 2:
+        prod[0] = new_node(
+            prod, 'arguments', value=(prod[1],), lineno=prod.lineno(1)
+        )
+    else:
+        prod[0] = new_node(
+            prod,
+            'arguments',
+            value=prod[1].value + (prod[2],),
+            lineno=prod[1].lineno,
+        )
+
+
+def p_value_expr_param(prod):
+    '''value_expr : ARGUMENT'''
+    # Defined after p_param: a statement made only of parameters is
+    # still a parameter list.
+    prod[0] = new_node(prod, 'param', value=prod[1], lineno=prod.lineno(1))
 
 
 def p_error(token):
@@ -213,6 +242,24 @@ def p_error(token):
     raise Exception("Syntax error at EOF.")
 
 
+def parser(intern=False):
+    """Create a new parser object.
+
+    If intern is set, structurally equal subtrees share a single node.
+    """
+    # parsetab.py is tracked: read it, but never write it or parser.out.
+    the_parser = yacc.yacc(start="program", write_tables=False, debug=False)
+    the_parser.new_node = Interner() if intern else Node
+    return the_parser
+
+
+def signature():
+    """Return the grammar signature, as stored by PLY in _lr_signature."""
+    info = yacc.ParserReflect(dict(globals(), start="program"))
+    info.get_all()
+    return info.signature()
+
+
 if __name__ == "__main__":
     SOURCE = '''
         TO ABC :TESTE :OUTROPARAM 
@@ -237,7 +284,6 @@ if __name__ == "__main__":
         SETXY 10 20
     '''
     mylex = lexer()
-    parser = yacc.yacc(start="program")
-    program = parser.parse(SOURCE, lexer=mylex, tracking=False)
-    print(yaml.dump(program, indent=2, sort_keys=False))
+    program = parser().parse(SOURCE, lexer=mylex, tracking=False)
+    print(yaml.dump(to_dict(program), indent=2, sort_keys=False))
 
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'programAND ARGUMENT BACKWARD BK CLEARSCREEN CS ELSE END EQUALS FO FORWARD GREATEQ GREATER HEADING HOME IDENTIFIER IF LEFT LOWEQ LOWER LT NUMBER OR PD PENDOWN PENUP PRINT PU RANDOM RIGHT RT SETXY THEN TO TYPEIN WC WHILE WIPECLEAN XCOR YCORprogram : expression other_expression\n    other_expression : expression other_expression\n        | empty\n    \n    expression : value_expr\n        | logo_expr\n        | if_stmt\n        | loop_stmt\n        | assign_expr\n        | params\n    empty :logo_expr : PENUP\n        | PU\n        | PENDOWN\n        | PD\n        | WIPECLEAN\n        | WC\n        | CLEARSCREEN\n        | CS\n        | HOME\n        | XCOR\n        | YCOR\n        | HEADING\n        | RANDOM\n        | TYPEIN\n    logo_expr : FORWARD value_expr\n        | FO value_expr \n        | BK value_expr \n        | BACKWARD value_expr\n        | RIGHT value_expr\n        | RT value_expr\n        | LEFT value_expr\n        | LT value_expr\n        | PRINT value_expr\n    logo_expr : SETXY value_expr value_exprvalue_expr : NUMBER\n        loop_stmt : WHILE bool_expr THEN expression END\n    bool_expr_operator : AND \n        | OR\n    \n        if_stmt : IF bool_expr THEN expression END\n    \n        if_stmt : IF bool_expr THEN expression ELSE expression END\n    \n    bool_expr : value_expr EQUALS value_expr\n        | value_expr GREATER value_expr\n        | value_expr LOWER value_expr\n        | value_expr GREATEQ value_expr\n        | value_expr LOWEQ value_expr\n    \n        bool_expr : bool_expr bool_expr_operator bool_expr\n    assign_expr : TO IDENTIFIER params expression ENDparams : ARGUMENT\n        | params ARGUMENT'
+_lr_signature = 'programAND ARGUMENT BACKWARD BK CLEARSCREEN CS ELSE END EQUALS FO FORWARD GREATEQ GREATER HEADING HOME IDENTIFIER IF LEFT LOWEQ LOWER LT NUMBER OR PD PENDOWN PENUP PRINT PU RANDOM RIGHT RT SETXY THEN TO TYPEIN WC WHILE WIPECLEAN XCOR YCORprogram : expression other_expression\n    other_expression : expression other_expression\n        | empty\n    \n    expression : value_expr\n        | logo_expr\n        | if_stmt\n        | loop_stmt\n        | assign_expr\n        | params\n    empty :logo_expr : PENUP\n        | PU\n        | PENDOWN\n        | PD\n        | WIPECLEAN\n        | WC\n        | CLEARSCREEN\n        | CS\n        | HOME\n        | XCOR\n        | YCOR\n        | HEADING\n        | RANDOM\n        | TYPEIN\n    logo_expr : FORWARD value_expr\n        | FO value_expr \n        | BK value_expr \n        | BACKWARD value_expr\n        | RIGHT value_expr\n        | RT value_expr\n        | LEFT value_expr\n        | LT value_expr\n        | PRINT value_expr\n    logo_expr : SETXY value_expr value_exprlogo_expr : IDENTIFIER\n        | IDENTIFIER call_args\n    call_args : value_expr\n        | call_args value_expr\n    value_expr : NUMBER\n        loop_stmt : WHILE bool_expr THEN expression END\n    bool_expr_operator : AND \n        | OR\n    \n        if_stmt : IF bool_expr THEN expression END\n    \n        if_stmt : IF bool_expr THEN expression ELSE expression END\n    \n    bool_expr : value_expr EQUALS value_expr\n        | value_expr GREATER value_expr\n        | value_expr LOWER value_expr\n        | value_expr GREATEQ value_expr\n        | value_expr LOWEQ value_expr\n    \n        bool_expr : bool_expr bool_expr_operator bool_expr\n    assign_expr : TO IDENTIFIER params expression ENDparams : ARGUMENT\n        | params ARGUMENTvalue_expr : ARGUMENT'
     
-_lr_action_items = {'NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,37,38,41,42,43,44,45,46,47,48,49,50,51,57,58,59,60,61,62,63,64,65,66,67,68,78,79,80,81,82,84,],[9,9,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,9,9,9,9,9,9,9,9,9,9,9,9,-48,9,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,9,-34,9,9,-37,-38,9,9,9,9,9,9,9,-49,-39,9,-36,-47,-40,]),'PENUP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[10,10,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,10,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,10,10,10,-49,-39,10,-36,-47,-40,]),'PU':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[11,11,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,11,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,11,11,11,-49,-39,11,-36,-47,-40,]),'PENDOWN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[12,12,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,12,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,12,12,12,-49,-39,12,-36,-47,-40,]),'PD':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[13,13,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,13,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,13,13,13,-49,-39,13,-36,-47,-40,]),'WIPECLEAN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[14,14,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,14,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,14,14,14,-49,-39,14,-36,-47,-40,]),'WC':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[15,15,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,15,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,15,15,15,-49,-39,15,-36,-47,-40,]),'CLEARSCREEN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[16,16,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,16,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,16,16,16,-49,-39,16,-36,-47,-40,]),'CS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[17,17,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,17,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,17,17,17,-49,-39,17,-36,-47,-40,]),'HOME':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[18,18,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,18,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,18,18,18,-49,-39,18,-36,-47,-40,]),'XCOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[19,19,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,19,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,19,19,19,-49,-39,19,-36,-47,-40,]),'YCOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[20,20,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,20,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,20,20,20,-49,-39,20,-36,-47,-40,]),'HEADING':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[21,21,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,21,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,21,21,21,-49,-39,21,-36,-47,-40,]),'RANDOM':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[22,22,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,22,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,22,22,22,-49,-39,22,-36,-47,-40,]),'TYPEIN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[23,23,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,23,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,23,23,23,-49,-39,23,-36,-47,-40,]),'FORWARD':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[24,24,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,24,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,24,24,24,-49,-39,24,-36,-47,-40,]),'FO':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[25,25,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,25,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,25,25,25,-49,-39,25,-36,-47,-40,]),'BK':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[26,26,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,26,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,26,26,26,-49,-39,26,-36,-47,-40,]),'BACKWARD':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[27,27,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,27,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,27,27,27,-49,-39,27,-36,-47,-40,]),'RIGHT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[28,28,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,28,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,28,28,28,-49,-39,28,-36,-47,-40,]),'RT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[29,29,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,29,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,29,29,29,-49,-39,29,-36,-47,-40,]),'LEFT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[30,30,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,30,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,30,30,30,-49,-39,30,-36,-47,-40,]),'LT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[31,31,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,31,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,31,31,31,-49,-39,31,-36,-47,-40,]),'PRINT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[32,32,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,32,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,32,32,32,-49,-39,32,-36,-47,-40,]),'SETXY':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[33,33,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,33,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,33,33,33,-49,-39,33,-36,-47,-40,]),'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[34,34,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,34,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,34,34,34,-49,-39,34,-36,-47,-40,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[35,35,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,35,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,35,35,35,-49,-39,35,-36,-47,-40,]),'TO':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,57,58,67,68,78,79,80,81,82,84,],[36,36,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,36,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,36,36,36,-49,-39,36,-36,-47,-40,]),'ARGUMENT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,41,42,43,44,45,46,47,48,49,50,55,57,58,67,68,78,79,80,81,82,84,],[37,37,-4,-5,-6,-7,-8,41,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,37,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,37,-34,37,37,78,-48,-39,37,-36,-47,-40,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,39,40,41,42,43,44,45,46,47,48,49,50,56,57,79,81,82,84,],[0,-10,-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,-10,-1,-3,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-2,-34,-39,-36,-47,-40,]),'END':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,41,42,43,44,45,46,47,48,49,50,57,69,76,77,78,79,81,82,83,84,],[-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,79,81,82,-48,-39,-36,-47,84,-40,]),'ELSE':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,41,42,43,44,45,46,47,48,49,50,57,69,79,81,82,84,],[-4,-5,-6,-7,-8,-9,-35,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-48,-49,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,80,-39,-36,-47,-40,]),'EQUALS':([9,53,],[-35,62,]),'GREATER':([9,53,],[-35,63,]),'LOWER':([9,53,],[-35,64,]),'GREATEQ':([9,53,],[-35,65,]),'LOWEQ':([9,53,],[-35,66,]),'THEN':([9,52,54,70,71,72,73,74,75,],[-35,58,67,-46,-41,-42,-43,-44,-45,]),'AND':([9,52,54,70,71,72,73,74,75,],[-35,60,60,60,-41,-42,-43,-44,-45,]),'OR':([9,52,54,70,71,72,73,74,75,],[-35,61,61,61,-41,-42,-43,-44,-45,]),'IDENTIFIER':([36,],[55,]),}
+_lr_action_items = {'NUMBER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,39,42,43,44,45,46,47,48,49,50,51,52,53,54,55,61,62,63,64,65,66,67,68,69,70,71,72,73,74,84,85,86,87,88,90,],[9,9,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,9,9,9,9,9,9,9,9,9,9,9,9,9,9,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,9,9,-37,-34,-38,9,9,-41,-42,9,9,9,9,9,9,9,-52,-53,-43,9,-40,-51,-44,]),'ARGUMENT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,39,42,43,44,45,46,47,48,49,50,51,52,53,54,55,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,84,85,86,87,88,90,],[10,10,-4,-5,-6,-7,-8,42,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,44,44,44,44,44,44,44,44,44,44,44,44,44,10,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,44,44,-37,74,-34,-38,10,44,-41,-42,44,44,44,44,44,10,84,-52,-52,-43,10,-40,-51,-44,]),'PENUP':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[11,11,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,11,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,11,11,11,-52,-53,-43,11,-40,-51,-44,]),'PU':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[12,12,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,12,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,12,12,12,-52,-53,-43,12,-40,-51,-44,]),'PENDOWN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[13,13,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,13,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,13,13,13,-52,-53,-43,13,-40,-51,-44,]),'PD':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[14,14,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,14,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,14,14,14,-52,-53,-43,14,-40,-51,-44,]),'WIPECLEAN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[15,15,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,15,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,15,15,15,-52,-53,-43,15,-40,-51,-44,]),'WC':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[16,16,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,16,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,16,16,16,-52,-53,-43,16,-40,-51,-44,]),'CLEARSCREEN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[17,17,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,17,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,17,17,17,-52,-53,-43,17,-40,-51,-44,]),'CS':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[18,18,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,18,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,18,18,18,-52,-53,-43,18,-40,-51,-44,]),'HOME':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[19,19,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,19,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,19,19,19,-52,-53,-43,19,-40,-51,-44,]),'XCOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[20,20,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,20,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,20,20,20,-52,-53,-43,20,-40,-51,-44,]),'YCOR':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[21,21,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,21,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,21,21,21,-52,-53,-43,21,-40,-51,-44,]),'HEADING':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[22,22,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,22,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,22,22,22,-52,-53,-43,22,-40,-51,-44,]),'RANDOM':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[23,23,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,23,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,23,23,23,-52,-53,-43,23,-40,-51,-44,]),'TYPEIN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[24,24,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,24,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,24,24,24,-52,-53,-43,24,-40,-51,-44,]),'FORWARD':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[25,25,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,25,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,25,25,25,-52,-53,-43,25,-40,-51,-44,]),'FO':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[26,26,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,26,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,26,26,26,-52,-53,-43,26,-40,-51,-44,]),'BK':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[27,27,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,27,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,27,27,27,-52,-53,-43,27,-40,-51,-44,]),'BACKWARD':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[28,28,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,28,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,28,28,28,-52,-53,-43,28,-40,-51,-44,]),'RIGHT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[29,29,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,29,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,29,29,29,-52,-53,-43,29,-40,-51,-44,]),'RT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[30,30,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,30,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,30,30,30,-52,-53,-43,30,-40,-51,-44,]),'LEFT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[31,31,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,31,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,31,31,31,-52,-53,-43,31,-40,-51,-44,]),'LT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[32,32,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,32,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,32,32,32,-52,-53,-43,32,-40,-51,-44,]),'PRINT':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[33,33,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,33,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,33,33,33,-52,-53,-43,33,-40,-51,-44,]),'SETXY':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[34,34,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,34,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,34,34,34,-52,-53,-43,34,-40,-51,-44,]),'IDENTIFIER':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,38,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[35,35,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,59,35,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,35,35,35,-52,-53,-43,35,-40,-51,-44,]),'IF':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[36,36,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,36,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,36,36,36,-52,-53,-43,36,-40,-51,-44,]),'WHILE':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[37,37,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,37,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,37,37,37,-52,-53,-43,37,-40,-51,-44,]),'TO':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,63,72,73,74,84,85,86,87,88,90,],[38,38,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,38,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,38,38,38,-52,-53,-43,38,-40,-51,-44,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,39,40,41,42,43,44,45,46,47,48,49,50,51,52,54,55,60,61,62,85,87,88,90,],[0,-10,-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,-10,-1,-3,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-2,-34,-38,-43,-40,-51,-44,]),'END':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,75,82,83,84,85,87,88,89,90,],[-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,85,87,88,-52,-43,-40,-51,90,-44,]),'ELSE':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,35,42,43,44,45,46,47,48,49,50,51,52,54,55,61,62,75,85,87,88,90,],[-4,-5,-6,-7,-8,-9,-39,-52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-24,-35,-53,-25,-54,-26,-27,-28,-29,-30,-31,-32,-33,-36,-37,-34,-38,86,-43,-40,-51,-44,]),'EQUALS':([9,44,57,],[-39,-54,67,]),'GREATER':([9,44,57,],[-39,-54,68,]),'LOWER':([9,44,57,],[-39,-54,69,]),'GREATEQ':([9,44,57,],[-39,-54,70,]),'LOWEQ':([9,44,57,],[-39,-54,71,]),'THEN':([9,44,56,58,76,77,78,79,80,81,],[-39,-54,63,72,-50,-45,-46,-47,-48,-49,]),'AND':([9,44,56,58,76,77,78,79,80,81,],[-39,-54,65,65,65,-45,-46,-47,-48,-49,]),'OR':([9,44,56,58,76,77,78,79,80,81,],[-39,-54,66,66,66,-45,-46,-47,-48,-49,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'expression':([0,2,38,58,67,68,80,],[2,38,38,69,76,77,83,]),'value_expr':([0,2,24,25,26,27,28,29,30,31,32,33,34,35,38,51,58,59,62,63,64,65,66,67,68,80,],[3,3,42,43,44,45,46,47,48,49,50,51,53,53,3,57,3,53,71,72,73,74,75,3,3,3,]),'logo_expr':([0,2,38,58,67,68,80,],[4,4,4,4,4,4,4,]),'if_stmt':([0,2,38,58,67,68,80,],[5,5,5,5,5,5,5,]),'loop_stmt':([0,2,38,58,67,68,80,],[6,6,6,6,6,6,6,]),'assign_expr':([0,2,38,58,67,68,80,],[7,7,7,7,7,7,7,]),'params':([0,2,38,55,58,67,68,80,],[8,8,8,68,8,8,8,8,]),'other_expression':([2,38,],[39,56,]),'empty':([2,38,],[40,40,]),'bool_expr':([34,35,59,],[52,54,70,]),'bool_expr_operator':([52,54,70,],[59,59,59,]),}
+_lr_goto_items = {'program':([0,],[1,]),'expression':([0,2,39,63,72,73,86,],[2,39,39,75,82,83,89,]),'value_expr':([0,2,25,26,27,28,29,30,31,32,33,34,35,36,37,39,53,54,63,64,67,68,69,70,71,72,73,86,],[3,3,43,45,46,47,48,49,50,51,52,53,55,57,57,3,61,62,3,57,77,78,79,80,81,3,3,3,]),'logo_expr':([0,2,39,63,72,73,86,],[4,4,4,4,4,4,4,]),'if_stmt':([0,2,39,63,72,73,86,],[5,5,5,5,5,5,5,]),'loop_stmt':([0,2,39,63,72,73,86,],[6,6,6,6,6,6,6,]),'assign_expr':([0,2,39,63,72,73,86,],[7,7,7,7,7,7,7,]),'params':([0,2,39,59,63,72,73,86,],[8,8,8,73,8,8,8,8,]),'other_expression':([2,39,],[40,60,]),'empty':([2,39,],[41,41,]),'call_args':([35,],[54,]),'bool_expr':([36,37,64,],[56,58,76,]),'bool_expr_operator':([56,58,76,],[64,64,64,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,53 +27,58 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> expression other_expression','program',2,'p_program','logo_tree.py',13),
-  ('other_expression -> expression other_expression','other_expression',2,'p_another_statement','logo_tree.py',23),
-  ('other_expression -> empty','other_expression',1,'p_another_statement','logo_tree.py',24),
-  ('expression -> value_expr','expression',1,'p_expr','logo_tree.py',36),
-  ('expression -> logo_expr','expression',1,'p_expr','logo_tree.py',37),
-  ('expression -> if_stmt','expression',1,'p_expr','logo_tree.py',38),
-  ('expression -> loop_stmt','expression',1,'p_expr','logo_tree.py',39),
-  ('expression -> assign_expr','expression',1,'p_expr','logo_tree.py',40),
-  ('expression -> params','expression',1,'p_expr','logo_tree.py',41),
-  ('empty -> <empty>','empty',0,'p_empty','logo_tree.py',49),
-  ('logo_expr -> PENUP','logo_expr',1,'p_func','logo_tree.py',54),
-  ('logo_expr -> PU','logo_expr',1,'p_func','logo_tree.py',55),
-  ('logo_expr -> PENDOWN','logo_expr',1,'p_func','logo_tree.py',56),
-  ('logo_expr -> PD','logo_expr',1,'p_func','logo_tree.py',57),
-  ('logo_expr -> WIPECLEAN','logo_expr',1,'p_func','logo_tree.py',58),
-  ('logo_expr -> WC','logo_expr',1,'p_func','logo_tree.py',59),
-  ('logo_expr -> CLEARSCREEN','logo_expr',1,'p_func','logo_tree.py',60),
-  ('logo_expr -> CS','logo_expr',1,'p_func','logo_tree.py',61),
-  ('logo_expr -> HOME','logo_expr',1,'p_func','logo_tree.py',62),
-  ('logo_expr -> XCOR','logo_expr',1,'p_func','logo_tree.py',63),
-  ('logo_expr -> YCOR','logo_expr',1,'p_func','logo_tree.py',64),
-  ('logo_expr -> HEADING','logo_expr',1,'p_func','logo_tree.py',65),
-  ('logo_expr -> RANDOM','logo_expr',1,'p_func','logo_tree.py',66),
-  ('logo_expr -> TYPEIN','logo_expr',1,'p_func','logo_tree.py',67),
-  ('logo_expr -> FORWARD value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',74),
-  ('logo_expr -> FO value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',75),
-  ('logo_expr -> BK value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',76),
-  ('logo_expr -> BACKWARD value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',77),
-  ('logo_expr -> RIGHT value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',78),
-  ('logo_expr -> RT value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',79),
-  ('logo_expr -> LEFT value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',80),
-  ('logo_expr -> LT value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',81),
-  ('logo_expr -> PRINT value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',82),
-  ('logo_expr -> SETXY value_expr value_expr','logo_expr',3,'p_two_params_func','logo_tree.py',92),
-  ('value_expr -> NUMBER','value_expr',1,'p_value_expr_num','logo_tree.py',102),
-  ('loop_stmt -> WHILE bool_expr THEN expression END','loop_stmt',5,'p_loop','logo_tree.py',111),
-  ('bool_expr_operator -> AND','bool_expr_operator',1,'p_and_or','logo_tree.py',123),
-  ('bool_expr_operator -> OR','bool_expr_operator',1,'p_and_or','logo_tree.py',124),
-  ('if_stmt -> IF bool_expr THEN expression END','if_stmt',5,'p_if','logo_tree.py',131),
-  ('if_stmt -> IF bool_expr THEN expression ELSE expression END','if_stmt',7,'p_if_else','logo_tree.py',144),
-  ('bool_expr -> value_expr EQUALS value_expr','bool_expr',3,'p_boolean_expr','logo_tree.py',159),
-  ('bool_expr -> value_expr GREATER value_expr','bool_expr',3,'p_boolean_expr','logo_tree.py',160),
-  ('bool_expr -> value_expr LOWER value_expr','bool_expr',3,'p_boolean_expr','logo_tree.py',161),
-  ('bool_expr -> value_expr GREATEQ value_expr','bool_expr',3,'p_boolean_expr','logo_tree.py',162),
-  ('bool_expr -> value_expr LOWEQ value_expr','bool_expr',3,'p_boolean_expr','logo_tree.py',163),
-  ('bool_expr -> bool_expr bool_expr_operator bool_expr','bool_expr',3,'p_one_more_bool_expr','logo_tree.py',174),
-  ('assign_expr -> TO IDENTIFIER params expression END','assign_expr',5,'p_assign','logo_tree.py',184),
-  ('params -> ARGUMENT','params',1,'p_param','logo_tree.py',195),
-  ('params -> params ARGUMENT','params',2,'p_param','logo_tree.py',196),
+  ('program -> expression other_expression','program',2,'p_program','logo_tree.py',18),
+  ('other_expression -> expression other_expression','other_expression',2,'p_another_statement','logo_tree.py',29),
+  ('other_expression -> empty','other_expression',1,'p_another_statement','logo_tree.py',30),
+  ('expression -> value_expr','expression',1,'p_expr','logo_tree.py',41),
+  ('expression -> logo_expr','expression',1,'p_expr','logo_tree.py',42),
+  ('expression -> if_stmt','expression',1,'p_expr','logo_tree.py',43),
+  ('expression -> loop_stmt','expression',1,'p_expr','logo_tree.py',44),
+  ('expression -> assign_expr','expression',1,'p_expr','logo_tree.py',45),
+  ('expression -> params','expression',1,'p_expr','logo_tree.py',46),
+  ('empty -> <empty>','empty',0,'p_empty','logo_tree.py',52),
+  ('logo_expr -> PENUP','logo_expr',1,'p_func','logo_tree.py',57),
+  ('logo_expr -> PU','logo_expr',1,'p_func','logo_tree.py',58),
+  ('logo_expr -> PENDOWN','logo_expr',1,'p_func','logo_tree.py',59),
+  ('logo_expr -> PD','logo_expr',1,'p_func','logo_tree.py',60),
+  ('logo_expr -> WIPECLEAN','logo_expr',1,'p_func','logo_tree.py',61),
+  ('logo_expr -> WC','logo_expr',1,'p_func','logo_tree.py',62),
+  ('logo_expr -> CLEARSCREEN','logo_expr',1,'p_func','logo_tree.py',63),
+  ('logo_expr -> CS','logo_expr',1,'p_func','logo_tree.py',64),
+  ('logo_expr -> HOME','logo_expr',1,'p_func','logo_tree.py',65),
+  ('logo_expr -> XCOR','logo_expr',1,'p_func','logo_tree.py',66),
+  ('logo_expr -> YCOR','logo_expr',1,'p_func','logo_tree.py',67),
+  ('logo_expr -> HEADING','logo_expr',1,'p_func','logo_tree.py',68),
+  ('logo_expr -> RANDOM','logo_expr',1,'p_func','logo_tree.py',69),
+  ('logo_expr -> TYPEIN','logo_expr',1,'p_func','logo_tree.py',70),
+  ('logo_expr -> FORWARD value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',78),
+  ('logo_expr -> FO value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',79),
+  ('logo_expr -> BK value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',80),
+  ('logo_expr -> BACKWARD value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',81),
+  ('logo_expr -> RIGHT value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',82),
+  ('logo_expr -> RT value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',83),
+  ('logo_expr -> LEFT value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',84),
+  ('logo_expr -> LT value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',85),
+  ('logo_expr -> PRINT value_expr','logo_expr',2,'p_only_param_func','logo_tree.py',86),
+  ('logo_expr -> SETXY value_expr value_expr','logo_expr',3,'p_two_params_func','logo_tree.py',98),
+  ('logo_expr -> IDENTIFIER','logo_expr',1,'p_call','logo_tree.py',109),
+  ('logo_expr -> IDENTIFIER call_args','logo_expr',2,'p_call','logo_tree.py',110),
+  ('call_args -> value_expr','call_args',1,'p_call_args','logo_tree.py',120),
+  ('call_args -> call_args value_expr','call_args',2,'p_call_args','logo_tree.py',121),
+  ('value_expr -> NUMBER','value_expr',1,'p_value_expr_num','logo_tree.py',131),
+  ('loop_stmt -> WHILE bool_expr THEN expression END','loop_stmt',5,'p_loop','logo_tree.py',139),
+  ('bool_expr_operator -> AND','bool_expr_operator',1,'p_and_or','logo_tree.py',147),
+  ('bool_expr_operator -> OR','bool_expr_operator',1,'p_and_or','logo_tree.py',148),
+  ('if_stmt -> IF bool_expr THEN expression END','if_stmt',5,'p_if','logo_tree.py',155),
+  ('if_stmt -> IF bool_expr THEN expression ELSE expression END','if_stmt',7,'p_if_else','logo_tree.py',164),
+  ('bool_expr -> value_expr EQUALS value_expr','bool_expr',3,'p_boolean_expr','logo_tree.py',173),
+  ('bool_expr -> value_expr GREATER value_expr','bool_expr',3,'p_boolean_expr','logo_tree.py',174),
+  ('bool_expr -> value_expr LOWER value_expr','bool_expr',3,'p_boolean_expr','logo_tree.py',175),
+  ('bool_expr -> value_expr GREATEQ value_expr','bool_expr',3,'p_boolean_expr','logo_tree.py',176),
+  ('bool_expr -> value_expr LOWEQ value_expr','bool_expr',3,'p_boolean_expr','logo_tree.py',177),
+  ('bool_expr -> bool_expr bool_expr_operator bool_expr','bool_expr',3,'p_one_more_bool_expr','logo_tree.py',190),
+  ('assign_expr -> TO IDENTIFIER params expression END','assign_expr',5,'p_assign','logo_tree.py',202),
+  ('params -> ARGUMENT','params',1,'p_param','logo_tree.py',213),
+  ('params -> params ARGUMENT','params',2,'p_param','logo_tree.py',214),
+  ('value_expr -> ARGUMENT','value_expr',1,'p_value_expr_param','logo_tree.py',229),
 ]
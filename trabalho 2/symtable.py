@@ -19,8 +19,6 @@
 
 """Implement a symbol table."""
 
-__symtable = {}
-
 
 class SymbolRedefinitionError(Exception):
     """Error raised when a symbol is already defined."""
@@ -41,34 +39,87 @@ class InternalError(Exception):
         super().__init__(f"Internal error: {msg}")
 
 
-def add_symbol(symbol, sym_type, lineno, **kwargs):
-    """Create new symbol in the symbol table."""
-    obj = get_symbol(symbol)
+class SymbolTable:
+    """A symbol table with nested scopes.
+
+    Each scope is a dict, and scopes are kept in a stack, so entering and
+    leaving a scope are O(1). Lookups search from the innermost scope out,
+    and a symbol may shadow one from an outer scope.
+    """
+
+    def __init__(self):
+        """Initialize table with an empty global scope."""
+        self.scopes = [{}]
+
+    def push_scope(self):
+        """Enter a new scope."""
+        self.scopes.append({})
+
+    def pop_scope(self):
+        """Leave the current scope, returning its symbols."""
+        if len(self.scopes) == 1:
+            raise InternalError("Cannot leave the global scope.")
+        return self.scopes.pop()
+
+    def reset(self):
+        """Remove every symbol and scope."""
+        self.scopes = [{}]
+
+    def add_symbol(self, symbol, sym_type, lineno, **kwargs):
+        """Create new symbol in the current scope."""
+        obj = self.scopes[-1].get(symbol)
+
+        if obj:
+            raise SymbolRedefinitionError(obj, lineno)
+
+        kwargs["name"] = symbol
+        kwargs["type"] = sym_type
+        kwargs["lineno"] = lineno
+        self.scopes[-1][symbol] = kwargs
+        return kwargs
+
+    def set_symbol(self, symbol, **kwargs):
+        """Set values of a symbol in symbol table."""
+        obj = self.get_symbol(symbol)
+        if obj is None:
+            raise InternalError(f"Symbol not defined: {symbol}")
+        if "name" in kwargs:
+            raise InternalError(
+                f"Cannot modify symbol '{symbol}' attribute 'name'."
+            )
+        if "lineno" in kwargs:
+            raise InternalError(
+                f"Cannot modify symbol {symbol} attribute 'line'."
+            )
+        obj.update(kwargs)
+
+    def get_symbol(self, symbol):
+        """Retrieve symbol from the innermost scope that defines it."""
+        for scope in reversed(self.scopes):
+            obj = scope.get(symbol)
+            if obj is not None:
+                return obj
+        return None
+
+
+__symtable = SymbolTable()
 
-    if obj:
-        raise SymbolRedefinitionError(obj, lineno)
 
-    kwargs["name"] = symbol
-    kwargs["type"] = sym_type
-    kwargs["lineno"] = lineno
-    __symtable[symbol] = kwargs
-    return __symtable[symbol]
+def add_symbol(symbol, sym_type, lineno, **kwargs):
+    """Create new symbol in the default symbol table."""
+    return __symtable.add_symbol(symbol, sym_type, lineno, **kwargs)
 
 
 def set_symbol(symbol, **kwargs):
-    """Set values of a symbol in symbol table."""
-    obj = get_symbol(symbol)
-    if obj is None:
-        raise InternalError(f"Symbol not defined: {symbol}")
-    if "name" in kwargs:
-        raise InternalError(
-            f"Cannot modify symbol '{symbol}' attribute 'name'."
-        )
-    if "lineno" in kwargs:
-        raise InternalError(f"Cannot modify symbol {symbol} attribute 'line'.")
-    obj.update(kwargs)
+    """Set values of a symbol in the default symbol table."""
+    __symtable.set_symbol(symbol, **kwargs)
 
 
 def get_symbol(symbol):
-    """Retrieve symbol from symbol table."""
-    return __symtable.get(symbol)
+    """Retrieve symbol from the default symbol table."""
+    return __symtable.get_symbol(symbol)
+
+
+def reset():
+    """Remove every symbol from the default symbol table."""
+    __symtable.reset()
@@ -0,0 +1,56 @@
+"""Tests for logo_batch."""
+
+import os
+
+from logo_batch import main
+
+SOURCES = {
+    "good.logo": "FORWARD 10 RIGHT 90",
+    "illegal.logo": "FORWARD 10 $ RIGHT 90 @",
+    "syntax.logo": "FORWARD 10 # FORWARD",
+}
+
+
+def __outputs(directory):
+    outputs = {}
+    for base, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(base, name)
+            with open(path, "rb") as output:
+                outputs[os.path.relpath(path, directory)] = output.read()
+    return outputs
+
+
+def test_errors_are_reported_per_file(tmp_path, capsys):
+    sources = tmp_path / "src"
+    sources.mkdir()
+    for name, text in SOURCES.items():
+        (sources / name).write_text(text)
+    results = []
+    for jobs in ("1", "2"):
+        output = tmp_path / f"build{jobs}"
+        assert main([str(sources), "-o", str(output), "-j", jobs]) == 1
+        results.append((__outputs(output), capsys.readouterr().err))
+    assert results[0] == results[1]
+    outputs, report = results[0]
+    assert sorted(outputs) == ["good.tree", "illegal.err", "syntax.err"]
+    errors = outputs["illegal.err"].decode().splitlines()
+    assert len(errors) == 2
+    assert "Illegal character '$'" in errors[0]
+    assert "Illegal character '@'" in errors[1]
+    assert all(str(sources / "illegal.logo") in line for line in errors)
+    assert "Illegal character '#'" in outputs["syntax.err"].decode()
+    assert len(report.splitlines()) == 4
+
+
+def test_stale_outputs_are_removed(tmp_path):
+    sources = tmp_path / "src"
+    sources.mkdir()
+    program = sources / "program.logo"
+    output = tmp_path / "build"
+    program.write_text("FORWARD $")
+    main([str(sources), "-o", str(output), "-j", "1"])
+    assert sorted(__outputs(output)) == ["program.err"]
+    program.write_text("FORWARD 10")
+    main([str(sources), "-o", str(output), "-j", "1"])
+    assert sorted(__outputs(output)) == ["program.tree"]
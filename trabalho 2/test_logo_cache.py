@@ -0,0 +1,45 @@
+"""Tests for logo_cache and tree_io."""
+
+import os
+
+import pytest
+
+import tree_io
+from logo_cache import SUFFIX, TreeCache
+from logo_lexer import lexer
+from logo_tree import parser
+
+SOURCE = "FORWARD 10 RIGHT 90"
+
+
+def test_truncated_entries_are_evicted(tmp_path):
+    cache = TreeCache(str(tmp_path))
+    expected = cache.parse(SOURCE)
+    path = cache.path(SOURCE)
+    with open(path, "rb") as source:
+        data = source.read()
+    for size in range(len(data)):
+        with open(path, "wb") as output:
+            output.write(data[:size])
+        assert cache.get(SOURCE) is None
+        assert not os.path.exists(path)
+        assert repr(cache.parse(SOURCE)) == repr(expected)
+
+
+def test_truncated_data_raises_format_error():
+    data = tree_io.dumps(parser().parse(SOURCE, lexer=lexer()))
+    for size in range(len(data)):
+        with pytest.raises(tree_io.FormatError):
+            tree_io.loads(data[:size])
+
+
+def test_large_integers_are_not_cached(tmp_path):
+    cache = TreeCache(str(tmp_path))
+    program = cache.parse("FORWARD 99999999999999999999")
+    assert program is not None
+    with pytest.raises(tree_io.FormatError):
+        cache.put("FORWARD 99999999999999999999", program)
+    assert os.listdir(tmp_path) == []
+    cache.parse(SOURCE)
+    assert [name.endswith(SUFFIX) for name in os.listdir(tmp_path)] == [True]
+
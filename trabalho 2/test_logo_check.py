@@ -0,0 +1,52 @@
+"""Tests for logo_check."""
+
+import pytest
+
+from logo_check import check, parser
+from logo_lexer import lexer
+
+
+@pytest.fixture(scope="module")
+def the_parser():
+    return parser()
+
+
+@pytest.mark.parametrize(
+    "source, kinds, columns",
+    [
+        ("IF 1 > 0 THEN FORWARD FORWARD END", ["if_stmt"], [23]),
+        ("WHILE 1 > 0 THEN FORWARD FORWARD END", ["loop_stmt"], [26]),
+        (
+            "IF 1 > 0 THEN FORWARD FORWARD 10 END FORWARD 5",
+            ["if_stmt", "logo_function"],
+            [23],
+        ),
+        ("FORWARD 1 END", ["logo_function", "error"], [11]),
+        (
+            "FORWARD 1 ELSE FORWARD 2",
+            ["logo_function", "error", "logo_function"],
+            [11],
+        ),
+        ("END", ["error"], [1]),
+        ("ELSE FORWARD 1", ["error", "logo_function"], [1]),
+        (
+            "IF 1 > THEN FORWARD 1 END FORWARD 3 RIGHT RIGHT 4",
+            ["error", "logo_function", "error", "logo_function"],
+            [8, 43],
+        ),
+    ],
+)
+def test_recovery(the_parser, source, kinds, columns):
+    program, errors = check(source, the_parser, lexer())
+    assert [statement.kind for statement in program.children] == kinds
+    assert [error.column for error in errors] == columns
+    assert all(error.kind == "syntax" for error in errors)
+
+
+def test_lexical_and_syntax_errors(the_parser):
+    program, errors = check("FORWARD $ 10\nRIGHT", the_parser, lexer())
+    assert program is None
+    assert [(error.kind, error.lineno) for error in errors] == [
+        ("lexical", 1),
+        ("syntax", 2),
+    ]
@@ -0,0 +1,18 @@
+"""Tests for logo_exec."""
+
+import pytest
+
+from logo_exec import Segment, take
+from logo_lexer import lexer
+from logo_tree import parser
+
+
+@pytest.mark.parametrize("detect_cycles", [False, True])
+def test_loops_that_end(detect_cycles):
+    program = parser().parse(
+        "TO F :A WHILE :A > 1 THEN FORWARD :A END END F 0 FORWARD 5",
+        lexer=lexer(),
+    )
+    assert take(program, 10, detect_cycles=detect_cycles) == [
+        Segment(0.0, 0.0, 0.0, 5.0)
+    ]
@@ -0,0 +1,114 @@
+"""Tests for logo_incremental."""
+
+import random
+
+import pytest
+
+from logo_gen import statement
+from logo_incremental import Document
+from logo_lexer import lexer
+from logo_tree import parser
+
+BLOCKS = [
+    "TO PROC :A IF :A > 1 THEN FORWARD :A ELSE RIGHT :A END END",
+    "WHILE 1 > 2 THEN IF 3 > 4 THEN LEFT 5 END END",
+]
+
+SNIPPETS = [
+    "END",
+    " END ",
+    "IF 1 > 0 THEN ",
+    "WHILE 2 > 1 THEN ",
+    "TO G :A ",
+    "FORWARD 3",
+    "\n",
+    "7",
+    " RIGHT ",
+    "ELSE",
+    ":A",
+    "",
+]
+
+
+def __generate(rand, statements):
+    lines = []
+    for _ in range(statements):
+        if rand.random() < 0.2:
+            lines.append(rand.choice(BLOCKS))
+        else:
+            lines.append(statement(rand))
+    return "\n".join(lines) + "\n"
+
+
+def __full(the_parser, text):
+    """Parse the whole text, returning None if it is not valid."""
+    try:
+        return the_parser.parse(text, lexer=lexer())
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def __edited(document, start, end, text):
+    """Edit a document, returning its program, or None on errors."""
+    try:
+        document.edit(start, end, text)
+        return document.program
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_edits_match_full_parse(seed):
+    rand = random.Random(seed)
+    the_parser = parser()
+    document = Document(
+        __generate(rand, rand.randint(5, 60)),
+        region_size=rand.choice([1, 2, 4]),
+    )
+    for _ in range(20):
+        text = document.text
+        start = rand.randrange(len(text) + 1)
+        # Long edits cross region boundaries.
+        end = min(len(text), start + rand.choice([0, 0, 1, 3, 10, 40]))
+        new = rand.choice(SNIPPETS)
+        expected = __full(the_parser, text[:start] + new + text[end:])
+        assert __edited(document, start, end, new) == expected
+
+
+def test_edit_across_regions():
+    lines = [f"FORWARD {index}" for index in range(1, 41)]
+    text = "\n".join(lines) + "\n"
+    document = Document(text, region_size=2)
+    start = text.index("FORWARD 5")
+    end = text.index("FORWARD 30")
+    document.edit(start, end, "IF 1 > 0 THEN RIGHT 9 END\n")
+    expected = parser().parse(document.text, lexer=lexer())
+    assert document.program == expected
+    assert len(document.program.children) == 40 - 25 + 1
+
+
+def test_failed_edit_grows_to_whole_text():
+    lines = [f"FORWARD {index}" for index in range(1, 41)]
+    document = Document("\n".join(lines) + "\n", region_size=1)
+    start = document.text.index("FORWARD 20")
+    with pytest.raises(SyntaxError):
+        document.edit(start, start, "IF 1 > 0 THEN ")
+    with pytest.raises(SyntaxError):
+        document.program
+    end = document.text.index("\n", start)
+    document.edit(end, end, " END")
+    expected = parser().parse(document.text, lexer=lexer())
+    assert document.program == expected
+    assert document.program.children[19].kind == "if_stmt"
+    # The next edit is incremental again.
+    reparsed = document.reparsed
+    start = document.text.index("FORWARD 3")
+    document.edit(start + 8, start + 9, "4")
+    assert document.reparsed - reparsed <= 4
+    assert document.program == parser().parse(document.text, lexer=lexer())
+
+
+def test_statements_without_keywords():
+    document = Document("FORWARD 1\n")
+    document.edit(0, 9, "70 7")
+    assert document.program == parser().parse("70 7", lexer=lexer())
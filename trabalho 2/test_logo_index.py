@@ -0,0 +1,130 @@
+"""Tests for logo_index, against a scan of all the segments."""
+
+import math
+import random
+
+import pytest
+
+from logo_exec import Segment
+from logo_index import SegmentIndex
+
+
+def __segments(seed, count):
+    """Return random segments, short and long, many crossing cells."""
+    rng = random.Random(seed)
+    segments = []
+    for _ in range(count):
+        x0 = rng.uniform(-100, 100)
+        y0 = rng.uniform(-100, 100)
+        length = rng.choice([0.0, 1.0, 10.0, 50.0, 300.0]) * rng.random()
+        angle = rng.uniform(0, 2 * math.pi)
+        if rng.random() < 0.2:
+            # Horizontal and vertical segments.
+            angle = rng.choice([0, math.pi / 2, math.pi, 3 * math.pi / 2])
+        x1 = x0 + length * math.cos(angle)
+        y1 = y0 + length * math.sin(angle)
+        segments.append(Segment(x0, y0, x1, y1))
+    return segments
+
+
+def __crosses(segment, xmin, ymin, xmax, ymax):
+    """Return whether a segment crosses a rectangle (Liang-Barsky)."""
+    x0, y0, x1, y1 = segment
+    dx = x1 - x0
+    dy = y1 - y0
+    start, end = 0.0, 1.0
+    for p, q in (
+        (-dx, x0 - xmin),
+        (dx, xmax - x0),
+        (-dy, y0 - ymin),
+        (dy, ymax - y0),
+    ):
+        if p == 0:
+            if q < 0:
+                return False
+        elif p < 0:
+            start = max(start, q / p)
+        else:
+            end = min(end, q / p)
+    return start <= end
+
+
+def __distance(segment, x, y):
+    x0, y0, x1, y1 = segment
+    dx = x1 - x0
+    dy = y1 - y0
+    squared = dx * dx + dy * dy
+    t = 0.0
+    if squared:
+        t = min(1.0, max(0.0, ((x - x0) * dx + (y - y0) * dy) / squared))
+    return math.hypot(x0 + t * dx - x, y0 + t * dy - y)
+
+
+def __rectangle(rng):
+    x = rng.uniform(-150, 150)
+    y = rng.uniform(-150, 150)
+    width = rng.choice([0.0, 1.0, 10.0, 100.0]) * rng.random()
+    height = rng.choice([0.0, 1.0, 10.0, 100.0]) * rng.random()
+    return x, y, x + width, y + height
+
+
+@pytest.mark.parametrize("cell_size", [None, 0.5, 3.0, 40.0])
+@pytest.mark.parametrize("seed", range(5))
+def test_query_matches_scan(seed, cell_size):
+    segments = __segments(seed, 200)
+    index = SegmentIndex(segments, cell_size)
+    rng = random.Random(seed)
+    empty = 0
+    for _ in range(100):
+        rectangle = __rectangle(rng)
+        expected = [
+            i
+            for i, segment in enumerate(segments)
+            if __crosses(segment, *rectangle)
+        ]
+        assert index.query(*rectangle).tolist() == expected
+        empty += not expected
+    assert empty
+
+
+@pytest.mark.parametrize("cell_size", [None, 0.5, 3.0, 40.0])
+@pytest.mark.parametrize("seed", range(5))
+def test_nearest_matches_scan(seed, cell_size):
+    segments = __segments(seed, 200)
+    index = SegmentIndex(segments, cell_size)
+    rng = random.Random(seed)
+    for _ in range(100):
+        x = rng.uniform(-400, 400)
+        y = rng.uniform(-400, 400)
+        distances = [__distance(segment, x, y) for segment in segments]
+        best = min(distances)
+        found, distance = index.nearest(x, y)
+        assert distance == pytest.approx(best, abs=1e-9)
+        assert distances[found] == pytest.approx(best, abs=1e-9)
+        radius = rng.uniform(0, 50)
+        result = index.nearest(x, y, radius)
+        if best > radius + 1e-9:
+            assert result is None
+        elif best < radius - 1e-9:
+            assert result[1] == pytest.approx(best, abs=1e-9)
+
+
+def test_segments_over_many_cells():
+    # The diagonal covers too many cells of a fine grid to be stored in it.
+    segments = [Segment(0, 0, 100, 100), Segment(0, 100, 1, 99)]
+    index = SegmentIndex(segments, cell_size=1.0)
+    assert index.large.tolist() == [0]
+    assert index.query(50.5, 50.5, 50.6, 50.6).tolist() == [0]
+    # The square is within the bounding box of the diagonal, not on it.
+    assert index.query(60, 10, 70, 20).tolist() == []
+    assert index.query(0.5, 99, 2, 100).tolist() == [1]
+    assert index.nearest(100, 0)[0] == 0
+
+
+def test_empty_results():
+    index = SegmentIndex(__segments(0, 50))
+    assert index.query(1000, 1000, 1001, 1001).tolist() == []
+    assert index.nearest(1000, 1000, radius=1.0) is None
+    empty = SegmentIndex([])
+    assert empty.query(0, 0, 1, 1).tolist() == []
+    assert empty.nearest(0, 0) is None
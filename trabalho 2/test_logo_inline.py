@@ -0,0 +1,70 @@
+"""Tests for logo_inline."""
+
+import pytest
+
+from logo_exec import ExecutionError, take
+from logo_inline import free_parameters, inline, procedures
+from logo_lexer import lexer
+from logo_tree import parser
+
+
+def __parse(source):
+    return parser().parse(source, lexer=lexer())
+
+
+def __events(program):
+    try:
+        return take(program, 100, max_steps=10000)
+    except ExecutionError as error:
+        return str(error)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "TO F :A FORWARD :A END F 10 F 20",
+        "F 5 TO F :A FORWARD :A END F 10",
+        "TO F :A FORWARD :A END F 1 "
+        "IF 1 > 0 THEN TO F :A BACKWARD :A END END F 2",
+        "TO F :A FORWARD :A END "
+        "TO G :B TO F :A RIGHT :A END END F 1 G 2 F 3",
+        "TO G :A F :A END TO F :A FORWARD :A END G 10 G 20",
+        "TO H :A G :A END TO G :A F :A END TO F :A FORWARD :A END "
+        "H 1 G 2 F 3",
+        "TO H :X FORWARD :A END TO F :A H 1 END F 10",
+        "TO H :X FORWARD :A END TO G :X H :X END TO F :A G 1 END F 10 G 2",
+        "TO H :X FORWARD :A END TO F :A H 1 END TO G :A F :A END G 10",
+    ],
+)
+@pytest.mark.parametrize("budget", [0, 20])
+def test_inlining_keeps_behavior(source, budget):
+    program = __parse(source)
+    inlined, _ = inline(program, budget=budget)
+    assert __events(inlined) == __events(program)
+
+
+def test_procedures_redefined_in_blocks_are_left_out():
+    program = __parse("TO F :A FORWARD :A END WHILE 1 > 0 THEN TO F :A PENUP END END")
+    assert procedures(program) == {}
+
+
+def test_calls_before_the_definition_stay_calls():
+    program = __parse("F 5 TO F :A FORWARD :A END F 10")
+    inlined, report = inline(program)
+    assert report.inlined == 1
+    assert __events(inlined) == "Undefined procedure: F"
+
+
+def test_free_parameters_follow_calls():
+    program = __parse(
+        "TO H :X FORWARD :A END TO G :X H :X END TO F :A G 1 END F 10"
+    )
+    assert free_parameters(program) == {"H": {":A"}, "G": {":A"}, "F": set()}
+
+
+def test_procedures_whose_callees_read_their_parameters_stay_calls():
+    program = __parse("TO H :X FORWARD :A END TO F :A H 1 END F 10")
+    inlined, report = inline(program)
+    assert report.inlined == 1
+    assert [node.kind for node in inlined.children] == ["assign_expr", "call"]
+    assert __events(inlined) == __events(program)
@@ -0,0 +1,85 @@
+"""Tests for logo_profile."""
+
+import io
+import itertools
+
+from logo_exec import Execution
+from logo_lexer import lexer
+from logo_profile import Profiler, main
+from logo_tree import parser
+
+
+def __profile(source):
+    program = parser().parse(source, lexer=lexer())
+    # Every reading of the clock takes a millisecond.
+    ticks = itertools.count()
+    profiler = Profiler(clock=lambda: next(ticks) / 1000)
+    execution = Execution(program, detect_cycles=False, profiler=profiler)
+    for _ in execution.events():
+        pass
+    return profiler
+
+
+def test_labels_and_lines():
+    profiler = __profile(
+        "FORWARD 1\n"
+        "TO SQUARE :N\n"
+        "  FORWARD :N\n"
+        "END\n"
+        "SQUARE 10\n"
+        "SQUARE 20\n"
+    )
+    statements = {
+        (stats.label, stats.lineno): stats.hits
+        for stats in profiler.statements.values()
+    }
+    assert statements == {
+        ("FORWARD", 1): 1,
+        ("TO SQUARE", 2): 1,
+        ("FORWARD", 3): 2,
+        ("SQUARE", 5): 1,
+        ("SQUARE", 6): 1,
+    }
+    procedure = profiler.procedures["SQUARE"]
+    assert (procedure.lineno, procedure.hits, procedure.segments) == (2, 2, 2)
+
+    lines = profiler.report().splitlines()
+    procedures = [line.strip() for line in lines].index("procedure")
+    assert lines[procedures + 1].split()[:3] == ["SQUARE", "2", "2"]
+    rows = {tuple(line.split()[:-4]) for line in lines[1:procedures - 1]}
+    assert rows == {
+        ("FORWARD", "1"),
+        ("TO", "SQUARE", "2"),
+        ("FORWARD", "3"),
+        ("SQUARE", "5"),
+        ("SQUARE", "6"),
+    }
+
+    output = io.StringIO()
+    profiler.write_folded(output)
+    frames = [
+        line.rsplit(" ", 1)[0] for line in output.getvalue().splitlines()
+    ]
+    assert frames == [
+        "FORWARD:1",
+        "SQUARE:5",
+        "SQUARE:5;FORWARD:3",
+        "SQUARE:6",
+        "SQUARE:6;FORWARD:3",
+        "TO_SQUARE:2",
+    ]
+
+
+def test_main(tmp_path, capsys):
+    path = tmp_path / "program.logo"
+    path.write_text(
+        "TO SQUARE :N WHILE :N > 0 THEN FORWARD :N END END\n"
+        "SQUARE 0\n"
+        "WHILE 1 > 0 THEN SQUARE 0 END\n"
+    )
+    folded = tmp_path / "program.folded"
+    assert main([str(path), "--max-steps", "100", "-o", str(folded)]) == 0
+    captured = capsys.readouterr()
+    assert "Step budget exceeded: 100" in captured.err
+    assert "SQUARE" in captured.out
+    assert folded.read_text()
@@ -0,0 +1,72 @@
+"""Tests for logo_redraw."""
+
+import random
+
+import pytest
+
+from logo_exec import execute
+from logo_lexer import lexer
+from logo_redraw import Drawing
+from logo_render import drawing
+from logo_tree import parser
+
+PROCEDURES = (
+    "TO SQ :N WHILE :N > 0 THEN FORWARD :N END END\n"
+    "TO CL :N IF :N > 1 THEN WIPECLEAN ELSE FORWARD :N END END\n"
+)
+
+STATEMENTS = [
+    "FORWARD 10",
+    "RIGHT 90",
+    "LEFT 45",
+    "PENUP",
+    "PENDOWN",
+    "SETXY 5 5",
+    "CLEARSCREEN",
+    "WIPECLEAN",
+    "IF 2 > 1 THEN CLEARSCREEN END",
+    "SQ 0",
+    "CL 3",
+    "CL 1",
+    "WHILE 1 > 0 THEN RIGHT 90 END",
+]
+
+
+def __check(the_drawing, the_parser, statements, budget):
+    program = the_parser.parse(
+        PROCEDURES + "\n".join(statements), lexer=lexer()
+    )
+    the_drawing.update(program)
+    expected, _ = drawing(execute(program), budget)
+    assert the_drawing.segments() == expected
+
+
+def test_erased_segments_do_not_count():
+    the_parser = parser()
+    the_drawing = Drawing(view=(0, 0, 100, 100), max_segments=2)
+    statements = ["FORWARD 10", "FORWARD 10", "CLEARSCREEN", "FORWARD 10"]
+    __check(the_drawing, the_parser, statements, 2)
+    assert len(the_drawing.segments()) == 1
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_edits_match_full_drawing(seed):
+    rand = random.Random(seed)
+    budget = rand.choice([1, 3, 5, 8, 20])
+    statements = [
+        rand.choice(STATEMENTS) for _ in range(rand.randint(1, 25))
+    ]
+    the_parser = parser()
+    the_drawing = Drawing(
+        view=(0, 0, 100, 100), size=64, tile_size=16, max_segments=budget
+    )
+    for _ in range(6):
+        __check(the_drawing, the_parser, statements, budget)
+        index = rand.randrange(len(statements))
+        choice = rand.random()
+        if choice < 0.5:
+            statements[index] = rand.choice(STATEMENTS)
+        elif choice < 0.75:
+            statements.insert(index, rand.choice(STATEMENTS))
+        elif len(statements) > 1:
+            del statements[index]
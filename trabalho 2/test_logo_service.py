@@ -0,0 +1,22 @@
+"""Tests for logo_service."""
+
+import asyncio
+
+from logo_service import LRUCache, RenderService
+
+
+def test_only_successful_results_are_cached():
+    async def run(service):
+        first = await service.render("svg", "FORWARD 10")
+        second = await service.render("svg", "FORWARD")
+        return first, second
+
+    cache = LRUCache()
+    service = RenderService(jobs=1, cache=cache)
+    try:
+        (ok, _), (error, _) = asyncio.run(run(service))
+    finally:
+        service.close()
+    assert ok["status"] == "ok"
+    assert error["status"] == "error"
+    assert len(cache) == 1
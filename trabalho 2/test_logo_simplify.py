@@ -0,0 +1,76 @@
+"""Tests for logo_simplify and logo_render.draw."""
+
+import math
+from itertools import islice
+
+from logo_exec import Move, Segment, execute
+from logo_lexer import lexer
+from logo_render import draw
+from logo_simplify import simplify
+from logo_tree import parser
+
+INFINITE = "WHILE 1 > 0 THEN FORWARD 10 END"
+
+
+def __parse(source):
+    return parser().parse(source, lexer=lexer())
+
+
+def __distance(x, y, segment):
+    """Return the distance from a point to a segment."""
+    x0, y0, x1, y1 = segment
+    dx, dy = x1 - x0, y1 - y0
+    length = dx * dx + dy * dy
+    t = ((x - x0) * dx + (y - y0) * dy) / length if length else 0.0
+    t = min(1.0, max(0.0, t))
+    return math.hypot(x - x0 - t * dx, y - y0 - t * dy)
+
+
+def test_draw_ends_on_infinite_runs():
+    segments, truncated = draw(__parse(INFINITE), max_segments=1000)
+    assert truncated
+    assert segments == [Segment(0.0, 0.0, 0.0, 10000.0)]
+    segments, truncated = draw(
+        __parse(INFINITE), max_segments=1000, max_steps=1_000_000
+    )
+    assert truncated
+    assert len(segments) == 1
+
+
+def test_simplify_streams_infinite_runs():
+    events = simplify(execute(__parse(INFINITE)), max_run=10)
+    segments = [event for event in islice(events, 5) if type(event) is Segment]
+    assert segments[2] == Segment(0.0, 110.0, 0.0, 210.0)
+
+
+def test_short_steps_are_merged():
+    events = [Segment(0.0, y, 0.0, y + 1.0) for y in range(50)]
+    assert list(simplify(events, 1.5)) == [Segment(0.0, 0.0, 0.0, 50.0)]
+
+
+def test_zero_length_runs_are_dropped():
+    events = [
+        Move(0.0, 0.0, 5.0, 0.0),
+        Move(5.0, 0.0, 0.0, 0.0),
+        Segment(0.0, 0.0, 0.0, 0.0),
+        Segment(0.0, 0.0, 1.0, 0.0),
+    ]
+    assert list(simplify(events)) == [Segment(0.0, 0.0, 1.0, 0.0)]
+
+
+def test_reversals_are_kept():
+    events = [Segment(0.0, 0.0, 10.0, 0.0), Segment(10.0, 0.0, 5.0, 0.0)]
+    assert list(simplify(events, 1.0)) == events
+
+
+def test_dropped_points_stay_within_tolerance():
+    program = __parse("\n".join(["FORWARD 2 RIGHT 1"] * 360))
+    events = list(execute(program))
+    for tolerance in (0.1, 0.5, 2.0):
+        simplified = list(simplify(events, tolerance))
+        assert len(simplified) < len(events)
+        for event in events:
+            assert min(
+                __distance(event.x1, event.y1, segment)
+                for segment in simplified
+            ) <= tolerance
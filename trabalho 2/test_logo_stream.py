@@ -0,0 +1,93 @@
+"""Tests for logo_stream."""
+
+import tracemalloc
+
+import pytest
+
+from logo_gen import generate_nested, generate_procedures, generate_program
+from logo_lexer import lexer
+from logo_stream import parse, parse_file, parser, statements
+from logo_tree import parser as tree_parser
+
+
+@pytest.fixture(scope="module")
+def the_parser():
+    return parser()
+
+
+def __batch(source):
+    return tree_parser().parse(source, lexer=lexer()).children
+
+
+def __lines(nodes):
+    return [node.lineno for node in nodes]
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        generate_program(3000, seed=1),
+        generate_procedures(1000, procedures=20, seed=2),
+        generate_nested(200, seed=3),
+        "FORWARD 10",
+    ],
+    ids=["long", "procedures", "nested", "one"],
+)
+def test_same_statements_as_batch(the_parser, source, tmp_path):
+    expected = __batch(source)
+    found = []
+    assert parse(source, found.append, the_parser) == len(expected)
+    assert found == list(expected)
+    assert __lines(found) == __lines(expected)
+
+    assert list(statements(source, the_parser)) == list(expected)
+
+    path = tmp_path / "program.logo"
+    path.write_text(source)
+    found = []
+    parse_file(path, found.append, the_parser, chunk_size=4096)
+    assert found == list(expected)
+    assert __lines(found) == __lines(expected)
+
+
+def test_syntax_errors_are_raised(the_parser):
+    with pytest.raises(Exception, match="Unexpected token"):
+        parse("FORWARD 10 END", lambda statement: None, the_parser)
+    with pytest.raises(Exception, match="Unexpected token"):
+        list(statements("FORWARD 10 END", the_parser))
+
+
+def test_closing_statements_stops_the_parse(the_parser):
+    source = generate_program(2000, seed=4)
+    stream = statements(source, the_parser, buffer=4)
+    first = [next(stream) for _ in range(10)]
+    stream.close()
+    assert first == list(__batch(source)[:10])
+
+
+def __peak(path, the_parser):
+    tracemalloc.start()
+    try:
+        parse_file(path, lambda statement: None, the_parser, chunk_size=4096)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory_is_bounded(the_parser, tmp_path):
+    peaks = []
+    for count in (2000, 20000):
+        path = tmp_path / f"{count}.logo"
+        path.write_text(generate_program(count, seed=5))
+        peaks.append(__peak(path, the_parser))
+    # Ten times the statements, about the same memory.
+    assert peaks[1] < 1.5 * peaks[0]
+
+    source = path.read_text()
+    tracemalloc.start()
+    try:
+        __batch(source)
+        batch = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peaks[1] * 10 < batch
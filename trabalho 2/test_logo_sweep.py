@@ -0,0 +1,88 @@
+"""Tests for logo_sweep, against running each argument vector alone."""
+
+import numpy as np
+
+from logo_exec import BudgetExceeded, Clear, Execution, Periodic, Segment
+from logo_lexer import lexer
+from logo_sweep import sweep
+from logo_tree import parser
+from tree import Node
+
+SOURCE = """
+TO ABC :SIZE :ANGLE
+    IF :ANGLE > 120 THEN RAY :SIZE :ANGLE ELSE TURN :SIZE :ANGLE END
+END
+TO RAY :S :A
+    IF :S > 50 THEN FORWARD :S ELSE STEPS :S :A END
+END
+TO STEPS :S :A
+    WHILE :A > 0 THEN FORWARD :S END
+END
+TO TURN :S :A
+    IF :A > 60 AND :S < 80 THEN WHILE 1 < 2 THEN RIGHT :A END
+    ELSE SETXY :S :A END
+END
+"""
+
+
+def __parse(source):
+    return parser().parse(source, lexer=lexer())
+
+
+def __separate(program, name, row, max_segments):
+    """Run a call alone, returning its segments and how it stopped."""
+    call = Node(
+        "call", tuple(Node("value_expr", value=value) for value in row), name
+    )
+    execution = Execution(
+        Node("program", program.children + (call,)), max_steps=1_000_000
+    )
+    segments = []
+    count = 0
+    try:
+        for event in execution.events():
+            if type(event) is Segment:
+                if count == max_segments:
+                    return segments, True, False
+                count += 1
+                segments.append(event)
+            elif type(event) is Clear:
+                segments.clear()
+            elif type(event) is Periodic and not (event.dx or event.dy):
+                # As logo_render.drawing, which the sweep follows.
+                break
+    except BudgetExceeded:
+        return segments, False, True
+    return segments, False, False
+
+
+def __check(program, name, rows, max_segments):
+    result = sweep(program, name, rows, max_segments=max_segments)
+    assert len(result) == len(rows)
+    for lane, row in enumerate(rows):
+        segments, truncated, exceeded = __separate(
+            program, name, row, max_segments
+        )
+        assert result.truncated[lane] == truncated
+        assert result.exceeded[lane] == exceeded
+        drawn = np.reshape(result.lane(lane), (-1, 4))
+        assert np.allclose(drawn, np.reshape(segments, (-1, 4)))
+
+
+def test_empty_sweep():
+    result = sweep(__parse(SOURCE), "ABC", [])
+    assert len(result) == 0
+    assert len(result.segments) == 0
+
+
+def test_sweep_matches_separate_runs():
+    rng = np.random.default_rng(0)
+    rows = np.column_stack(
+        (rng.integers(1, 100, 200), rng.integers(0, 360, 200))
+    )
+    __check(__parse(SOURCE), "ABC", rows.tolist(), 50)
+
+
+def test_loops_drawing_in_place():
+    program = __parse("TO F :A :B WHILE :B >= :B THEN FORWARD :A END END")
+    __check(program, "F", [[0, 1], [5, 2]], 50)
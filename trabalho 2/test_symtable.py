@@ -0,0 +1,128 @@
+"""Tests for symtable, and its use by logo_parser."""
+
+import io
+import tracemalloc
+
+import pytest
+
+from logo_gen import generate_program
+from logo_lexer import lexer
+from logo_parser import compile_program, parser
+from symtable import InternalError, SymbolRedefinitionError, SymbolTable
+
+
+@pytest.fixture(scope="module")
+def the_parser():
+    return parser()
+
+
+def __compile(source, the_parser):
+    output = io.StringIO()
+    compile_program(source, the_parser, lexer(), output)
+    return output.getvalue()
+
+
+def test_nested_scopes_and_shadowing():
+    table = SymbolTable()
+    table.add_symbol("A", "FUNC", 1, value=None)
+    table.add_symbol("X", "PARAM", 1)
+    table.push_scope()
+    table.add_symbol("X", "PARAM", 2)
+    table.add_symbol("Y", "PARAM", 2)
+    assert table.get_symbol("X")["lineno"] == 2
+    assert table.get_symbol("A")["lineno"] == 1
+    table.set_symbol("A", value="BODY")
+    assert set(table.pop_scope()) == {"X", "Y"}
+    assert table.get_symbol("X")["lineno"] == 1
+    assert table.get_symbol("Y") is None
+    assert table.get_symbol("A")["value"] == "BODY"
+
+
+def test_global_scope_cannot_be_left():
+    table = SymbolTable()
+    with pytest.raises(InternalError):
+        table.pop_scope()
+
+
+def test_redefinition_in_the_same_scope():
+    table = SymbolTable()
+    table.add_symbol("X", "PARAM", 1)
+    with pytest.raises(SymbolRedefinitionError, match="line 1"):
+        table.add_symbol("X", "PARAM", 2)
+
+
+def test_set_symbol_checks():
+    table = SymbolTable()
+    with pytest.raises(InternalError):
+        table.set_symbol("X", value=1)
+    table.add_symbol("X", "PARAM", 1)
+    with pytest.raises(InternalError):
+        table.set_symbol("X", name="Y")
+    with pytest.raises(InternalError):
+        table.set_symbol("X", lineno=2)
+
+
+def test_reset():
+    table = SymbolTable()
+    table.add_symbol("X", "PARAM", 1)
+    table.push_scope()
+    table.add_symbol("Y", "PARAM", 2)
+    table.reset()
+    assert table.scopes == [{}]
+    assert table.get_symbol("X") is None
+    table.add_symbol("X", "PARAM", 3)
+
+
+def test_parameters_are_scoped_to_their_procedure(the_parser):
+    __compile("TO A :X FORWARD 1 END TO B :X FORWARD 2 END", the_parser)
+    symtable = the_parser.symtable
+    assert symtable.scopes[1:] == []
+    assert symtable.get_symbol(":X") is None
+    assert symtable.get_symbol("A")["value"]
+    assert symtable.get_symbol("B")["value"]
+
+
+def test_nested_procedures_may_shadow_parameters(the_parser):
+    __compile("TO ABC :PARAM TO DEF :PARAM FORWARD 10 END END", the_parser)
+    symtable = the_parser.symtable
+    assert symtable.get_symbol("ABC")["value"]
+    # DEF is local to ABC.
+    assert symtable.get_symbol("DEF") is None
+
+
+def test_redefined_procedure_is_an_error(the_parser):
+    with pytest.raises(SymbolRedefinitionError):
+        __compile("TO A :X FORWARD 1 END TO A :Y FORWARD 2 END", the_parser)
+
+
+def test_recompiling_resets_the_table(the_parser):
+    source = "TO A :X FORWARD 10 END FORWARD 20"
+    first = __compile(source, the_parser)
+    # A failed compile leaves its symbols and open scopes behind.
+    with pytest.raises(SymbolRedefinitionError):
+        __compile("TO B :X TO C :Y :Y FORWARD 1 END END", the_parser)
+    assert __compile(source, the_parser) == first
+    assert len(the_parser.symtable.scopes) == 1
+
+
+def test_repeated_compiles_do_not_leak(the_parser):
+    sources = [generate_program(5, seed) for seed in range(20)]
+    sources.append("TO ABC :PARAM TO DEF :PARAM FORWARD 10 END END")
+    the_lexer = lexer()
+    output = io.StringIO()
+    count = 2000
+    usage = []
+    tracemalloc.start()
+    try:
+        for index in range(count):
+            compile_program(
+                sources[index % len(sources)], the_parser, the_lexer, output
+            )
+            output.seek(0)
+            output.truncate()
+            if index % (count // 10) == 0:
+                usage.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+    # The first round warms up caches, after that usage stays flat.
+    assert usage[-1] - usage[1] < 64 * 1024
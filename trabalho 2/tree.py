@@ -19,6 +19,8 @@
 
 """Create a syntax tree."""
 
+from operator import attrgetter, is_
+
 
 def new_node(name):
     """Create a new node object."""
@@ -34,3 +36,269 @@ def append_node(node, new_node):
 def new_leaf(name, **kwargs):
     """Create a new leaf object."""
     return dict(name=name, value=kwargs)
+
+
+_child_hash = attrgetter("hash")
+
+
+class Node:
+    """A compact syntax tree node.
+
+    Statements are stored flat in the ``program`` node, without the
+    ``expression``/``other_expression`` wrappers of the dict tree. Use
+    ``to_dict`` to get the dict shape back.
+
+    Nodes must not be modified after creation: each one carries the
+    structural hash of its subtree, and equal subtrees compare equal.
+    """
+
+    __slots__ = ("kind", "children", "value", "lineno", "hash")
+
+    def __init__(self, kind, children=(), value=None, lineno=None):
+        """Initialize node."""
+        self.kind = kind
+        self.children = children
+        self.value = value
+        self.lineno = lineno
+        self.hash = hash((kind, value, tuple(map(_child_hash, children))))
+
+    def __hash__(self):
+        """Return the structural hash of the subtree."""
+        return self.hash
+
+    def __eq__(self, other):
+        """Compare subtrees structurally, ignoring line numbers."""
+        if self is other:
+            return True
+        if not isinstance(other, Node) or self.hash != other.hash:
+            return False
+        return (
+            self.kind == other.kind
+            and self.value == other.value
+            and self.children == other.children
+        )
+
+    def __repr__(self):
+        """Represent node with its kind and value."""
+        return f"Node({self.kind!r}, value={self.value!r})"
+
+
+class Interner:
+    """Create nodes, sharing a single object for equal subtrees.
+
+    Shared nodes may appear in many places of a program, so they carry
+    no line number. Nodes are kept alive for the lifetime of the interner.
+    """
+
+    def __init__(self):
+        """Initialize an empty node table."""
+        self.__nodes = {}
+
+    def __call__(self, kind, children=(), value=None, lineno=None):
+        """Return the shared node for the given subtree."""
+        node = Node(kind, children, value)
+        return self.__nodes.setdefault(node, node)
+
+    def __len__(self):
+        """Return the number of distinct subtrees."""
+        return len(self.__nodes)
+
+
+def walk(root):
+    """Iterate over all nodes of a tree, in pre-order."""
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.children))
+
+
+class Visitor:
+    """Dispatch nodes to ``visit_<kind>`` methods."""
+
+    def __init__(self):
+        """Initialize the per-kind dispatch cache."""
+        self.__methods = {}
+
+    def visit(self, node):
+        """Visit a node."""
+        try:
+            method = self.__methods[node.kind]
+        except KeyError:
+            method = getattr(self, "visit_" + node.kind, self.generic_visit)
+            self.__methods[node.kind] = method
+        return method(node)
+
+    def generic_visit(self, node):
+        """Visit all children of a node."""
+        for child in node.children:
+            self.visit(child)
+
+
+__COMPARISON = {
+    "==": "EQUALS",
+    ">": "GREATER",
+    "<": "LOWER",
+    ">=": "GREATEQ",
+    "<=": "LOWEQ",
+}
+
+
+def __expression(node):
+    expression = new_node("expression")
+    append_node(expression, node)
+    return expression
+
+
+def __export_program(node, children):
+    program = new_node("program")
+    append_node(program, __expression(children[0]))
+    chain = None
+    for child in reversed(children[1:]):
+        other = new_node("other_expression")
+        append_node(other, __expression(child))
+        if chain:
+            append_node(other, chain)
+        chain = other
+    if chain:
+        append_node(program, chain)
+    return program
+
+
+def __export_function(node, children):
+    function = new_node("logo_function")
+    append_node(function, new_leaf(node.value, value=node.value))
+    for child in children:
+        append_node(function, child)
+    return function
+
+
+def __export_value(node, children):
+    value = new_node("value_expr")
+    append_node(value, new_leaf("NUM", value=node.value))
+    return value
+
+
+def __export_bool(node, children):
+    if node.value in __COMPARISON:
+        names = ("value_expr", __COMPARISON[node.value], "value_expr")
+    else:
+        names = ("bool_expr", "bool_expr_operator", "bool_expr")
+    expr = new_node("bool_expr")
+    append_node(expr, new_leaf(names[0], value=children[0]))
+    append_node(expr, new_leaf(names[1], value=node.value))
+    append_node(expr, new_leaf(names[2], value=children[1]))
+    return expr
+
+
+def __export_block(keyword):
+    def export(node, children):
+        block = new_node(node.kind)
+        append_node(block, keyword)
+        append_node(block, new_leaf("bool_expr", value=children[0]))
+        append_node(block, "THEN")
+        append_node(block, __expression(children[1]))
+        if len(children) > 2:
+            append_node(block, "ELSE")
+            append_node(block, __expression(children[2]))
+        append_node(block, "END")
+        return block
+
+    return export
+
+
+def __export_assign(node, children):
+    assign = new_node("assign_expr")
+    append_node(assign, new_leaf("TO", value="TO"))
+    append_node(assign, new_leaf("IDENTIFIER", value=node.value))
+    append_node(assign, new_leaf("params", value=children[0]))
+    body = __expression(children[1])
+    append_node(assign, new_leaf("expression", value=body))
+    append_node(assign, new_leaf("END", value="END"))
+    return assign
+
+
+def __export_arguments(node, children):
+    arguments = None
+    for name in node.value:
+        chain = new_node("arguments")
+        if arguments:
+            append_node(chain, arguments)
+        append_node(chain, name)
+        arguments = chain
+    return arguments
+
+
+def __export_call(node, children):
+    call = new_node("call")
+    append_node(call, new_leaf("IDENTIFIER", value=node.value))
+    for child in children:
+        append_node(call, child)
+    return call
+
+
+def __export_param(node, children):
+    value = new_node("value_expr")
+    append_node(value, new_leaf("ARGUMENT", value=node.value))
+    return value
+
+
+__EXPORT = {
+    "program": __export_program,
+    "logo_function": __export_function,
+    "value_expr": __export_value,
+    "bool_expr": __export_bool,
+    "loop_stmt": __export_block("WHILE"),
+    "if_stmt": __export_block("IF"),
+    "assign_expr": __export_assign,
+    "arguments": __export_arguments,
+    "call": __export_call,
+    "param": __export_param,
+}
+
+
+def transform(root, function, new_node=Node):
+    """Rebuild a tree bottom-up.
+
+    Each node is replaced by function(node, children), where children are
+    the already replaced children of the node. When function returns None,
+    the node is copied with the new children, unless they did not change.
+    """
+    results = []
+    stack = [(root, False)]
+    while stack:
+        node, ready = stack.pop()
+        if ready:
+            count = len(results) - len(node.children)
+            children = tuple(results[count:])
+            del results[count:]
+            replaced = function(node, children)
+            if replaced is None:
+                if all(map(is_, children, node.children)):
+                    replaced = node
+                else:
+                    replaced = new_node(
+                        node.kind, children, node.value, node.lineno
+                    )
+            results.append(replaced)
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node.children))
+    return results[0]
+
+
+def to_dict(root):
+    """Export a compact tree to the dict tree built by new_node/new_leaf."""
+    results = []
+    stack = [(root, False)]
+    while stack:
+        node, ready = stack.pop()
+        if ready:
+            count = len(results) - len(node.children)
+            children = results[count:]
+            del results[count:]
+            results.append(__EXPORT[node.kind](node, children))
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node.children))
+    return results[0]
@@ -0,0 +1,231 @@
+"""Read and write syntax trees in a compact binary format.
+
+The file starts with a header, followed by a table of the distinct node
+values, and by the nodes themselves as 32-bit words, in post-order:
+
+    kind, value, lineno + 1, number of children, child indexes...
+
+Both kinds and values are indexes in the value table. Shared subtrees
+are written once, so interned trees stay shared after loading.
+"""
+
+import array
+import gc
+import mmap
+import os
+import struct
+import sys
+
+from tree import Node
+
+MAGIC = b"LOGO"
+
+VERSION = 1
+
+HEADER = struct.Struct("<4sHH16sIII")
+
+NONE, INT, STR, STRINGS = range(4)
+
+
+class FormatError(Exception):
+    """Error raised when a file is not a valid tree file."""
+
+
+def __encode_str(text):
+    data = text.encode("utf-8")
+    return struct.pack("<I", len(data)) + data
+
+
+def __encode_value(value):
+    if value is None:
+        return bytes([NONE])
+    if isinstance(value, int):
+        if not -2**63 <= value < 2**63:
+            raise FormatError(f"Integer out of range: {value}")
+        return bytes([INT]) + struct.pack("<q", value)
+    if isinstance(value, str):
+        return bytes([STR]) + __encode_str(value)
+    if isinstance(value, tuple):
+        return (
+            bytes([STRINGS])
+            + struct.pack("<I", len(value))
+            + b"".join(__encode_str(item) for item in value)
+        )
+    raise FormatError(f"Cannot encode value: {value!r}")
+
+
+def dumps(root, tag=b""):
+    """Encode a tree as bytes.
+
+    The tag, up to 16 bytes, is stored in the header and can be checked
+    with read_tag, e.g. to store the grammar version.
+    """
+    values = {}
+    blob = []
+    nodes = {}
+    words = []
+
+    def value_index(value):
+        key = (type(value), value)
+        index = values.get(key)
+        if index is None:
+            index = values[key] = len(values)
+            blob.append(__encode_value(value))
+        return index
+
+    stack = [(root, False)]
+    while stack:
+        node, ready = stack.pop()
+        if id(node) in nodes:
+            continue
+        if ready:
+            nodes[id(node)] = len(nodes)
+            words.append(value_index(node.kind))
+            words.append(value_index(node.value))
+            words.append(0 if node.lineno is None else node.lineno + 1)
+            words.append(len(node.children))
+            words.extend(nodes[id(child)] for child in node.children)
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.children)
+
+    values_data = b"".join(blob)
+    padding = b"\0" * (-len(values_data) % 4)
+    header = HEADER.pack(
+        MAGIC, VERSION, 0, tag, len(values), len(nodes), len(values_data)
+    )
+    words = array.array("I", words)
+    if sys.byteorder != "little":
+        words.byteswap()
+    return b"".join([header, values_data, padding, words.tobytes()])
+
+
+def dump(root, path, tag=b""):
+    """Write a tree to a file."""
+    with open(path, "wb") as output:
+        output.write(dumps(root, tag))
+
+
+def __read_header(data):
+    if len(data) < HEADER.size:
+        raise FormatError("File too short.")
+    magic, version, _, tag, *sizes = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise FormatError("Not a tree file.")
+    if version != VERSION:
+        raise FormatError(f"Unsupported version: {version}")
+    return tag, sizes
+
+
+def __decode_str(data, offset):
+    (size,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    return str(data[offset:offset + size], "utf-8"), offset + size
+
+
+def __decode_values(data, count, offset):
+    values = []
+    for _ in range(count):
+        tag = data[offset]
+        offset += 1
+        if tag == NONE:
+            values.append(None)
+        elif tag == INT:
+            values.append(struct.unpack_from("<q", data, offset)[0])
+            offset += 8
+        elif tag == STR:
+            text, offset = __decode_str(data, offset)
+            values.append(text)
+        elif tag == STRINGS:
+            (size,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            items = []
+            for _ in range(size):
+                text, offset = __decode_str(data, offset)
+                items.append(text)
+            values.append(tuple(items))
+        else:
+            raise FormatError(f"Invalid value tag: {tag}")
+    return values
+
+
+def loads(data, new_node=Node):
+    """Decode a tree from a bytes-like object.
+
+    Raise FormatError if the data is truncated or corrupt.
+    """
+    _, (value_count, node_count, values_size) = __read_header(data)
+    offset = HEADER.size + values_size + (-values_size % 4)
+    if offset > len(data) or (len(data) - offset) % 4:
+        raise FormatError("Truncated file.")
+    # Each node takes at least 4 words.
+    if node_count > (len(data) - offset) // 16:
+        raise FormatError("Truncated file.")
+    try:
+        with memoryview(data) as view:
+            with view[:HEADER.size + values_size] as head:
+                values = __decode_values(head, value_count, HEADER.size)
+            if sys.byteorder == "little":
+                with view[offset:].cast("I") as words:
+                    return __decode_nodes(words, node_count, values, new_node)
+            words = array.array("I", view[offset:])
+            words.byteswap()
+            return __decode_nodes(words, node_count, values, new_node)
+    except (IndexError, ValueError, struct.error) as error:
+        raise FormatError(f"Corrupt file: {error}") from error
+
+
+def __decode_nodes(words, count, values, new_node):
+    # Nodes have no reference cycles, so pausing the garbage collector
+    # avoids repeated full collections while the tree grows.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return __build_nodes(words.tolist(), count, values, new_node)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def __build_nodes(words, count, values, new_node):
+    nodes = []
+    position = 0
+    for _ in range(count):
+        kind, value, lineno, size = words[position:position + 4]
+        position += 4
+        if position + size > len(words):
+            raise FormatError("Truncated file.")
+        if size:
+            children = tuple(
+                [nodes[index] for index in words[position:position + size]]
+            )
+            position += size
+        else:
+            children = ()
+        nodes.append(
+            new_node(
+                values[kind],
+                children,
+                values[value],
+                lineno - 1 if lineno else None,
+            )
+        )
+    if not nodes:
+        raise FormatError("Empty tree.")
+    return nodes[-1]
+
+
+def read_tag(path):
+    """Return the tag stored in a tree file."""
+    with open(path, "rb") as source:
+        tag, _ = __read_header(source.read(HEADER.size))
+    return tag.rstrip(b"\0")
+
+
+def load(path, new_node=Node):
+    """Read a tree from a file, using a memory map."""
+    with open(path, "rb") as source:
+        if os.fstat(source.fileno()).st_size == 0:
+            raise FormatError("File too short.")
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return loads(data, new_node)
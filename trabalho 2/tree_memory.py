@@ -0,0 +1,40 @@
+"""Measure memory used by compact, interned and dict syntax trees."""
+
+import sys
+import tracemalloc
+
+from logo_gen import generate_program, generate_repetitive
+from logo_lexer import lexer
+from logo_tree import parser
+from tree import to_dict
+
+
+def measure(build):
+    """Return the result of build(), the memory it retains and its peak."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, after - before, peak - before
+
+
+def report(title, source):
+    """Print memory measurements for one program."""
+    print(f"{title}: {len(source):,} bytes of source")
+    the_parser = parser()
+    program, size, peak = measure(
+        lambda: the_parser.parse(source, lexer=lexer())
+    )
+    print(f"  compact tree: {size:>12,} bytes, peak {peak:>12,} bytes")
+    interning = parser(intern=True)
+    _, size, peak = measure(lambda: interning.parse(source, lexer=lexer()))
+    print(f"  interned:     {size:>12,} bytes, peak {peak:>12,} bytes")
+    _, size, peak = measure(lambda: to_dict(program))
+    print(f"  dict tree:    {size:>12,} bytes, peak {peak:>12,} bytes")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    report("random", generate_program(count))
+    report("repetitive", generate_repetitive(count))